@@ -1,7 +1,7 @@
-from librpg.mapobject import MapObject
-
-class Chest(MapObject):
-    pass
-
-class NPC(MapObject):
-    pass
+from librpg.mapobject import MapObject
+
+class Chest(MapObject):
+    pass
+
+class NPC(MapObject):
+    pass
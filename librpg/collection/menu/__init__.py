@@ -1,3 +1,3 @@
-from itemmenu import ItemMenu
-from partymenu import PartyMenu
-from savemenu import SaveMenu
+from itemmenu import ItemMenu
+from partymenu import PartyMenu
+from savemenu import SaveMenu
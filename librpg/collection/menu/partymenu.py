@@ -1,5 +1,5 @@
-from librpg.menu import Menu
-
-
-class PartyMenu(Menu):
-    pass
+from librpg.menu import Menu
+
+
+class PartyMenu(Menu):
+    pass
@@ -1,347 +1,442 @@
-"""
-The :mod:`config` module provides objects that configure several aspects
-of LibRPG. These objects are in the module scope, so they can be accessed
-as librpg.config.[object]. These object's attributes are used by several
-modules, providing flexibility for LibRPG games.
-
-The global configuration objects are:
-
-    **graphics_config**
-        GraphicsConfig object
-
-    **dialog_config**
-        DialogConfig object
-
-    **game_config**
-        GameConfig object
-
-    **menu_config**
-        MenuConfig object
-"""
-
-from librpg.locals import (K_UP, K_DOWN, K_LEFT, K_RIGHT, K_ESCAPE, K_SPACE,
-                           K_RETURN)
-from librpg.color import transparency, PURPLE, WHITE, RED, GREY
-from librpg import virtualscreen
-
-class Config(object):
-
-    """
-    The Config objects are basically attribute containers with a shortcut
-    to set several attributes at once, the Config.config() method.
-    """
-
-    def __init__(self, late_attributions=None):
-        if late_attributions == None:
-            self.late_attributions = []
-        else:
-            self.late_attributions = late_attributions
-
-    def config(self, **kv):
-        """
-        Whatever keyword parameters are passed to config() will make that
-        attribute be set to the desired value.
-        """
-        scheduled = {}
-
-        for key, value in kv.iteritems():
-            if hasattr(self, key):
-                if key not in self.late_attributions:
-                    setattr(self, key, value)
-                else:
-                    scheduled[key] = value
-            else:
-                raise Exception('config() does not take %s as parameter' % key)
-
-        for key, value in scheduled.iteritems():
-            setattr(self, key, value)
-
-
-class GraphicsConfig(Config):
-
-    """
-    The GraphicsConfig contains attributes related to map and screen
-    rendering.
-
-    :attr:`camera_mode`
-        CameraMode for displaying following the PartyAvatar on the map.
-
-    :attr:`display_mode`
-        Combination of flags that will be used to config the screen. Passed
-        directly to pygame.display.set_mode().
-
-    :attr:`screen_width`
-        Game window width in pixels.
-
-    :attr:`screen_height`
-        Game window height in pixels.
-
-    :attr:`object_width`
-        MapObjects' width in pixels. Does not apply for ScenarioMapObjects.
-
-    :attr:`object_height`
-        MapObjects' height in pixels. Does not apply for ScenarioMapObjects.
-
-    :attr:`tile_size`
-        Tiles' width and height in pixels.
-
-    :attr:`item_icon_width`
-        Item icons' width in pixels.
-
-    :attr:`item_icon_height`
-        Item icons' height in pixels.
-
-    :attr:`scale`
-        Zoom to use when drawing anything on the screen. When 1, it will be
-        drawn in the normal scale, which will look very small for low
-        resolution graphics. Numbers higher than 1 will enlarge the screen
-        while numbers lower than 1 will reduce it. Non-integers MAY be
-        passed.
-
-    :attr:`real_screen_dimensions`
-        2-Tuple with height and width of the actual screen. Read-only.
-
-    :attr:`animation_frame_period`
-        Number of frames after which the next frame of tile animation will
-        be displayed.
-    """
-
-    _screen_width = 400
-    _screen_height = 300
-    _tile_size = 16
-    _object_height = 32
-    _object_width = 24
-    _scale = 2
-    item_icon_width = 32
-    item_icon_height = 32
-    camera_mode = None
-    display_mode = 0
-    animation_frame_period = 15
-    # display_mode = pygame.HWSURFACE | pygame.DOUBLEBUF | pygame.FULLSCREEN
-
-    def __init__(self):
-        Config.__init__(self)
-        self.calc_screen_dimensions()
-        self.calc_object_dimensions()
-        self.calc_map_border_width()
-        self.calc_map_border_height()
-
-    def get_screen_width(self):
-        return self._screen_width
-
-    def set_screen_width(self, new_value):
-        self._screen_width = new_value
-        self.calc_map_border_width()
-        self.calc_screen_dimensions()
-        self.recreate_screeens()
-
-    screen_width = property(get_screen_width, set_screen_width)
-
-    def get_screen_height(self):
-        return self._screen_height
-
-    def set_screen_height(self, new_value):
-        self._screen_height = new_value
-        self.calc_map_border_height()
-        self.calc_screen_dimensions()
-        self.recreate_screeens()
-
-    screen_height = property(get_screen_height, set_screen_height)
-
-    def get_object_width(self):
-        return self._object_width
-
-    def set_object_width(self, new_value):
-        self._object_width = new_value
-        self.calc_object_dimensions()
-
-    object_width = property(get_object_width, set_object_width)
-
-    def get_object_height(self):
-        return self._object_height
-
-    def set_object_height(self, new_value):
-        self._object_height = new_value
-        self.calc_object_dimensions()
-
-    object_height = property(get_object_height, set_object_height)
-
-    def get_tile_size(self):
-        return self._tile_size
-
-    def set_tile_size(self, new_value):
-        self._tile_size = new_value
-
-    tile_size = property(get_tile_size, set_tile_size)
-
-    def get_scale(self):
-        return self._scale
-
-    def set_scale(self, new_value):
-        self._scale = new_value
-        self.recreate_screeens()
-
-    scale = property(get_scale, set_scale)
-
-    def get_real_screen_dimensions(self):
-        return (int(self.screen_dimensions[0] * self.scale),
-                int(self.screen_dimensions[1] * self.scale))
-    real_screen_dimensions = property(get_real_screen_dimensions)
-
-    def calc_screen_dimensions(self):
-        self.screen_dimensions = (self._screen_width, self._screen_height)
-
-    def calc_object_dimensions(self):
-        self.object_dimensions = (self._object_width, self._object_height)
-
-    def calc_map_border_width(self):
-        self.map_border_width = self._screen_width / 2
-
-    def calc_map_border_height(self):
-        self.map_border_height = self._screen_height / 2
-
-    def recreate_screeens(self):
-        virtualscreen.screen_container.create_screen(
-                                                   self.real_screen_dimensions,
-                                                   self.display_mode,
-                                                   self.screen_dimensions,
-                                                   self.scale)
-
-
-class DialogConfig(Config):
-
-    """
-    The DialogConfig contains attributes related to dialog rendering.
-
-    :attr:`font_name`
-        Name of the font or font file to be used in dialogs.
-
-    :attr:`font_size`
-        Size to render the font in dialogs.
-
-    :attr:`border_width`
-        Space in pixels between the screen edge and the text box and
-        between the text box and the text.
-
-    :attr:`line_spacing`
-        Space in pixels between text lines.
-
-    :attr:`choice_line_spacing`
-        Space in pixels between choice text lines.
-
-    :attr:`bg_color`
-        Tuple with the dialog's background colors.
-
-    :attr:`font_color`
-        Tuple with the text font's color.
-
-    :attr:`selected_font_color`
-        Tuple with the text color to use for selected options in a
-        ChoiceDialog.
-
-    :attr:`not_selected_font_color`
-        Tuple with the text color to use for options not selected in a
-        ChoiceDialog.
-    """
-
-    font_name = 'Verdana'
-    font_size = 12
-    border_width = 15
-    line_spacing = 2
-    choice_line_spacing = 2
-    bg_color = transparency(PURPLE, 0.5)
-    font_color = WHITE
-    selected_font_color = RED
-    not_selected_font_color = GREY
-
-
-class GameConfig(Config):
-
-    """
-    The GameConfig contains attributes related to map and menu
-    navigation and execution.
-
-    :attr:`fps`
-        How many frames per second the map will run (at most).
-
-    :attr:`key_up`
-        Set of keys that move the party up.
-
-    :attr:`key_down`
-        Set of keys that move the party down.
-
-    :attr:`key_left`
-        Set of keys that move the party left.
-
-    :attr:`key_right`
-        Set of keys that move the party right.
-
-    :attr:`key_action`
-        Set of keys that activate objects, advance or choose an option.
-
-    :attr:`key_cancel`
-        Set of keys that quit the game, cancel actions, go back.
-
-    :attr:`map_mouse_enabled`
-        Whether the party will be mouse controllable in map.
-    """
-
-    fps = 30
-    key_up = set([K_UP])
-    key_down = set([K_DOWN])
-    key_left = set([K_LEFT])
-    key_right = set([K_RIGHT])
-    key_action = set([K_RETURN, K_SPACE])
-    key_cancel = set([K_ESCAPE])
-    map_mouse_enabled = True
-
-
-class MenuConfig(Config):
-
-    """
-    The MenuConfig contains attributes related to menus.
-
-    :attr:`theme`
-        DefaultMenuTheme to use for menus, except when explicitly specified.
-
-    :attr:`cursor_theme`
-        DefaultMenuTheme to use for Cursors, except when explicitly specified.
-
-    :attr:`font_size`
-        Size to render the font in labels, unless another size is specified.
-    """
-
-    _theme = None
-    _cursor_theme = None
-
-    def set_theme(self, theme):
-        self._theme = theme
-
-    def get_theme(self):
-        if self._theme is None:
-            self._theme = DefaultMenuTheme()
-        return self._theme
-
-    theme = property(get_theme, set_theme)
-
-    def set_cursor_theme(self, theme):
-        self._cursor_theme = theme
-
-    def get_cursor_theme(self):
-        if self._cursor_theme is None:
-            self._cursor_theme = DefaultCursorTheme()
-        return self._cursor_theme
-
-    cursor_theme = property(get_cursor_theme, set_cursor_theme)
-
-    font_size = 12
-
-graphics_config = GraphicsConfig()
-dialog_config = DialogConfig()
-game_config = GameConfig()
-menu_config = MenuConfig()
-
-from librpg.camera import PartyCentricCameraMode as DEFAULT_CAMERA_MODE
-graphics_config.camera_mode = DEFAULT_CAMERA_MODE()
-
-from librpg.menu import DefaultMenuTheme, DefaultCursorTheme
+"""
+The :mod:`config` module provides objects that configure several aspects
+of LibRPG. These objects are in the module scope, so they can be accessed
+as librpg.config.[object]. These object's attributes are used by several
+modules, providing flexibility for LibRPG games.
+
+The global configuration objects are:
+
+    **graphics_config**
+        GraphicsConfig object
+
+    **dialog_config**
+        DialogConfig object
+
+    **game_config**
+        GameConfig object
+
+    **menu_config**
+        MenuConfig object
+"""
+
+from librpg.locals import (K_UP, K_DOWN, K_LEFT, K_RIGHT, K_ESCAPE, K_SPACE,
+                           K_RETURN)
+from librpg.color import transparency, PURPLE, WHITE, RED, GREY
+from librpg import virtualscreen
+
+class Config(object):
+
+    """
+    The Config objects are basically attribute containers with a shortcut
+    to set several attributes at once, the Config.config() method.
+    """
+
+    def __init__(self, late_attributions=None):
+        if late_attributions == None:
+            self.late_attributions = []
+        else:
+            self.late_attributions = late_attributions
+
+    def config(self, **kv):
+        """
+        Whatever keyword parameters are passed to config() will make that
+        attribute be set to the desired value.
+        """
+        scheduled = {}
+
+        for key, value in kv.iteritems():
+            if hasattr(self, key):
+                if key not in self.late_attributions:
+                    setattr(self, key, value)
+                else:
+                    scheduled[key] = value
+            else:
+                raise Exception('config() does not take %s as parameter' % key)
+
+        for key, value in scheduled.iteritems():
+            setattr(self, key, value)
+
+
+class GraphicsConfig(Config):
+
+    """
+    The GraphicsConfig contains attributes related to map and screen
+    rendering.
+
+    :attr:`camera_mode`
+        CameraMode for displaying following the PartyAvatar on the map.
+
+    :attr:`display_mode`
+        Combination of flags that will be used to config the screen. Passed
+        directly to pygame.display.set_mode().
+
+    :attr:`screen_width`
+        Game window width in pixels.
+
+    :attr:`screen_height`
+        Game window height in pixels.
+
+    :attr:`object_width`
+        MapObjects' width in pixels. Does not apply for ScenarioMapObjects.
+
+    :attr:`object_height`
+        MapObjects' height in pixels. Does not apply for ScenarioMapObjects.
+
+    :attr:`tile_size`
+        Tiles' width and height in pixels.
+
+    :attr:`item_icon_width`
+        Item icons' width in pixels.
+
+    :attr:`item_icon_height`
+        Item icons' height in pixels.
+
+    :attr:`scale`
+        Zoom to use when drawing anything on the screen. When 1, it will be
+        drawn in the normal scale, which will look very small for low
+        resolution graphics. Numbers higher than 1 will enlarge the screen
+        while numbers lower than 1 will reduce it. Non-integers MAY be
+        passed.
+
+    :attr:`real_screen_dimensions`
+        2-Tuple with height and width of the actual screen. Read-only.
+
+    :attr:`animation_frame_period`
+        Number of frames after which the next frame of tile animation will
+        be displayed.
+
+    :attr:`map_chunk_size`
+        Width and height, in tiles, of the pieces in which the map
+        background is rendered.
+
+    :attr:`map_chunk_cache_size`
+        Maximum amount of memory, in bytes, that rendered map background
+        pieces may take before the least recently used ones are discarded.
+
+    :attr:`map_view_cache_size`
+        Number of maps whose rendered pieces a World keeps after the
+        party leaves them, so that they are not rendered again if it
+        comes back.
+
+    :attr:`prescale`
+        Whether to scale each image once, the first time it is drawn or
+        when it is loaded, and draw directly at the display resolution,
+        instead of drawing at screen_width x screen_height and scaling
+        the whole screen every frame. Set it before librpg.init().
+
+    :attr:`scale2x`
+        Whether to enlarge the screen with pygame's scale2x filter, which
+        smooths diagonal edges, instead of pygame.transform.scale(), when
+        scale is 2 and prescale is not set. Set it before librpg.init().
+
+    :attr:`dirty_rects`
+        Whether to redraw and update only the regions of the screen that
+        the contexts report as changed, see Context.get_dirty_rects(),
+        instead of the whole screen every frame.
+    """
+
+    _screen_width = 400
+    _screen_height = 300
+    _tile_size = 16
+    _object_height = 32
+    _object_width = 24
+    _scale = 2
+    item_icon_width = 32
+    item_icon_height = 32
+    camera_mode = None
+    display_mode = 0
+    animation_frame_period = 15
+    map_chunk_size = 16
+    map_chunk_cache_size = 32 * 1024 * 1024
+    map_view_cache_size = 2
+    prescale = False
+    scale2x = False
+    dirty_rects = False
+    # display_mode = pygame.HWSURFACE | pygame.DOUBLEBUF | pygame.FULLSCREEN
+
+    def __init__(self):
+        Config.__init__(self)
+        self.calc_screen_dimensions()
+        self.calc_object_dimensions()
+        self.calc_map_border_width()
+        self.calc_map_border_height()
+
+    def get_screen_width(self):
+        return self._screen_width
+
+    def set_screen_width(self, new_value):
+        self._screen_width = new_value
+        self.calc_map_border_width()
+        self.calc_screen_dimensions()
+        self.recreate_screeens()
+
+    screen_width = property(get_screen_width, set_screen_width)
+
+    def get_screen_height(self):
+        return self._screen_height
+
+    def set_screen_height(self, new_value):
+        self._screen_height = new_value
+        self.calc_map_border_height()
+        self.calc_screen_dimensions()
+        self.recreate_screeens()
+
+    screen_height = property(get_screen_height, set_screen_height)
+
+    def get_object_width(self):
+        return self._object_width
+
+    def set_object_width(self, new_value):
+        self._object_width = new_value
+        self.calc_object_dimensions()
+
+    object_width = property(get_object_width, set_object_width)
+
+    def get_object_height(self):
+        return self._object_height
+
+    def set_object_height(self, new_value):
+        self._object_height = new_value
+        self.calc_object_dimensions()
+
+    object_height = property(get_object_height, set_object_height)
+
+    def get_tile_size(self):
+        return self._tile_size
+
+    def set_tile_size(self, new_value):
+        self._tile_size = new_value
+
+    tile_size = property(get_tile_size, set_tile_size)
+
+    def get_scale(self):
+        return self._scale
+
+    def set_scale(self, new_value):
+        self._scale = new_value
+        self.recreate_screeens()
+
+    scale = property(get_scale, set_scale)
+
+    def get_real_screen_dimensions(self):
+        return (int(self.screen_dimensions[0] * self.scale),
+                int(self.screen_dimensions[1] * self.scale))
+    real_screen_dimensions = property(get_real_screen_dimensions)
+
+    def calc_screen_dimensions(self):
+        self.screen_dimensions = (self._screen_width, self._screen_height)
+
+    def calc_object_dimensions(self):
+        self.object_dimensions = (self._object_width, self._object_height)
+
+    def calc_map_border_width(self):
+        self.map_border_width = self._screen_width / 2
+
+    def calc_map_border_height(self):
+        self.map_border_height = self._screen_height / 2
+
+    def recreate_screeens(self):
+        virtualscreen.screen_container.create_screen(
+                                                   self.real_screen_dimensions,
+                                                   self.display_mode,
+                                                   self.screen_dimensions,
+                                                   self.scale,
+                                                   self.prescale,
+                                                   self.scale2x)
+
+
+class DialogConfig(Config):
+
+    """
+    The DialogConfig contains attributes related to dialog rendering.
+
+    :attr:`font_name`
+        Name of the font or font file to be used in dialogs.
+
+    :attr:`font_size`
+        Size to render the font in dialogs.
+
+    :attr:`border_width`
+        Space in pixels between the screen edge and the text box and
+        between the text box and the text.
+
+    :attr:`line_spacing`
+        Space in pixels between text lines.
+
+    :attr:`choice_line_spacing`
+        Space in pixels between choice text lines.
+
+    :attr:`bg_color`
+        Tuple with the dialog's background colors.
+
+    :attr:`font_color`
+        Tuple with the text font's color.
+
+    :attr:`selected_font_color`
+        Tuple with the text color to use for selected options in a
+        ChoiceDialog.
+
+    :attr:`not_selected_font_color`
+        Tuple with the text color to use for options not selected in a
+        ChoiceDialog.
+    """
+
+    font_name = 'Verdana'
+    font_size = 12
+    border_width = 15
+    line_spacing = 2
+    choice_line_spacing = 2
+    bg_color = transparency(PURPLE, 0.5)
+    font_color = WHITE
+    selected_font_color = RED
+    not_selected_font_color = GREY
+
+
+class GameConfig(Config):
+
+    """
+    The GameConfig contains attributes related to map and menu
+    navigation and execution.
+
+    :attr:`fps`
+        How many frames per second the map will run (at most).
+
+    :attr:`key_up`
+        Set of keys that move the party up.
+
+    :attr:`key_down`
+        Set of keys that move the party down.
+
+    :attr:`key_left`
+        Set of keys that move the party left.
+
+    :attr:`key_right`
+        Set of keys that move the party right.
+
+    :attr:`key_action`
+        Set of keys that activate objects, advance or choose an option.
+
+    :attr:`key_cancel`
+        Set of keys that quit the game, cancel actions, go back.
+
+    :attr:`map_mouse_enabled`
+        Whether the party will be mouse controllable in map.
+
+    :attr:`pathfinding_jump_points`
+        Whether paths should be searched with Jump Point Search rather
+        than plain A*.
+
+    :attr:`pathfinding_max_expansions`
+        Maximum number of cells a path search may expand before giving
+        up, or None for no limit.
+
+    :attr:`pathfinding_node_budget`
+        Maximum number of cells expanded by PathMovements' searches per
+        frame, or None for no limit.
+
+    :attr:`pathfinding_time_budget`
+        Maximum time, in microseconds, spent on PathMovements' searches
+        per frame, or None for no limit. If this or
+        pathfinding_node_budget is set, searches are spread over several
+        frames by the map's PathScheduler and objects wait in place for
+        their paths. Otherwise, whole paths are searched at once.
+
+    :attr:`pathfinding_hierarchical`
+        Whether PathMovements should plan their paths with the map's
+        ClusterGraph, which is much faster over long distances but may
+        find slightly longer paths.
+
+    :attr:`pathfinding_cluster_size`
+        Width and height, in tiles, of the clusters a map is split into
+        for hierarchical pathfinding.
+
+    :attr:`prefetch_maps`
+        Whether a World should create the maps the current map's
+        teleports lead to in the background, to have them ready when the
+        party gets there. Off by default, since map constructors then run
+        in another thread and must not touch the screen or the game state.
+
+    :attr:`flow_field_cache_size`
+        Number of flow fields, each towards a different goal cell, that a
+        MapModel keeps before discarding the least recently used.
+
+    :attr:`offscreen_lod_period`
+        If set, map objects farther than offscreen_lod_margin tiles from
+        the camera are only flowed once every this many frames, moving
+        a whole tile at a time, until they come into view again. None
+        flows all of them every frame.
+
+    :attr:`offscreen_lod_margin`
+        Number of tiles around the camera in which map objects are still
+        flowed every frame when offscreen_lod_period is set.
+    """
+
+    fps = 30
+    key_up = set([K_UP])
+    key_down = set([K_DOWN])
+    key_left = set([K_LEFT])
+    key_right = set([K_RIGHT])
+    key_action = set([K_RETURN, K_SPACE])
+    key_cancel = set([K_ESCAPE])
+    map_mouse_enabled = True
+    pathfinding_jump_points = False
+    pathfinding_max_expansions = None
+    pathfinding_node_budget = None
+    pathfinding_time_budget = None
+    pathfinding_hierarchical = False
+    pathfinding_cluster_size = 16
+    flow_field_cache_size = 4
+    prefetch_maps = False
+    offscreen_lod_period = None
+    offscreen_lod_margin = 4
+
+
+class MenuConfig(Config):
+
+    """
+    The MenuConfig contains attributes related to menus.
+
+    :attr:`theme`
+        DefaultMenuTheme to use for menus, except when explicitly specified.
+
+    :attr:`cursor_theme`
+        DefaultMenuTheme to use for Cursors, except when explicitly specified.
+
+    :attr:`font_size`
+        Size to render the font in labels, unless another size is specified.
+    """
+
+    _theme = None
+    _cursor_theme = None
+
+    def set_theme(self, theme):
+        self._theme = theme
+
+    def get_theme(self):
+        if self._theme is None:
+            self._theme = DefaultMenuTheme()
+        return self._theme
+
+    theme = property(get_theme, set_theme)
+
+    def set_cursor_theme(self, theme):
+        self._cursor_theme = theme
+
+    def get_cursor_theme(self):
+        if self._cursor_theme is None:
+            self._cursor_theme = DefaultCursorTheme()
+        return self._cursor_theme
+
+    cursor_theme = property(get_cursor_theme, set_cursor_theme)
+
+    font_size = 12
+
+graphics_config = GraphicsConfig()
+dialog_config = DialogConfig()
+game_config = GameConfig()
+menu_config = MenuConfig()
+
+from librpg.camera import PartyCentricCameraMode as DEFAULT_CAMERA_MODE
+graphics_config.camera_mode = DEFAULT_CAMERA_MODE()
+
+from librpg.menu import DefaultMenuTheme, DefaultCursorTheme
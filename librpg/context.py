@@ -1,300 +1,405 @@
-"""
-The :mod:`context` module is used to allow asynchronous processes running
-concurrently but synchronized with the gameloop.
-
-Two basic classes are defined here, the Context, which represents a
-process, and the ContextStack, which manages Contexts. The module also
-defines a global ContextStack, accessible through the method
-context.get_context_stack().
-"""
-
-import pygame
-
-from librpg.config import game_config
-from librpg.virtualscreen import get_screen
-from librpg.animation import get_metronome
-from librpg.input import Input
-
-
-class ContextStack(object):
-
-    """
-    A ContextStack organizes Contexts in a stack and runs them.
-
-    The stack of Contexts defines the orders of updating, drawing and
-    receiving events. The latter happens from the most recently inserted
-    Contexts to the oldest ones (top-down), which the formers do the
-    opposite (bottom-up).
-
-    :attr:`stack`
-    List representing the Context stack. Do not modify it directly.
-    Instead use the insert_context() and remove_context() methods.
-    """
-
-    def __init__(self):
-        self.stack = []
-
-    def stack_context(self, context):
-        """
-        *context* is inserted as the top Context in the stack, meaning
-        it will be the first to be offered in incoming event, and the last
-        to be updated and drawn.
-
-        This method causes the Context to be initialized.
-        """
-        #print 'stack_context(%s)' % context
-        self.stack.append(context)
-        self.__inserted_context(context)
-
-    def insert_context(self, context, index):
-        """
-        *context* is inserted at the given *index*, pushing the ones above
-        one position upwards.
-
-        This method causes the Context to be initialized.
-        """
-        #print 'insert_context(%s, %d)' % (context, index)
-        self.stack.insert(index, context)
-        self.__inserted_context(context)
-
-    def remove_context(self, context):
-        """
-        Remove *context* from the stack, wherever it is.
-
-        This method causes the Context and all Contexts that were created
-        as its child to be destroyed.
-        """
-        #print 'remove_context(%s)' % context
-        try:
-            self.stack.remove(context)
-        except ValueError:
-            return None
-        self.__destroyed_context(context)
-        return context
-
-    def stop(self):
-        """
-        Once called, the gameloop will stop right after the current
-        iteration.
-        """
-        self.keep_going = False
-
-    def __inserted_context(self, context):
-        context.initialize()
-
-    def __destroyed_context(self, context):
-        context.destroy()
-        for possible_child in self.stack:
-            if possible_child.parent is context:
-                self.remove_context(possible_child)
-
-    def gameloop(self, current=None):
-        """
-        This method transfers the control flow to the ContextStack,
-        which will keep its stacked Contexts running until one of them
-        calls ContextStack.stop() or they are all removed from the
-        ContextStack.
-
-        The ContextStack will cap the cycles/second at game_config.fps.
-        In each cycle, the following will happen:
-
-        1) For each active context in the map, bottom-up:
-            a) The update() method of that Context will be called
-            b) The draw() method of that Context will be drawn
-        2) The screen will be flipped so that the screen receives all the
-           updates at once.
-        3) For each incoming event:
-            a) For each context, top-down:
-                i) The event will be offered to the context.
-                ii) The context will choose to pass down or hold the
-                    event, no matter if it was actually used or not.
-                iii) If the context chose not to pass down, continue to
-                     do 3.
-        4) If anyone called ContextStack.stop() or if there are no
-           Contexts in the stack, stop.
-        """
-        #print 'gameloop(%s)' % current
-        self.keep_going = True
-        self.clock = pygame.time.Clock()
-        while self.stack and self.keep_going:
-            # Limit FPS
-            self.clock.tick(game_config.fps)
-            get_metronome().step()
-
-            Input.update_mouse(pygame.mouse.get_pressed(), pygame.mouse.get_pos())
-            Input.add_events(pygame.event.get())
-        
-            if current is not None:
-                current.update()
-            else:
-                # Update contexts in reverse order
-                stop = False
-                for context in reversed(self.stack):
-                    if context.active:
-                        #print 'updating %s' % context
-                        stop = context.update()
-                    if stop:
-                        break
-
-            # Draw active contexts in normal order
-            for context in self.stack:
-                context.draw()
-                
-            if Input.isset('QUIT'):
-                exit()
-            
-            Input.update()
-
-            # Flip display
-            get_screen().flip()
-
-            if current is not None and current not in self.stack:
-                self.keep_going = False
-#        print 'gameloop ended'
-        self.keep_going = True
-
-    def stack_model(self, model):
-        """
-        Insert the Context created by *model*.create_context() as the
-        top Context of the stack.
-
-        This method causes the Context to be initialized.
-        """
-        context = model.get_controller()
-        self.stack_context(context)
-
-
-class Context(object):
-
-    """
-    A Context is an asynchronous process that will be run
-    concurrently with other processes.
-
-    Contexts may be a variety of features, ranging from information
-    on the screen (life bars, money counters, compasses), custom actions
-    (a button to change the party order, capturing mouse clicks to give
-    information about clicked objects) to menus that run along with the
-    map, allowing them to be used while the party moves.
-    """
-
-    def __init__(self, parent=None):
-        """
-        *Constructor.*
-
-        *parent* should be another Context that, when removed from the
-        stack, will cause this Context to also be removed. Contexts might
-        not have a parent.
-        """
-        self.active = True
-        self.parent = parent
-
-    # Virtual
-    def update(self):
-        """
-        *Virtual.*
-
-        Update the Context for the current iteration.
-
-        This method should do whatever periodic processing the context
-        needs, information updates, etc.
-
-        Return True if the contexts below it should not be updated this
-        cycle, False otherwise. By default, update() returns False.
-        """
-        return False
-
-    # Virtual
-    def initialize(self):
-        """
-        *Virtual.*
-
-        Initialize a context to be run.
-
-        This method will be called when the Context is added to a
-        ContextStack.
-        """
-        pass
-
-    # Virtual
-    def draw(self):
-        """
-        *Virtual.*
-
-        Draw whatever output the Context wants to blit on the screen.
-
-        This method should access the screen by calling
-        virtual_screen.get_screen() and then blit into it. The flip()
-        method should not be called, as the ContextStack will do so after
-        all Contexts are done drawing.
-        """
-        pass
-
-    # Virtual
-    def destroy(self):
-        """
-        *Virtual.*
-
-        Destroy a context that just stopped.
-
-        This method will be called when the Context is removed from a
-        ContextStack. It does not have to actually destroy the Context,
-        but do whatever deinitialization that applies.
-        """
-        pass
-
-    def stop(self):
-        """
-        Stop the Context from running and remove it from its ContextStack.
-        """
-        removed = get_context_stack().remove_context(self)
-        if removed is not None:
-            self.destroy()
-
-
-class Model(object):
-
-    """
-    A Model is an object controlled by a Context. Inheriting from this
-    class allows the model to be stacked onto the ContextStack with the
-    stack_model() method.
-
-    *controller_parent* should be a Context that will be the parent of
-    the Model's controller. If None or not specified, it will not have
-    a parent.
-    """
-
-    def __init__(self, controller_parent=None):
-        self.controller = None
-        self.controller_parent = controller_parent
-
-    def create_controller(self):
-        """
-        *Abstract.*
-
-        Create a controller derived from Context for this model.
-        """
-        raise NotImplementedError('Model.create_controller() is abstract.')
-
-    def get_controller(self):
-        """
-        Return the model's controller, creating with create_controller()
-        it if it has not been created already.
-        """
-        if self.controller is None:
-            self.controller = self.create_controller()
-        return self.controller
-    
-    def sync_open(self):
-        stack = get_context_stack()
-        stack.stack_model(self)
-        stack.gameloop(self.get_controller())
-
-
-context_stack = ContextStack()
-
-
-def get_context_stack():
-    """
-    Return the global ContextStack.
-    """
-    return context_stack
+"""
+The :mod:`context` module is used to allow asynchronous processes running
+concurrently but synchronized with the gameloop.
+
+Two basic classes are defined here, the Context, which represents a
+process, and the ContextStack, which manages Contexts. The module also
+defines a global ContextStack, accessible through the method
+context.get_context_stack().
+"""
+
+import pygame
+
+from librpg.config import game_config, graphics_config
+from librpg.virtualscreen import get_screen
+from librpg.animation import get_metronome
+from librpg.input import Input
+
+
+def merge_rects(rects):
+    """
+    Return a list with the pygame Rects in *rects*, replacing the ones
+    that overlap or touch by their union, so that no two returned Rects
+    overlap or touch. Rows of changed tiles become a single Rect.
+    """
+    merged = []
+    for rect in rects:
+        rect = pygame.Rect(rect)
+        # Inflated by a pixel on each side, so that touching rects collide
+        index = rect.inflate(2, 2).collidelist(merged)
+        while index != -1:
+            rect.union_ip(merged.pop(index))
+            index = rect.inflate(2, 2).collidelist(merged)
+        merged.append(rect)
+    return merged
+
+
+class ContextStack(object):
+
+    """
+    A ContextStack organizes Contexts in a stack and runs them.
+
+    The stack of Contexts defines the orders of updating, drawing and
+    receiving events. The latter happens from the most recently inserted
+    Contexts to the oldest ones (top-down), which the formers do the
+    opposite (bottom-up).
+
+    :attr:`stack`
+    List representing the Context stack. Do not modify it directly.
+    Instead use the insert_context() and remove_context() methods.
+    """
+
+    # Most dirty regions the contexts are drawn for one by one in a frame
+    MAX_DRAWN_RECTS = 2
+
+    def __init__(self):
+        self.stack = []
+        self.stack_changed = True
+
+    def stack_context(self, context):
+        """
+        *context* is inserted as the top Context in the stack, meaning
+        it will be the first to be offered in incoming event, and the last
+        to be updated and drawn.
+
+        This method causes the Context to be initialized.
+        """
+        #print 'stack_context(%s)' % context
+        self.stack.append(context)
+        self.__inserted_context(context)
+
+    def insert_context(self, context, index):
+        """
+        *context* is inserted at the given *index*, pushing the ones above
+        one position upwards.
+
+        This method causes the Context to be initialized.
+        """
+        #print 'insert_context(%s, %d)' % (context, index)
+        self.stack.insert(index, context)
+        self.__inserted_context(context)
+
+    def remove_context(self, context):
+        """
+        Remove *context* from the stack, wherever it is.
+
+        This method causes the Context and all Contexts that were created
+        as its child to be destroyed.
+        """
+        #print 'remove_context(%s)' % context
+        try:
+            self.stack.remove(context)
+        except ValueError:
+            return None
+        self.__destroyed_context(context)
+        return context
+
+    def stop(self):
+        """
+        Once called, the gameloop will stop right after the current
+        iteration.
+        """
+        self.keep_going = False
+
+    def __inserted_context(self, context):
+        self.stack_changed = True
+        context.initialize()
+
+    def __destroyed_context(self, context):
+        self.stack_changed = True
+        context.destroy()
+        for possible_child in self.stack:
+            if possible_child.parent is context:
+                self.remove_context(possible_child)
+
+    def gameloop(self, current=None):
+        """
+        This method transfers the control flow to the ContextStack,
+        which will keep its stacked Contexts running until one of them
+        calls ContextStack.stop() or they are all removed from the
+        ContextStack.
+
+        The ContextStack will cap the cycles/second at game_config.fps.
+        In each cycle, the following will happen:
+
+        1) For each active context in the map, bottom-up:
+            a) The update() method of that Context will be called
+            b) The draw() method of that Context will be drawn
+        2) The screen will be flipped so that the screen receives all the
+           updates at once. If graphics_config.dirty_rects is set, the
+           contexts are only drawn and the screen only flipped in the
+           regions they report through get_dirty_rects(), one region at
+           a time, and only the contexts whose get_area() touches it.
+        3) For each incoming event:
+            a) For each context, top-down:
+                i) The event will be offered to the context.
+                ii) The context will choose to pass down or hold the
+                    event, no matter if it was actually used or not.
+                iii) If the context chose not to pass down, continue to
+                     do 3.
+        4) If anyone called ContextStack.stop() or if there are no
+           Contexts in the stack, stop.
+        """
+        #print 'gameloop(%s)' % current
+        self.keep_going = True
+        self.stack_changed = True
+        self.clock = pygame.time.Clock()
+        while self.stack and self.keep_going:
+            # Limit FPS
+            self.clock.tick(game_config.fps)
+            get_metronome().step()
+
+            Input.update_mouse(pygame.mouse.get_pressed(), pygame.mouse.get_pos())
+            Input.add_events(pygame.event.get())
+        
+            if current is not None:
+                current.update()
+            else:
+                # Update contexts in reverse order
+                stop = False
+                for context in reversed(self.stack):
+                    if context.active:
+                        #print 'updating %s' % context
+                        stop = context.update()
+                    if stop:
+                        break
+
+            # Draw active contexts in normal order
+            if graphics_config.dirty_rects:
+                dirty_rects = self.collect_dirty_rects()
+            else:
+                dirty_rects = None
+            if dirty_rects is None:
+                for context in self.stack:
+                    context.draw()
+            elif dirty_rects:
+                self.draw_rects(dirty_rects)
+                
+            if Input.isset('QUIT'):
+                exit()
+            
+            Input.update()
+
+            # Flip display
+            if dirty_rects is None:
+                get_screen().flip()
+            elif dirty_rects:
+                get_screen().flip(dirty_rects)
+
+            if current is not None and current not in self.stack:
+                self.keep_going = False
+#        print 'gameloop ended'
+        self.keep_going = True
+
+    def collect_dirty_rects(self):
+        """
+        Return a list with the regions of the screen that the contexts in
+        the stack will change when drawn, or None if the whole screen
+        should be drawn. Regions that overlap or touch are merged into
+        one.
+        """
+        if self.stack_changed:
+            self.stack_changed = False
+            return None
+        dirty_rects = []
+        for context in self.stack:
+            rects = context.get_dirty_rects()
+            if rects is None:
+                return None
+            dirty_rects.extend(rects)
+        return merge_rects(dirty_rects)
+
+    def draw_rects(self, rects):
+        """
+        Draw the contexts in the stack with the screen clipped to each of
+        *rects* in turn, skipping the contexts whose area does not
+        intersect the rect.
+
+        Each draw() call does all the work of drawing the context, only
+        clipped, so if there are more than MAX_DRAWN_RECTS rects, the
+        contexts are drawn once, clipped to their union, instead.
+        """
+        if len(rects) > ContextStack.MAX_DRAWN_RECTS:
+            rects = [rects[0].unionall(rects[1:])]
+        screen = get_screen()
+        areas = [context.get_area() for context in self.stack]
+        for rect in rects:
+            screen.set_clip(rect)
+            for context, area in zip(self.stack, areas):
+                if area is None or area.colliderect(rect):
+                    context.draw()
+        screen.set_clip(None)
+
+    def stack_model(self, model):
+        """
+        Insert the Context created by *model*.create_context() as the
+        top Context of the stack.
+
+        This method causes the Context to be initialized.
+        """
+        context = model.get_controller()
+        self.stack_context(context)
+
+
+class Context(object):
+
+    """
+    A Context is an asynchronous process that will be run
+    concurrently with other processes.
+
+    Contexts may be a variety of features, ranging from information
+    on the screen (life bars, money counters, compasses), custom actions
+    (a button to change the party order, capturing mouse clicks to give
+    information about clicked objects) to menus that run along with the
+    map, allowing them to be used while the party moves.
+    """
+
+    def __init__(self, parent=None):
+        """
+        *Constructor.*
+
+        *parent* should be another Context that, when removed from the
+        stack, will cause this Context to also be removed. Contexts might
+        not have a parent.
+        """
+        self.active = True
+        self.parent = parent
+
+    # Virtual
+    def update(self):
+        """
+        *Virtual.*
+
+        Update the Context for the current iteration.
+
+        This method should do whatever periodic processing the context
+        needs, information updates, etc.
+
+        Return True if the contexts below it should not be updated this
+        cycle, False otherwise. By default, update() returns False.
+        """
+        return False
+
+    # Virtual
+    def initialize(self):
+        """
+        *Virtual.*
+
+        Initialize a context to be run.
+
+        This method will be called when the Context is added to a
+        ContextStack.
+        """
+        pass
+
+    # Virtual
+    def draw(self):
+        """
+        *Virtual.*
+
+        Draw whatever output the Context wants to blit on the screen.
+
+        This method should access the screen by calling
+        virtual_screen.get_screen() and then blit into it. The flip()
+        method should not be called, as the ContextStack will do so after
+        all Contexts are done drawing.
+        """
+        pass
+
+    # Virtual
+    def get_dirty_rects(self):
+        """
+        *Virtual.*
+
+        Return a list with the pygame Rects of the screen that the next
+        draw() call will change, or None if it may change anything.
+
+        This is only called if graphics_config.dirty_rects is set, after
+        all the contexts were updated. When no context reports changes,
+        no context is drawn. By default, get_dirty_rects() returns None.
+        """
+        return None
+
+    # Virtual
+    def get_area(self):
+        """
+        *Virtual.*
+
+        Return the pygame Rect of the screen that draw() may change, or
+        None if it may change anything.
+
+        This is only called if graphics_config.dirty_rects is set, to
+        skip drawing the Context for dirty regions outside it. By default,
+        get_area() returns None.
+        """
+        return None
+
+    # Virtual
+    def destroy(self):
+        """
+        *Virtual.*
+
+        Destroy a context that just stopped.
+
+        This method will be called when the Context is removed from a
+        ContextStack. It does not have to actually destroy the Context,
+        but do whatever deinitialization that applies.
+        """
+        pass
+
+    def stop(self):
+        """
+        Stop the Context from running and remove it from its ContextStack.
+        """
+        removed = get_context_stack().remove_context(self)
+        if removed is not None:
+            self.destroy()
+
+
+class Model(object):
+
+    """
+    A Model is an object controlled by a Context. Inheriting from this
+    class allows the model to be stacked onto the ContextStack with the
+    stack_model() method.
+
+    *controller_parent* should be a Context that will be the parent of
+    the Model's controller. If None or not specified, it will not have
+    a parent.
+    """
+
+    def __init__(self, controller_parent=None):
+        self.controller = None
+        self.controller_parent = controller_parent
+
+    def create_controller(self):
+        """
+        *Abstract.*
+
+        Create a controller derived from Context for this model.
+        """
+        raise NotImplementedError('Model.create_controller() is abstract.')
+
+    def get_controller(self):
+        """
+        Return the model's controller, creating with create_controller()
+        it if it has not been created already.
+        """
+        if self.controller is None:
+            self.controller = self.create_controller()
+        return self.controller
+    
+    def sync_open(self):
+        stack = get_context_stack()
+        stack.stack_model(self)
+        stack.gameloop(self.get_controller())
+
+
+context_stack = ContextStack()
+
+
+def get_context_stack():
+    """
+    Return the global ContextStack.
+    """
+    return context_stack
@@ -0,0 +1,696 @@
+"""
+The :mod:`hpa` module contains hierarchical pathfinders for long
+distances: ClusterGraph, which finds paths in big maps by searching an
+abstract graph of the entrances between square clusters of cells, and
+WorldRouter, which chains the maps of a World through their teleport
+areas.
+"""
+
+import heapq
+import hashlib
+import cPickle
+from array import array
+from collections import deque
+
+from librpg.locals import UP, RIGHT, DOWN, LEFT
+from librpg.passability import PassabilityGrid
+from librpg.pathfinding import OPPOSITE
+from librpg.util import Position
+from librpg.config import game_config
+
+
+def encode_path(path):
+    return ''.join([chr(direction) for direction in path])
+
+
+def decode_path(path):
+    return [ord(direction) for direction in path]
+
+
+class ClusterGraph(object):
+
+    """
+    A ClusterGraph splits a PassabilityGrid into square clusters of
+    *cluster_size* cells and links the cells at the borders through which
+    a cluster can be entered or left, its entrances. Long paths are found
+    by searching the graph of entrances and then expanding its edges,
+    whose paths within the clusters are precalculated, so a query touches
+    a few hundred nodes instead of every cell on the way.
+
+    Every connected part of a cluster gets its own entrances on each
+    border stretch it touches, so any position reachable through the
+    tiles is found. The paths found consider the tiles only, not the
+    objects on the map, and may be slightly longer than the shortest
+    ones.
+
+    If *cache_file* is given, the graph is saved to it once built, and
+    loaded from it instead of being built if it matches the grid. When
+    the grid's version changes, only the clusters whose cells changed and
+    their neighbours are linked again.
+
+    :attr:`cluster_size`
+        Width and height of the clusters, in cells.
+
+    :attr:`nodes`
+        Dict mapping the (x, y) coordinates of each cluster to a set with
+        the indexes of its entrance cells.
+
+    :attr:`edges`
+        Dict mapping each entrance cell index to a list of (cell index,
+        cost, encoded path) tuples, one for each entrance it leads to.
+
+    :attr:`expansions`
+        Number of nodes expanded by the last find_path() call.
+    """
+
+    FORMAT = 2
+
+    # Border stretches up to this wide get one entrance in the middle,
+    # wider ones get one at each end.
+    MAX_SINGLE_ENTRANCE = 6
+
+    def __init__(self, grid, cache_file=None, cluster_size=None):
+        if cluster_size is None:
+            cluster_size = game_config.pathfinding_cluster_size
+        self.grid = grid
+        self.cache_file = cache_file
+        self.cluster_size = cluster_size
+        self.clusters_x = (grid.width + cluster_size - 1) / cluster_size
+        self.clusters_y = (grid.height + cluster_size - 1) / cluster_size
+        self.version = None
+        self.cells = None
+        self.nodes = None
+        self.edges = None
+        self.borders = None
+        self.expansions = 0
+
+    def update(self):
+        """
+        Build, load or update the graph if it does not match the grid.
+        """
+        if self.version == self.grid.version:
+            return
+        if self.nodes is None:
+            checksum = hashlib.md5(self.grid.cells.tostring()).hexdigest()
+            if not self.load(checksum):
+                self.build()
+                self.save(checksum)
+        else:
+            self.rebuild(self.__changed_clusters())
+        self.cells = array('B', self.grid.cells)
+        self.version = self.grid.version
+
+    def load(self, checksum):
+        """
+        Load the graph from the cache file, returning whether it was there
+        and matched *checksum*.
+        """
+        if self.cache_file is None:
+            return False
+        try:
+            cache = open(self.cache_file, 'rb')
+            try:
+                data = cPickle.load(cache)
+            finally:
+                cache.close()
+        except (IOError, EOFError, cPickle.UnpicklingError):
+            return False
+        if data.get('format') != ClusterGraph.FORMAT or \
+           data.get('cluster_size') != self.cluster_size or \
+           data.get('checksum') != checksum:
+            return False
+        self.nodes = data['nodes']
+        self.edges = data['edges']
+        self.borders = data['borders']
+        return True
+
+    def save(self, checksum):
+        """
+        Write the graph to the cache file, if there is one and it can be
+        written.
+        """
+        if self.cache_file is None:
+            return
+        data = {'format': ClusterGraph.FORMAT,
+                'cluster_size': self.cluster_size,
+                'checksum': checksum,
+                'nodes': self.nodes,
+                'edges': self.edges,
+                'borders': self.borders}
+        try:
+            cache = open(self.cache_file, 'wb')
+            try:
+                cPickle.dump(data, cache, cPickle.HIGHEST_PROTOCOL)
+            finally:
+                cache.close()
+        except (IOError, OSError):
+            pass
+
+    def build(self):
+        """
+        Find the entrances between the clusters and the paths between the
+        entrances of each cluster.
+        """
+        self.nodes = {}
+        self.edges = {}
+        self.borders = {}
+        for cy in xrange(self.clusters_y):
+            for cx in xrange(self.clusters_x):
+                self.nodes[cx, cy] = set()
+        labels = {}
+        for cy in xrange(self.clusters_y):
+            for cx in xrange(self.clusters_x):
+                if cx + 1 < self.clusters_x:
+                    self.__find_entrances((cx, cy, RIGHT), labels)
+                if cy + 1 < self.clusters_y:
+                    self.__find_entrances((cx, cy, DOWN), labels)
+        for cluster in self.nodes.keys():
+            self.__link_cluster(cluster)
+
+    def rebuild(self, clusters):
+        """
+        Find the entrances on the borders of *clusters*, an iterable of
+        cluster coordinates whose cells changed, and link them and their
+        neighbours again.
+        """
+        borders = set()
+        relinked = set()
+        for cluster in clusters:
+            relinked.add(cluster)
+            for border in self.__borders_of(cluster):
+                borders.add(border)
+                relinked.update(self.__border_clusters(border))
+        for border in borders:
+            self.__clear_border(border)
+        labels = {}
+        for border in borders:
+            self.__find_entrances(border, labels)
+        for cluster in relinked:
+            self.__link_cluster(cluster)
+
+    def __changed_clusters(self):
+        # Compare the grid with the cells the graph was made from, a
+        # cluster wide slice of a row at a time
+        old, new = self.cells, self.grid.cells
+        width, size = self.grid.width, self.cluster_size
+        changed = set()
+        for y in xrange(self.grid.height):
+            row = y * width
+            if old[row:row + width] == new[row:row + width]:
+                continue
+            for cx in xrange(self.clusters_x):
+                left = row + cx * size
+                right = min(left + size, row + width)
+                if old[left:right] != new[left:right]:
+                    changed.add((cx, y / size))
+        return changed
+
+    def __borders_of(self, cluster):
+        # Borders are identified by the cluster on their top or left side
+        # and the direction of the other cluster, RIGHT or DOWN
+        cx, cy = cluster
+        borders = []
+        if cx + 1 < self.clusters_x:
+            borders.append((cx, cy, RIGHT))
+        if cy + 1 < self.clusters_y:
+            borders.append((cx, cy, DOWN))
+        if cx > 0:
+            borders.append((cx - 1, cy, RIGHT))
+        if cy > 0:
+            borders.append((cx, cy - 1, DOWN))
+        return borders
+
+    def __border_clusters(self, border):
+        cx, cy, across = border
+        if across == RIGHT:
+            return (cx, cy), (cx + 1, cy)
+        else:
+            return (cx, cy), (cx, cy + 1)
+
+    def __clear_border(self, border):
+        edges = self.edges
+        for index, other in self.borders.pop(border, []):
+            edges[index] = [edge for edge in edges.get(index, [])
+                            if edge[0] != other]
+            edges[other] = [edge for edge in edges.get(other, [])
+                            if edge[0] != index]
+
+    def __find_entrances(self, border, labels):
+        # Walk along the border, whose cells face the next cluster towards
+        # *across*, and choose entrances in each stretch of cells that can
+        # be crossed, for each pair of connected parts it joins.
+        grid = self.grid
+        size = self.cluster_size
+        cx, cy, across = border
+        if across == RIGHT:
+            x, y, along = (cx + 1) * size - 1, cy * size, DOWN
+            length = min(size, grid.height - y)
+        else:
+            x, y, along = cx * size, (cy + 1) * size - 1, RIGHT
+            length = min(size, grid.width - x)
+        cluster, other_cluster = self.__border_clusters(border)
+        near = self.__labels(cluster, labels)
+        far = self.__labels(other_cluster, labels)
+        offset = grid.offset
+        start = grid.index(x, y)
+        pairs = []
+        stretch = []
+        for i in xrange(length + 1):
+            index = start + i * offset[along]
+            if i < length and grid.can_cross(index, across):
+                stretch.append(index)
+                continue
+            if stretch:
+                parts = {}
+                order = []
+                for index in stretch:
+                    part = (near[index], far[index + offset[across]])
+                    if part not in parts:
+                        parts[part] = []
+                        order.append(part)
+                    parts[part].append(index)
+                for part in order:
+                    cells = parts[part]
+                    if len(cells) <= ClusterGraph.MAX_SINGLE_ENTRANCE:
+                        chosen = [cells[len(cells) / 2]]
+                    else:
+                        chosen = [cells[0], cells[-1]]
+                    for index in chosen:
+                        pairs.append(self.__add_entrance(index, across))
+                stretch = []
+        self.borders[border] = pairs
+
+    def __labels(self, cluster, labels):
+        # Return a dict labelling each cell of *cluster* with the index of
+        # a cell in its connected part, computed once per *labels* dict
+        result = labels.get(cluster)
+        if result is None:
+            result = labels[cluster] = {}
+            left, top, right, bottom = self.__cluster_bounds(cluster)
+            width = self.grid.width
+            for y in xrange(top, bottom):
+                for x in xrange(left, right):
+                    index = y * width + x
+                    if index not in result:
+                        for cell in self.__search_cluster(index, cluster):
+                            result[cell] = index
+        return result
+
+    def __add_entrance(self, index, across):
+        grid = self.grid
+        other = index + grid.offset[across]
+        self.edges.setdefault(index, []).append(
+            (other, 1, encode_path([across])))
+        self.edges.setdefault(other, []).append(
+            (index, 1, encode_path([OPPOSITE[across]])))
+        return index, other
+
+    def __link_cluster(self, cluster):
+        # Find the entrances of *cluster* and the paths between them
+        nodes = set()
+        for border in self.__borders_of(cluster):
+            for pair in self.borders.get(border, []):
+                for index in pair:
+                    if self.cluster_of(index) == cluster:
+                        nodes.add(index)
+        edges = self.edges
+        for node in self.nodes.get(cluster, ()):
+            if node not in nodes:
+                edges.pop(node, None)
+        for node in nodes:
+            # Keep the edges leading out of the cluster
+            kept = [edge for edge in edges.get(node, [])
+                    if self.cluster_of(edge[0]) != cluster]
+            paths = self.__find_paths(node, cluster, nodes)
+            for other, path in paths.iteritems():
+                if other != node:
+                    kept.append((other, len(path), encode_path(path)))
+            edges[node] = kept
+        self.nodes[cluster] = nodes
+
+    def cluster_of(self, index):
+        """
+        Return the (x, y) coordinates of the cluster containing the cell
+        with *index*.
+        """
+        width = self.grid.width
+        return (index % width / self.cluster_size,
+                index / width / self.cluster_size)
+
+    def __cluster_bounds(self, cluster):
+        size = self.cluster_size
+        left, top = cluster[0] * size, cluster[1] * size
+        return (left, top, min(left + size, self.grid.width),
+                min(top + size, self.grid.height))
+
+    def __search_cluster(self, origin, cluster):
+        # Breadth-first search inside *cluster* from the cell *origin*,
+        # returning a dict mapping each cell reached to the (cell,
+        # direction) it was reached from, or None for the origin
+        grid = self.grid
+        width = grid.width
+        cells = grid.cells
+        bit = PassabilityGrid.SIDE_BIT
+        left, top, right, bottom = self.__cluster_bounds(cluster)
+        came_from = {origin: None}
+        queue = deque([origin])
+        while queue:
+            current = queue.popleft()
+            for direction in (UP, RIGHT, DOWN, LEFT):
+                if cells[current] & bit[direction]:
+                    continue
+                neighbour = current + grid.offset[direction]
+                if neighbour in came_from or \
+                   cells[neighbour] & bit[OPPOSITE[direction]]:
+                    continue
+                x, y = neighbour % width, neighbour / width
+                if left <= x < right and top <= y < bottom:
+                    came_from[neighbour] = (current, direction)
+                    queue.append(neighbour)
+        return came_from
+
+    def __find_paths(self, origin, cluster, targets, backwards=False):
+        # Return a dict with the path inside *cluster* between the cell
+        # *origin* and each target reached. If *backwards*, the paths
+        # lead from the targets to the origin instead, which works
+        # because closed sides block crossings both ways.
+        came_from = self.__search_cluster(origin, cluster)
+        paths = {}
+        for target in targets:
+            if target not in came_from:
+                continue
+            path = []
+            index = target
+            while came_from[index] is not None:
+                index, direction = came_from[index]
+                path.append(direction)
+            if backwards:
+                path = [OPPOSITE[direction] for direction in path]
+            else:
+                path.reverse()
+            paths[target] = path
+        return paths
+
+    def find_path(self, start, goal):
+        """
+        Return a list with the directions to follow from the *start*
+        position to the *goal* position, or None if there is no path or
+        *goal* is occupied by an obstacle.
+        """
+        search = ClusterSearch(self, start, goal)
+        path = search.calculate()
+        self.expansions = search.expansions
+        return path
+
+    def start_edges(self, start, goal):
+        """
+        Return a list of (cell index, cost, encoded path) tuples with the
+        edges from the cell with index *start* to the entrances of its
+        cluster, and to the cell with index *goal* if it is in the same
+        cluster.
+        """
+        cluster = self.cluster_of(start)
+        targets = list(self.nodes[cluster])
+        if self.cluster_of(goal) == cluster:
+            targets.append(goal)
+        return [(node, len(path), encode_path(path)) for node, path
+                in self.__find_paths(start, cluster, targets).iteritems()]
+
+    def goal_edges(self, goal):
+        """
+        Return a dict mapping each entrance of the cluster of the cell
+        with index *goal* that leads to it to a (cost, encoded path)
+        tuple.
+        """
+        cluster = self.cluster_of(goal)
+        return dict((node, (len(path), encode_path(path)))
+                    for node, path in self.__find_paths(
+                        goal, cluster, self.nodes[cluster],
+                        backwards=True).iteritems())
+
+
+class ClusterSearch(object):
+
+    """
+    A ClusterSearch looks for a path from the *start* position to the
+    *goal* position on *graph*, a ClusterGraph, as find_path() does.
+
+    Like a PathSearch, it may be run a little at a time, expanding a few
+    entrances per call, so that a PathScheduler can spread it over
+    several frames.
+
+    :attr:`done`
+        Whether the search is over.
+
+    :attr:`result`
+        List with the directions from start to goal, or None if there is
+        no path, once the search is done.
+
+    :attr:`expansions`
+        Number of entrances expanded so far.
+    """
+
+    def __init__(self, graph, start, goal):
+        graph.update()
+        self.graph = graph
+        grid = graph.grid
+        self.width = grid.width
+        self.start = grid.index(start[0], start[1])
+        self.goal = grid.index(goal[0], goal[1])
+        self.expansions = 0
+        self.done = False
+        self.result = None
+        if self.start == self.goal:
+            self.finish([])
+        elif grid.occupied[self.goal]:
+            self.finish(None)
+        else:
+            self.start_edges = graph.start_edges(self.start, self.goal)
+            self.goal_edges = graph.goal_edges(self.goal)
+            h = self.h(self.start)
+            self.g = {self.start: 0}
+            self.came_from = {self.start: None}
+            self.open = [(h, h, 0, self.start)]
+
+    def calculate(self):
+        """
+        Return a list with the directions to follow from start to goal,
+        or None if there is no path.
+        """
+        self.run()
+        return self.result
+
+    def h(self, index):
+        goal = self.goal
+        width = self.width
+        return abs(index % width - goal % width) + \
+               abs(index / width - goal / width)
+
+    def run(self, expansions=None):
+        """
+        Go on with the search, expanding at most *expansions* entrances,
+        or as many as needed if it is None. Return whether the search is
+        over, in which case the path found, or None, is in
+        :attr:`result`.
+        """
+        if self.done:
+            return True
+        open, g, came_from = self.open, self.g, self.came_from
+        edges = self.graph.edges
+        start, goal = self.start, self.goal
+        goal_edges = self.goal_edges
+        heappush, heappop = heapq.heappush, heapq.heappop
+        expanded = 0
+        while open:
+            if expansions is not None and expanded >= expansions:
+                return False
+            _, _, cost, current = heappop(open)
+            if cost > g[current]:
+                continue
+            if current == goal:
+                return self.finish(self.follow(goal))
+            self.expansions += 1
+            expanded += 1
+
+            successors = edges.get(current, [])
+            if current == start:
+                successors = self.start_edges + successors
+            if current in goal_edges:
+                successors = successors + [(goal,) + goal_edges[current]]
+            for successor, distance, path in successors:
+                new_cost = cost + distance
+                if new_cost < g.get(successor, new_cost + 1):
+                    g[successor] = new_cost
+                    came_from[successor] = (current, path)
+                    h = self.h(successor)
+                    heappush(open, (new_cost + h, h, new_cost, successor))
+        return self.finish(None)
+
+    def finish(self, result):
+        self.result = result
+        self.done = True
+        self.open = self.g = self.came_from = None
+        return True
+
+    def follow(self, index):
+        came_from = self.came_from
+        segments = []
+        while came_from[index] is not None:
+            index, path = came_from[index]
+            segments.append(path)
+        segments.reverse()
+        return decode_path(''.join(segments))
+
+
+class WorldRouter(object):
+
+    """
+    A WorldRouter finds routes that go through several maps of a World,
+    chaining them through the areas that teleport the party, such as
+    TeleportArea and RelativeTeleportArea.
+
+    Maps are only known to the router after being passed to learn(),
+    which World does for every map the party enters.
+
+    Routes are found with the ClusterGraph of each map and are not
+    guaranteed to be the shortest ones when an area has many cells.
+
+    :attr:`links`
+        Dict mapping each learned map id to a dict mapping each teleport
+        area of the map to a list of (Position, map id, Position) tuples,
+        with the cells of the area and where they lead to.
+
+    :attr:`targets`
+        Dict mapping each learned map id to a set of (map id, map args)
+        tuples, with the maps its teleport areas lead to and the
+        arguments they are created with.
+
+    :attr:`graphs`
+        Dict mapping each learned map id to its ClusterGraph, once a
+        route through the map was looked for or the map built it for
+        hierarchical pathfinding.
+    """
+
+    def __init__(self):
+        self.links = {}
+        self.targets = {}
+        self.graphs = {}
+        self.grids = {}
+
+    def learn(self, mapmodel):
+        """
+        Record the teleport areas in *mapmodel*, going through the cells
+        of each of its areas, and what its ClusterGraph is made from.
+        """
+        links = {}
+        targets = set()
+        for area in set(mapmodel.areas):
+            for cell in area.area:
+                position = Position(cell[0], cell[1])
+                destination = area.teleport_destination(position)
+                if destination is None:
+                    continue
+                map_id, target = destination
+                if map_id is None:
+                    map_id = mapmodel.id
+                links.setdefault(area, []).append((position, map_id,
+                                                   target))
+                targets.add((map_id,
+                             tuple(getattr(area, 'map_args', ()))))
+        self.links[mapmodel.id] = links
+        self.targets[mapmodel.id] = targets
+
+        # The graph is only built when a route needs it, unless the map
+        # already has it
+        self.graphs.pop(mapmodel.id, None)
+        self.grids[mapmodel.id] = (mapmodel.passability,
+                                   mapmodel.map_file + '.hpa')
+        if mapmodel.cluster_graph is not None:
+            self.graphs[mapmodel.id] = mapmodel.cluster_graph
+
+    def get_graph(self, map_id):
+        """
+        Return the ClusterGraph of the learned map with *map_id*, making
+        it if it was not made yet.
+        """
+        graph = self.graphs.get(map_id)
+        if graph is None:
+            graph = ClusterGraph(*self.grids[map_id])
+            self.graphs[map_id] = graph
+        return graph
+
+    def neighbours(self, map_id):
+        """
+        Return a set with the ids of the maps that can be reached directly
+        from the map with *map_id*.
+        """
+        return set(target_map for area_links in
+                   self.links.get(map_id, {}).itervalues()
+                   for _, target_map, _ in area_links)
+
+    def find_route(self, start_map, start, goal_map, goal):
+        """
+        Return a list of (map id, directions) tuples with the walks from
+        *start* in the map with *start_map* id to *goal* in the map with
+        *goal_map* id, each but the last ending at a teleport area. Return
+        None if no route is known.
+        """
+        if start_map not in self.grids or goal_map not in self.grids:
+            return None
+
+        start_state = (start_map, tuple(start))
+        cost = {start_state: 0}
+        came_from = {start_state: None}
+        open = [(0, start_state)]
+        goal_state = (goal_map, tuple(goal))
+        while open:
+            current_cost, state = heapq.heappop(open)
+            if current_cost > cost[state]:
+                continue
+            if state == goal_state:
+                return self.__follow(came_from, goal_state)
+
+            map_id, position = state
+            for next_state, walk in self.__walks(map_id, position,
+                                                 goal_map, goal):
+                new_cost = current_cost + len(walk)
+                if new_cost < cost.get(next_state, new_cost + 1):
+                    cost[next_state] = new_cost
+                    came_from[next_state] = (state, map_id, walk)
+                    heapq.heappush(open, (new_cost, next_state))
+        return None
+
+    def __walks(self, map_id, position, goal_map, goal):
+        graph = self.get_graph(map_id)
+        if map_id == goal_map:
+            walk = graph.find_path(position, goal)
+            if walk is not None:
+                yield (goal_map, tuple(goal)), walk
+
+        for area_links in self.links[map_id].itervalues():
+            # Only the reachable cell of each area that looks closest is
+            # walked to.
+            def estimate(link):
+                source, target_map, target = link
+                distance = (abs(source[0] - position[0]) +
+                            abs(source[1] - position[1]))
+                if target_map == goal_map:
+                    distance += (abs(target[0] - goal[0]) +
+                                 abs(target[1] - goal[1]))
+                return distance
+            for source, target_map, target in sorted(area_links,
+                                                     key=estimate):
+                if target_map not in self.grids:
+                    continue
+                walk = graph.find_path(position, source)
+                if walk is not None:
+                    yield (target_map, tuple(target)), walk
+                    break
+
+    def __follow(self, came_from, state):
+        legs = []
+        while came_from[state] is not None:
+            state, map_id, walk = came_from[state]
+            legs.append((map_id, walk))
+        legs.reverse()
+        return legs
@@ -1,276 +1,586 @@
-"""
-The :mod:`image` module contains the Image class, a wrapper for
-pygame Surfaces, which is used by several other modules.
-
-Specialized images for tiles, map objects are also provided in this
-module, as well as the SlicedImage class, which is an Image divisible
-in pieces of the same size.
-"""
-
-import pygame
-
-from librpg.locals import (UP, RIGHT, DOWN, LEFT,
-                           DEFAULT_OBJECT_IMAGE_BASIC_ANIMATION,
-                           SPEEDS, NORMAL_SPEED)
-from librpg.config import graphics_config
-
-
-class Image(object):
-
-    """
-    A simple static image.
-
-    This is the base class for more complex and animated images.
-    """
-
-    def __init__(self, surface):
-        """
-        *Constructor.*
-
-        Pass the *surface* that will be stored in the image. Note
-        that the surface is not copied, which means it should not be
-        altered after being passed to this class.
-
-        :attr:`surface`
-            Pygame Surface containing the image.
-        """
-        self.surface = surface
-        self.height = surface.get_height()
-        self.width = surface.get_width()
-
-    def get_surface(self, obj=None):
-        """
-        *Virtual.*
-
-        Return a surface with how the image is to be rendered at the
-        moment.
-        """
-        return self.surface
-
-    def get_width(self):
-        return self._width
-
-    def set_width(self, width):
-        self._width = width
-
-    width = property(get_width, set_width)
-    """
-    Image width in pixels.
-    """
-
-    def get_height(self):
-        return self._height
-
-    def set_height(self, height):
-        self._height = height
-
-    height = property(get_height, set_height)
-    """
-    Image height in pixels.
-    """
-
-
-class TileImage(Image):
-
-    """
-    A scenario or terrain tile image.
-
-    This class represents a Tile image, which will include simple
-    animation cycles in the future. For now it is just a static image.
-    """
-
-    def __init__(self, surfaces):
-        Image.__init__(self, surfaces[0])
-        self.surfaces = surfaces
-        self.phases = len(surfaces)
-
-    def get_surface(self, obj=None, animation_phase=0):
-        """
-        *Virtual.*
-
-        Return a surface with how the tile is to be rendered at the
-        moment.
-        """
-        return self.surfaces[animation_phase % self.phases]
-
-
-class ObjectImage(Image):
-
-    """
-    A MapObject image.
-
-    This class represents a MapObject image, which may include simple
-    animation cycles and movement animation.
-    """
-
-    DIRECTION_TO_INDEX_MAP = {UP: 0, RIGHT: 1, DOWN: 2, LEFT: 3}
-
-    def __init__(self, filename, index=0,
-                 basic_animation=DEFAULT_OBJECT_IMAGE_BASIC_ANIMATION,
-                 frame_number=None):
-        """
-        *Constructor.*
-
-        The frames will be loaded from *filename*, which should be a
-        map object image file - a bitmap with a special format for the
-        frames. Since there can be more than one map object image in
-        the file, which of them should be loaded is specified by the
-        *index* parameter.
-
-        The image's animation is described by *basic_animation*.
-        The animation of an object during a step is described by a list
-        of the ids of the frames to be shown. *basic_animation*
-        should be a list of these lists with the order in which these
-        animations will represent a step.
-
-        The default animation map is [[1, 2], [1, 0]], which means that
-        every other step will be animated with [1, 2] and the others
-        with [1, 0]. [1, 2] means half of the frames will show frame[2]
-        then the other half will show frame[1]. [1, 0] is analogous.
-        This default animation will cause the object to take each step
-        with a leg, provided 0 and 2 are frames of it walking with
-        opposite legs and 1 is a frame of it standing.
-
-        The frame number, important to slice correctly the image file
-        into object images, is determined automatically by looking at the
-        highest number in the animation map. If there are frames beyond
-        that number, that is, not all of them are used, *frame_number*
-        should be passed.
-        """
-        # Calculate frame count
-        if frame_number is None:
-            self.frame_number = max([max(i) for i in basic_animation]) + 1
-        else:
-            self.frame_number = frame_number
-
-        # Load file
-        file_surface = pygame.image.load(filename)
-        chunk_width = self.frame_number * graphics_config.object_width
-        chunk_height = 4 * graphics_config.object_height
-        sliced_file = SlicedImage(file_surface, chunk_width, chunk_height)
-        Image.__init__(self, sliced_file.get_slice(index))
-
-        # Create a sprite matrix [facing x frame]
-        sliced_image = SlicedImage(self.surface,
-                                   graphics_config.object_width,
-                                   graphics_config.object_height)
-        self.frames = []
-        for facing in [UP, RIGHT, DOWN, LEFT]:
-            y = ObjectImage.DIRECTION_TO_INDEX_MAP[facing]
-            phases = []
-            self.frames.append(phases)
-            for x in range(self.frame_number):
-                phases.append(sliced_image.get_slice_xy(x, y))
-
-        self.width = graphics_config.object_width
-        self.height = graphics_config.object_height
-
-        # Build animation maps
-        self.basic_animation = basic_animation
-        self.animation_maps = [(dict((speed,
-                                      [animation[(phase * len(animation))
-                                       / speed] for phase in range(speed)])
-                                      for speed in SPEEDS))
-                                for animation in basic_animation]
-        self.current_animation = 0
-        self.last_observed_movement_phase = 0
-
-    def get_surface(self, obj=None, facing=None, phase=None):
-        assert obj is not None or (facing is not None and phase is not None),\
-                ('get_surface() must be called with either `obj` or (`facing` '
-                 'AND `phase`) parameters set')
-
-        if obj is not None:
-            if obj.sliding:
-                di = ObjectImage.DIRECTION_TO_INDEX_MAP[obj.facing]
-                return self.frames[di][1]
-            else:
-                self.next_animation(obj)
-                di = ObjectImage.DIRECTION_TO_INDEX_MAP[obj.facing]
-                am = self.animation_maps[self.current_animation]
-                return self.frames[di][am[obj.speed][obj.movement_phase]]
-        else:
-            di = ObjectImage.DIRECTION_TO_INDEX_MAP[facing]
-            am = self.animation_maps[self.current_animation]
-            return self.frames[di][am[NORMAL_SPEED][phase]]
-
-    def next_animation(self, obj):
-        if obj.movement_phase > self.last_observed_movement_phase:
-            self.current_animation = (self.current_animation + 1) \
-                                     % len(self.basic_animation)
-        self.last_observed_movement_phase = obj.movement_phase
-
-
-class SlicedImage(Image):
-
-    """
-    An image that can be sliced in pieces of the same size.
-
-    Useful for easily loading images that are all bundled in a single
-    file, such as tilesets and object images.
-    """
-
-    def __init__(self, surface, slice_width, slice_height):
-        """
-        *Constructor.*
-
-        *surface* should be the Pygame surface with the pre-loaded
-        image. *slice_width* and *slice_height* specify the size of
-        each part of the image in pixels.
-
-        :attr:`slice_width`
-            Width of each slice in pixels.
-
-        :attr:`slice_height`
-            Height of each slice in pixels.
-
-        :attr:`width_in_slices`
-            Width of the surface, in slices.
-
-        :attr:`slice_height`
-            Height of the surface, in slices.
-
-        :attr:`amount_of_slices`
-            Total number of slices in which the image was divided.
-        """
-        assert slice_width <= surface.get_width() \
-               and slice_height <= surface.get_height(), \
-               'The slice should not be bigger than whole the image.'
-        Image.__init__(self, surface)
-        self.slice_width = slice_width
-        self.slice_height = slice_height
-        self.width_in_slices = self.width / self.slice_width
-        self.height_in_slices = self.height / self.slice_height
-        self.amount_of_slices = self.width_in_slices * self.height_in_slices
-
-    def get_slice(self, index):
-        """
-        Return a subsurface indexed by *index*, given in slices.
-
-        *index* starts at 0 (the topmost and leftmost slice), and
-        grows to the left, then when the line ends, down. For example:
-        0  1  2  3
-        4  5  6  7
-        8  9 10 11
-        """
-        assert index >= 0 and index < self.amount_of_slices, \
-               'index=%d has to be in [0, slices=%d)' \
-               % (index, self.amount_of_slices)
-        x = index % self.width_in_slices
-        y = index / self.width_in_slices
-        return self.get_slice_xy(x, y)
-
-    def get_slice_xy(self, x, y):
-        """
-        Return a subsurface located at (x, y), given in slices.
-        """
-        assert 0 <= x and x < self.width_in_slices, \
-               'x=%d has to be in [0, width_in_slices=%d)' \
-               % (x, self.width_in_slices)
-        assert 0 <= y and y < self.height_in_slices, \
-               'y=%d has to be in [0, height_in_slices=%d)' \
-               % (y, self.height_in_slices)
-        r = pygame.Rect((x * self.slice_width, y * self.slice_height),
-                        (self.slice_width, self.slice_height))
-        result = self.surface.subsurface(r)
-        return result
+"""
+The :mod:`image` module contains the Image class, a wrapper for
+pygame Surfaces, which is used by several other modules.
+
+Specialized images for tiles, map objects are also provided in this
+module, as well as the SlicedImage class, which is an Image divisible
+in pieces of the same size.
+
+Image files should be loaded with load_image(), which converts them to
+the screen's pixel format and shares them between their users. Sprites
+that are blitted often are packed by the texture_atlas into a few large
+surfaces.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+import pygame
+
+from librpg.locals import (UP, RIGHT, DOWN, LEFT, SRCALPHA, BLEND_RGBA_MAX,
+                           DEFAULT_OBJECT_IMAGE_BASIC_ANIMATION,
+                           SPEEDS, NORMAL_SPEED)
+from librpg.config import graphics_config
+from librpg.virtualscreen import prescale, invalidate
+from librpg.loader import (TimestampedFileLoader, TemporalCache,
+                           resource_memory)
+
+
+def convert_surface(surface):
+    """
+    Return *surface* converted to the pixel format of the screen, with
+    per-pixel alpha if it has it, so that blitting it onto the screen
+    needs no conversion. Colorkeys and surface alpha are kept.
+
+    If the screen was not created yet, *surface* is returned as is.
+    """
+    if not pygame.display.get_init() or pygame.display.get_surface() is None:
+        return surface
+    if surface.get_flags() & SRCALPHA:
+        return surface.convert_alpha()
+    else:
+        return surface.convert()
+
+
+class SurfaceLoader(TimestampedFileLoader):
+
+    """
+    Loads image files with pygame.image.load() and convert_surface(),
+    keeping the surfaces of the *capacity* most recently used files, up
+    to *memory_budget* bytes.
+    """
+
+    def __init__(self, capacity=64, memory_budget=32 * 1024 * 1024):
+        TimestampedFileLoader.__init__(self, [TemporalCache(capacity,
+                                                            memory_budget)])
+
+    def load_files(self, filename):
+        return convert_surface(pygame.image.load(filename))
+
+surface_loader = SurfaceLoader()
+
+
+def load_image(filename):
+    """
+    Return a Surface with the image in *filename*, converted to the
+    screen's format by convert_surface().
+
+    The surface is shared with the others who loaded the same file, so
+    it should not be altered. Slice it or copy it instead.
+    """
+    return surface_loader.load(filename)
+
+
+class Image(object):
+
+    """
+    A simple static image.
+
+    This is the base class for more complex and animated images.
+    """
+
+    def __init__(self, surface):
+        """
+        *Constructor.*
+
+        Pass the *surface* that will be stored in the image. Note
+        that the surface is not copied, which means it should not be
+        altered after being passed to this class.
+
+        :attr:`surface`
+            Pygame Surface containing the image.
+        """
+        self.surface = surface
+        self.height = surface.get_height()
+        self.width = surface.get_width()
+
+    def get_surface(self, obj=None):
+        """
+        *Virtual.*
+
+        Return a surface with how the image is to be rendered at the
+        moment.
+        """
+        return self.surface
+
+    def get_sprite(self, obj=None):
+        """
+        *Virtual.*
+
+        Return a (surface, area) tuple with how the image is to be
+        rendered at the moment, where area is the Rect of *surface* to
+        blit, or None for all of it.
+        """
+        if obj is None:
+            return self.get_surface(), None
+        else:
+            return self.get_surface(obj), None
+
+    def get_width(self):
+        return self._width
+
+    def set_width(self, width):
+        self._width = width
+
+    width = property(get_width, set_width)
+    """
+    Image width in pixels.
+    """
+
+    def get_height(self):
+        return self._height
+
+    def set_height(self, height):
+        self._height = height
+
+    height = property(get_height, set_height)
+    """
+    Image height in pixels.
+    """
+
+
+class TileImage(Image):
+
+    """
+    A scenario or terrain tile image.
+
+    This class represents a Tile image, which will include simple
+    animation cycles in the future. For now it is just a static image.
+    """
+
+    def __init__(self, surfaces):
+        Image.__init__(self, surfaces[0])
+        self.surfaces = surfaces
+        self.phases = len(surfaces)
+
+    def get_surface(self, obj=None, animation_phase=0):
+        """
+        *Virtual.*
+
+        Return a surface with how the tile is to be rendered at the
+        moment.
+        """
+        return self.surfaces[animation_phase % self.phases]
+
+
+class ObjectImage(Image):
+
+    """
+    A MapObject image.
+
+    This class represents a MapObject image, which may include simple
+    animation cycles and movement animation.
+    """
+
+    DIRECTION_TO_INDEX_MAP = {UP: 0, RIGHT: 1, DOWN: 2, LEFT: 3}
+
+    def __init__(self, filename, index=0,
+                 basic_animation=DEFAULT_OBJECT_IMAGE_BASIC_ANIMATION,
+                 frame_number=None):
+        """
+        *Constructor.*
+
+        The frames will be loaded from *filename*, which should be a
+        map object image file - a bitmap with a special format for the
+        frames. Since there can be more than one map object image in
+        the file, which of them should be loaded is specified by the
+        *index* parameter.
+
+        The image's animation is described by *basic_animation*.
+        The animation of an object during a step is described by a list
+        of the ids of the frames to be shown. *basic_animation*
+        should be a list of these lists with the order in which these
+        animations will represent a step.
+
+        The default animation map is [[1, 2], [1, 0]], which means that
+        every other step will be animated with [1, 2] and the others
+        with [1, 0]. [1, 2] means half of the frames will show frame[2]
+        then the other half will show frame[1]. [1, 0] is analogous.
+        This default animation will cause the object to take each step
+        with a leg, provided 0 and 2 are frames of it walking with
+        opposite legs and 1 is a frame of it standing.
+
+        The frame number, important to slice correctly the image file
+        into object images, is determined automatically by looking at the
+        highest number in the animation map. If there are frames beyond
+        that number, that is, not all of them are used, *frame_number*
+        should be passed.
+        """
+        # Calculate frame count
+        if frame_number is None:
+            self.frame_number = max([max(i) for i in basic_animation]) + 1
+        else:
+            self.frame_number = frame_number
+
+        # Load file into the atlas, shared with other images of it
+        width = graphics_config.object_width
+        height = graphics_config.object_height
+        self.page, rect = texture_atlas.load(filename,
+                                             self.frame_number * width,
+                                             4 * height, index)
+        Image.__init__(self, self.page.subsurface(rect))
+
+        # Create sprite matrices [facing x frame] with the frame surfaces
+        # and their rects in the atlas page
+        self.frames = []
+        self.frame_rects = []
+        for facing in [UP, RIGHT, DOWN, LEFT]:
+            y = ObjectImage.DIRECTION_TO_INDEX_MAP[facing]
+            phases = []
+            rects = []
+            self.frames.append(phases)
+            self.frame_rects.append(rects)
+            for x in range(self.frame_number):
+                frame_rect = pygame.Rect(rect.left + x * width,
+                                         rect.top + y * height,
+                                         width, height)
+                rects.append(frame_rect)
+                phases.append(self.page.subsurface(frame_rect))
+
+        self.width = width
+        self.height = height
+
+        # Build animation maps
+        self.basic_animation = basic_animation
+        self.animation_maps = [(dict((speed,
+                                      [animation[(phase * len(animation))
+                                       / speed] for phase in range(speed)])
+                                      for speed in SPEEDS))
+                                for animation in basic_animation]
+        self.current_animation = 0
+        self.last_observed_movement_phase = 0
+
+    def get_surface(self, obj=None, facing=None, phase=None):
+        di, frame = self.calc_frame(obj, facing, phase)
+        return self.frames[di][frame]
+
+    def get_sprite(self, obj=None, facing=None, phase=None):
+        di, frame = self.calc_frame(obj, facing, phase)
+        return self.page, self.frame_rects[di][frame]
+
+    def calc_frame(self, obj=None, facing=None, phase=None):
+        """
+        Return a (direction index, frame) tuple with the frame to be
+        rendered for *obj*, or for *facing* and *phase*.
+        """
+        assert obj is not None or (facing is not None and phase is not None),\
+                ('get_surface() must be called with either `obj` or (`facing` '
+                 'AND `phase`) parameters set')
+
+        if obj is not None:
+            if obj.sliding:
+                di = ObjectImage.DIRECTION_TO_INDEX_MAP[obj.facing]
+                return di, 1
+            else:
+                self.next_animation(obj)
+                di = ObjectImage.DIRECTION_TO_INDEX_MAP[obj.facing]
+                am = self.animation_maps[self.current_animation]
+                return di, am[obj.speed][obj.movement_phase]
+        else:
+            di = ObjectImage.DIRECTION_TO_INDEX_MAP[facing]
+            am = self.animation_maps[self.current_animation]
+            return di, am[NORMAL_SPEED][phase]
+
+    def next_animation(self, obj):
+        if obj.movement_phase > self.last_observed_movement_phase:
+            self.current_animation = (self.current_animation + 1) \
+                                     % len(self.basic_animation)
+        self.last_observed_movement_phase = obj.movement_phase
+
+
+class SlicedImage(Image):
+
+    """
+    An image that can be sliced in pieces of the same size.
+
+    Useful for easily loading images that are all bundled in a single
+    file, such as tilesets and object images.
+    """
+
+    def __init__(self, surface, slice_width, slice_height):
+        """
+        *Constructor.*
+
+        *surface* should be the Pygame surface with the pre-loaded
+        image. *slice_width* and *slice_height* specify the size of
+        each part of the image in pixels.
+
+        :attr:`slice_width`
+            Width of each slice in pixels.
+
+        :attr:`slice_height`
+            Height of each slice in pixels.
+
+        :attr:`width_in_slices`
+            Width of the surface, in slices.
+
+        :attr:`slice_height`
+            Height of the surface, in slices.
+
+        :attr:`amount_of_slices`
+            Total number of slices in which the image was divided.
+        """
+        assert slice_width <= surface.get_width() \
+               and slice_height <= surface.get_height(), \
+               'The slice should not be bigger than whole the image.'
+        Image.__init__(self, surface)
+        self.slice_width = slice_width
+        self.slice_height = slice_height
+        self.width_in_slices = self.width / self.slice_width
+        self.height_in_slices = self.height / self.slice_height
+        self.amount_of_slices = self.width_in_slices * self.height_in_slices
+
+    def get_slice(self, index):
+        """
+        Return a subsurface indexed by *index*, given in slices.
+
+        *index* starts at 0 (the topmost and leftmost slice), and
+        grows to the left, then when the line ends, down. For example:
+        0  1  2  3
+        4  5  6  7
+        8  9 10 11
+        """
+        assert index >= 0 and index < self.amount_of_slices, \
+               'index=%d has to be in [0, slices=%d)' \
+               % (index, self.amount_of_slices)
+        x = index % self.width_in_slices
+        y = index / self.width_in_slices
+        return self.get_slice_xy(x, y)
+
+    def get_slice_xy(self, x, y):
+        """
+        Return a subsurface located at (x, y), given in slices.
+        """
+        assert 0 <= x and x < self.width_in_slices, \
+               'x=%d has to be in [0, width_in_slices=%d)' \
+               % (x, self.width_in_slices)
+        assert 0 <= y and y < self.height_in_slices, \
+               'y=%d has to be in [0, height_in_slices=%d)' \
+               % (y, self.height_in_slices)
+        r = pygame.Rect((x * self.slice_width, y * self.slice_height),
+                        (self.slice_width, self.slice_height))
+        result = self.surface.subsurface(r)
+        return result
+
+
+class AtlasImage(Image):
+
+    """
+    A static image stored in the *rect* area of *page*, an atlas page
+    surface as returned by TextureAtlas.load().
+
+    :attr:`page`
+        Atlas page Surface containing the image.
+
+    :attr:`rect`
+        Rect of the image in the page.
+    """
+
+    def __init__(self, page, rect):
+        Image.__init__(self, page.subsurface(rect))
+        self.page = page
+        self.rect = rect
+
+    def get_sprite(self, obj=None):
+        return self.page, self.rect
+
+
+class AtlasPage(object):
+
+    """
+    One surface of a TextureAtlas, *width* x *height* pixels with
+    per-pixel alpha, into which images are packed in shelves: rows as
+    tall as the first image put in them, filled left to right.
+
+    If the screen is a PrescaledScreen, the page is scaled when it is
+    created, and each image added to it is scaled into that copy, so
+    that the page is never scaled as a whole while it is drawn.
+
+    :attr:`keys`
+        List with the keys of the images packed by a TextureAtlas into
+        the page.
+    """
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.surface = convert_surface(pygame.Surface((width, height),
+                                                      SRCALPHA, 32))
+        self.shelves = []
+        self.bottom = 0
+        self.keys = []
+        prescale(self.surface)
+
+    def add(self, surface):
+        """
+        Copy *surface* into the page and return its Rect there, or None
+        if it does not fit.
+        """
+        width, height = surface.get_size()
+        if width > self.width:
+            return None
+
+        # Use the lowest shelf with room for it, or start a new one
+        best = None
+        for shelf in self.shelves:
+            top, shelf_height, used = shelf
+            if height <= shelf_height and used + width <= self.width and \
+               (best is None or shelf_height < best[1]):
+                best = shelf
+        if best is None:
+            if self.bottom + height > self.height:
+                return None
+            best = [self.bottom, height, 0]
+            self.shelves.append(best)
+            self.bottom += height
+
+        rect = pygame.Rect(best[2], best[0], width, height)
+        best[2] += width
+        if surface.get_flags() & SRCALPHA:
+            # The page is transparent black, so this copies the pixels
+            # with their alpha instead of blending them
+            self.surface.blit(surface, rect, None, BLEND_RGBA_MAX)
+        else:
+            self.surface.blit(surface, rect)
+        invalidate(self.surface, rect)
+        return rect
+
+    def get_memory(self):
+        return resource_memory(self.surface)
+
+
+class TextureAtlas(object):
+
+    """
+    A TextureAtlas packs images into a few large AtlasPages, so that the
+    sprites drawn every frame come from a handful of converted surfaces
+    and are blitted by area instead of each being a separate surface.
+
+    Images are identified by the file and slice they come from, and are
+    only loaded and packed the first time they are asked for.
+
+    Pages are *page_size* x *page_size* pixels, except for those made
+    for images larger than that, which are exactly their size. When the
+    pages take more than *memory_budget* bytes, the least recently used
+    ones are discarded, and their images will be loaded and packed again
+    if they are asked for. Images already handed out keep working, since
+    they hold their page.
+
+    :attr:`memory`
+        Bytes taken by the pages kept.
+
+    :attr:`hits`
+        Number of load() calls that found the image already packed.
+
+    :attr:`misses`
+        Number of load() calls that had to load and pack the image.
+
+    :attr:`evictions`
+        Number of pages discarded to respect the budget.
+    """
+
+    PAGE_SIZE = 1024
+
+    def __init__(self, page_size=None, memory_budget=32 * 1024 * 1024):
+        if page_size is None:
+            page_size = TextureAtlas.PAGE_SIZE
+        self.page_size = page_size
+        self.memory_budget = memory_budget
+        self.memory = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.pages = OrderedDict()
+        self.sprites = {}
+        self.lock = threading.RLock()
+
+    def add(self, surface, key=None):
+        """
+        Copy *surface* into a page and return a (page surface, rect)
+        tuple with where it was put. If *key* is passed, the image can be
+        found with it in :attr:`sprites` until its page is discarded.
+        """
+        with self.lock:
+            for page in self.pages:
+                rect = page.add(surface)
+                if rect is not None:
+                    break
+            else:
+                width, height = surface.get_size()
+                page = AtlasPage(max(width, self.page_size),
+                                 max(height, self.page_size))
+                self.pages[page] = None
+                self.memory += page.get_memory()
+                rect = page.add(surface)
+            if key is not None:
+                page.keys.append(key)
+                self.sprites[key] = (page, rect)
+            self.touch(page)
+            while len(self.pages) > 1 and \
+                  self.memory_budget is not None and \
+                  self.memory > self.memory_budget:
+                self.discard_page(iter(self.pages).next())
+                self.evictions += 1
+            return page.surface, rect
+
+    def load(self, filename, slice_width=None, slice_height=None, index=0):
+        """
+        Return a (page surface, rect) tuple with the image in *filename*,
+        loaded with load_image() and packed if it was not before.
+
+        If *slice_width* and *slice_height* are passed, only the slice
+        with *index* is used, as given by SlicedImage.get_slice().
+        """
+        key = (os.path.abspath(filename), slice_width, slice_height, index)
+        with self.lock:
+            sprite = self.sprites.get(key)
+            if sprite is not None:
+                self.hits += 1
+                page, rect = sprite
+                self.touch(page)
+                return page.surface, rect
+            self.misses += 1
+            surface = load_image(filename)
+            if slice_width is not None:
+                surface = SlicedImage(surface, slice_width,
+                                      slice_height).get_slice(index)
+            return self.add(surface, key)
+
+    def touch(self, page):
+        """
+        Mark *page* as the most recently used.
+        """
+        del self.pages[page]
+        self.pages[page] = None
+
+    def discard_page(self, page):
+        """
+        Forget *page* and the images in it, and drop its scaled copy.
+        """
+        del self.pages[page]
+        self.memory -= page.get_memory()
+        for key in page.keys:
+            del self.sprites[key]
+        invalidate(page.surface)
+
+    def clear(self):
+        """
+        Forget all pages and images, so that they are loaded again. Images
+        already handed out keep working.
+        """
+        with self.lock:
+            for page in list(self.pages):
+                self.discard_page(page)
+
+    def get_stats(self):
+        """
+        Return a dict with the atlas' 'hits', 'misses', 'evictions',
+        'pages' and 'memory', like Loader.get_stats().
+        """
+        with self.lock:
+            return {'hits': self.hits, 'misses': self.misses,
+                    'evictions': self.evictions, 'pages': len(self.pages),
+                    'memory': self.memory}
+
+texture_atlas = TextureAtlas()
@@ -1,113 +1,648 @@
-import os
-
-
-class Cache:
-
-    """
-    """
-
-    def get(self, name):
-        """
-        Return a pre-loaded resource loaded from *name* or None if
-        that resource is not pre-loaded.
-        """
-        return None
-
-    def update_used(self, name, resource):
-        """
-        Notify the cache that *resource* was loaded from *name*.
-        """
-        pass
-
-
-class TemporalCache(Cache):
-
-    """
-    """
-
-    def __init__(self, capacity=5):
-        self.capacity = capacity
-        self.order = []
-        self.last_name = None
-
-    def get(self, name):
-        for item in self.order:
-            if item[0] == name:
-                return item[1]
-        return None
-
-    def update_used(self, name, resource):
-        for i, item in enumerate(self.order):
-            if item[0] == name:
-                del self.order[i]
-                self.order.append((name, resource))
-                return
-        if len(self.order) >= self.capacity:
-            del self.order[0]
-        self.order.append((name, resource))
-
-
-class FrequencyCache(Cache):
-
-    """
-    """
-
-    def __init__(self, capacity=5):
-        self.capacity = capacity
-        self.order = {}
-
-
-class InfiniteCache(Cache):
-
-    """
-    """
-
-    def __init__(self):
-        self.items = {}
-
-    def get(self, name):
-        return self.items.get(name, None)
-
-    def update_used(self, name, resource):
-        self.items[name] = resource
-
-
-class Loader:
-
-    """
-    """
-
-    def __init__(self, caches=None):
-        if caches is None:
-            self.caches = [FrequencyCache(), TemporalCache()]
-        else:
-            self.caches = [cache for cache in caches]
-
-    def load(self, name, force_load=False):
-        if not force_load:
-            for cache in self.caches:
-                temp = cache.get(name)
-                if temp is not None:
-                    self.update_caches(name, temp)
-                    return temp
-
-        temp = self.actual_load(name)
-        self.update_caches(name, temp)
-        return temp
-
-    def update_caches(self, name, temp):
-        for cache in self.caches:
-            cache.update_used(name, temp)
-
-    def actual_load(self, name):
-        raise NotImplementedError('Loader.actual_load() is abstract')
-
-
-class FileLoader(Loader):
-
-    """
-    """
-
-    def load(self, name, force_load=False):
-        filename = os.path.abspath(name)
-        return Loader.load(self, filename, force_load)
+"""
+The :mod:`loader` module contains the Loaders, which load resources such
+as images, sounds and tilesets, and the Caches that keep them so that
+they are not loaded again.
+
+Caches may be limited by a number of resources, by an estimate of the
+memory the resources take, as calculated by resource_memory(), or both.
+They and the Loaders count their hits, misses and evictions.
+
+Resources may also be loaded ahead of time by the threads of the
+loader_pool, with Loader.preload() or with a Manifest listing the
+resources of several Loaders.
+"""
+
+import os
+import sys
+import atexit
+import Queue
+import threading
+from array import array
+from collections import OrderedDict
+
+
+def resource_memory(resource):
+    """
+    Return an estimate of how many bytes *resource* takes.
+
+    pygame Surfaces and Sounds, arrays, and tuples or lists of them are
+    measured. Other objects may provide a get_memory() method returning
+    their size; those that do not are taken as 0 bytes.
+    """
+    if hasattr(resource, 'get_bytesize'):
+        return resource.get_bytesize() * resource.get_width() \
+               * resource.get_height()
+    elif hasattr(resource, 'get_length') and hasattr(resource, 'play'):
+        import pygame
+        mixer_settings = pygame.mixer.get_init()
+        if not mixer_settings:
+            return 0
+        frequency, size, channels = mixer_settings
+        return int(resource.get_length() * frequency * channels
+                   * abs(size) / 8)
+    elif isinstance(resource, array):
+        return resource.itemsize * len(resource)
+    elif isinstance(resource, (tuple, list)):
+        return sum([resource_memory(item) for item in resource])
+    elif hasattr(resource, 'get_memory'):
+        return resource.get_memory()
+    else:
+        return 0
+
+
+class Cache(object):
+
+    """
+    A Cache keeps resources loaded by a Loader, identified by their
+    names.
+
+    This base class keeps nothing, and its subclasses keep at most
+    *capacity* resources taking at most *memory_budget* bytes, as
+    estimated by resource_memory(), discarding others when either is
+    exceeded. None means no limit. The resource used last is always
+    kept, even if it alone exceeds the budget.
+
+    :attr:`memory`
+        Estimate of the bytes taken by the resources kept.
+
+    :attr:`hits`
+        Number of get() calls that found the resource.
+
+    :attr:`misses`
+        Number of get() calls that did not find the resource.
+
+    :attr:`evictions`
+        Number of resources discarded to respect the limits.
+    """
+
+    def __init__(self, capacity=None, memory_budget=None):
+        self.capacity = capacity
+        self.memory_budget = memory_budget
+        self.memory = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, name):
+        """
+        Return a pre-loaded resource loaded from *name* or None if
+        that resource is not pre-loaded.
+        """
+        resource = self.lookup(name)
+        if resource is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return resource
+
+    def lookup(self, name):
+        """
+        *Virtual.*
+
+        Return the resource kept for *name* or None, without counting a
+        hit or a miss.
+        """
+        return None
+
+    def update_used(self, name, resource):
+        """
+        *Virtual.*
+
+        Notify the cache that *resource* was loaded from *name*.
+        """
+        pass
+
+    def discard(self, name):
+        """
+        *Virtual.*
+
+        Stop keeping the resource loaded from *name*, if it is kept.
+        """
+        pass
+
+    def clear(self):
+        """
+        *Virtual.*
+
+        Stop keeping all resources.
+        """
+        pass
+
+    def __len__(self):
+        return 0
+
+    def exceeds(self, length, memory):
+        """
+        Return whether keeping *length* resources taking *memory* bytes
+        would exceed the cache's limits.
+        """
+        return (self.capacity is not None and length > self.capacity) or \
+               (self.memory_budget is not None and
+                memory > self.memory_budget)
+
+    def get_stats(self):
+        """
+        Return a dict with the cache's 'hits', 'misses', 'evictions',
+        'resources' and 'memory'.
+        """
+        return {'hits': self.hits, 'misses': self.misses,
+                'evictions': self.evictions, 'resources': len(self),
+                'memory': self.memory}
+
+
+class TemporalCache(Cache):
+
+    """
+    A TemporalCache keeps the most recently used resources, discarding
+    the least recently used ones first.
+    """
+
+    def __init__(self, capacity=5, memory_budget=None):
+        Cache.__init__(self, capacity, memory_budget)
+        self.resources = OrderedDict()
+        self.sizes = {}
+
+    def lookup(self, name):
+        return self.resources.get(name, None)
+
+    def update_used(self, name, resource):
+        self.discard(name)
+        size = resource_memory(resource)
+        self.resources[name] = resource
+        self.sizes[name] = size
+        self.memory += size
+        while len(self.resources) > 1 and \
+              self.exceeds(len(self.resources), self.memory):
+            old_name, _ = self.resources.popitem(last=False)
+            self.memory -= self.sizes.pop(old_name)
+            self.evictions += 1
+
+    def discard(self, name):
+        if self.resources.pop(name, None) is not None:
+            self.memory -= self.sizes.pop(name)
+
+    def clear(self):
+        self.resources.clear()
+        self.sizes.clear()
+        self.memory = 0
+
+    def __len__(self):
+        return len(self.resources)
+
+
+class FrequencyCache(Cache):
+
+    """
+    A FrequencyCache keeps the most frequently used resources,
+    discarding the least frequently used ones first, and among those the
+    least recently used.
+
+    Resources are grouped by their use count, so that finding the one to
+    discard does not go through all of them.
+
+    Every *aging_period* uses, all counts are halved, so that resources
+    used often long ago do not stay forever at the expense of those in
+    use now. It defaults to AGING_PERIOD, and None never ages the counts.
+    """
+
+    AGING_PERIOD = 256
+
+    def __init__(self, capacity=5, memory_budget=None,
+                 aging_period=AGING_PERIOD):
+        Cache.__init__(self, capacity, memory_budget)
+        self.resources = {}
+        self.sizes = {}
+        self.counts = {}
+        self.buckets = {}
+        self.min_count = 0
+        self.aging_period = aging_period
+        self.uses = 0
+
+    def lookup(self, name):
+        return self.resources.get(name, None)
+
+    def update_used(self, name, resource):
+        if name in self.resources:
+            count = self.__unlink(name)
+            self.memory -= self.sizes[name]
+        else:
+            count = 0
+        size = resource_memory(resource)
+        self.resources[name] = resource
+        self.sizes[name] = size
+        self.memory += size
+
+        # Make room while the resource is out of the buckets, so that it
+        # is kept whether it is new or grew
+        while self.buckets and \
+              self.exceeds(len(self.resources), self.memory):
+            self.__evict()
+        self.__link(name, count + 1)
+        self.min_count = min(self.min_count, count + 1)
+
+        self.uses += 1
+        if self.aging_period is not None and self.uses >= self.aging_period:
+            self.uses = 0
+            self.__age()
+
+    def discard(self, name):
+        if name in self.resources:
+            self.__unlink(name)
+            del self.resources[name]
+            self.memory -= self.sizes.pop(name)
+
+    def clear(self):
+        self.resources.clear()
+        self.sizes.clear()
+        self.counts.clear()
+        self.buckets.clear()
+        self.min_count = 0
+        self.memory = 0
+        self.uses = 0
+
+    def __len__(self):
+        return len(self.resources)
+
+    def __age(self):
+        # Halve the counts, keeping at least 1. Resources whose counts
+        # meet keep the order of their old counts, so the less used ones
+        # are still discarded first.
+        buckets, self.buckets = self.buckets, {}
+        for count in sorted(buckets):
+            for name in buckets[count]:
+                self.__link(name, max(1, count / 2))
+        self.min_count = min(self.buckets) if self.buckets else 0
+
+    def __link(self, name, count):
+        self.counts[name] = count
+        bucket = self.buckets.get(count)
+        if bucket is None:
+            bucket = self.buckets[count] = OrderedDict()
+        bucket[name] = None
+
+    def __unlink(self, name):
+        count = self.counts.pop(name)
+        bucket = self.buckets[count]
+        del bucket[name]
+        if not bucket:
+            del self.buckets[count]
+            if self.min_count == count:
+                self.min_count = count + 1
+        return count
+
+    def __evict(self):
+        while self.min_count not in self.buckets:
+            self.min_count += 1
+        name = iter(self.buckets[self.min_count]).next()
+        self.discard(name)
+        self.evictions += 1
+
+
+class InfiniteCache(Cache):
+
+    """
+    An InfiniteCache keeps every resource it is given.
+    """
+
+    def __init__(self):
+        Cache.__init__(self)
+        self.items = {}
+        self.sizes = {}
+
+    def lookup(self, name):
+        return self.items.get(name, None)
+
+    def update_used(self, name, resource):
+        self.discard(name)
+        self.items[name] = resource
+        self.sizes[name] = size = resource_memory(resource)
+        self.memory += size
+
+    def discard(self, name):
+        if self.items.pop(name, None) is not None:
+            self.memory -= self.sizes.pop(name)
+
+    def clear(self):
+        self.items.clear()
+        self.sizes.clear()
+        self.memory = 0
+
+    def __len__(self):
+        return len(self.items)
+
+
+class Future(object):
+
+    """
+    A Future holds the result of a call made by the LoaderPool, which is
+    available once the call is done.
+    """
+
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.finished = False
+        self.value = None
+        self.exc_info = None
+
+    def done(self):
+        """
+        Return whether the call is done.
+        """
+        return self.finished
+
+    def wait(self, timeout=None):
+        """
+        Wait until the call is done, or for at most *timeout* seconds.
+        Return whether it is done.
+        """
+        with self.condition:
+            if not self.finished:
+                self.condition.wait(timeout)
+            return self.finished
+
+    def result(self):
+        """
+        Wait until the call is done and return its result, or raise the
+        exception it raised.
+        """
+        with self.condition:
+            while not self.finished:
+                self.condition.wait()
+        if self.exc_info is not None:
+            raise self.exc_info[0], self.exc_info[1], self.exc_info[2]
+        return self.value
+
+    def set_result(self, value):
+        with self.condition:
+            self.value = value
+            self.finished = True
+            self.condition.notify_all()
+
+    def set_exc_info(self, exc_info):
+        with self.condition:
+            self.exc_info = exc_info
+            self.finished = True
+            self.condition.notify_all()
+
+
+class LoaderPool(object):
+
+    """
+    A LoaderPool makes calls in *workers* background threads, so that
+    resources can be loaded while the game runs. Its threads are started
+    when the first call is submitted, and stopped at exit.
+
+    The global pool is loader_pool.
+    """
+
+    WORKERS = 2
+
+    def __init__(self, workers=None):
+        if workers is None:
+            workers = LoaderPool.WORKERS
+        self.workers = workers
+        self.tasks = Queue.Queue()
+        self.threads = []
+        self.lock = threading.Lock()
+
+    def submit(self, function, *args):
+        """
+        Have *function* called with *args* by one of the threads and
+        return a Future with its result.
+        """
+        future = Future()
+        self.tasks.put((future, function, args))
+        with self.lock:
+            if not self.threads:
+                atexit.register(self.stop)
+            while len(self.threads) < self.workers:
+                thread = threading.Thread(target=self.run)
+                thread.daemon = True
+                thread.start()
+                self.threads.append(thread)
+        return future
+
+    def stop(self):
+        """
+        Stop the threads after the calls already submitted are made.
+        """
+        with self.lock:
+            threads, self.threads = self.threads, []
+        for thread in threads:
+            self.tasks.put(None)
+        for thread in threads:
+            thread.join()
+
+    def run(self):
+        while True:
+            task = self.tasks.get()
+            if task is None:
+                return
+            future, function, args = task
+            try:
+                result = function(*args)
+            except Exception:
+                future.set_exc_info(sys.exc_info())
+            else:
+                future.set_result(result)
+
+loader_pool = LoaderPool()
+
+
+class Loader(object):
+
+    """
+    A Loader loads resources identified by names, looking for them in its
+    *caches* first. Every resource loaded or found is given to all the
+    caches, which decide whether to keep it.
+
+    *caches* defaults to a FrequencyCache followed by a TemporalCache.
+
+    Loaders may be used by several threads, as preload() does. A resource
+    that is being loaded by one thread is waited for by the others
+    instead of being loaded again.
+
+    :attr:`hits`
+        Number of load() calls answered by a cache.
+
+    :attr:`misses`
+        Number of load() calls that had to actually load the resource.
+
+    :attr:`waits`
+        Number of load() calls that waited for another thread to load
+        the resource.
+    """
+
+    def __init__(self, caches=None):
+        if caches is None:
+            self.caches = [FrequencyCache(), TemporalCache()]
+        else:
+            self.caches = [cache for cache in caches]
+        self.hits = 0
+        self.misses = 0
+        self.waits = 0
+        self.lock = threading.RLock()
+        self.pending = {}
+
+    def load(self, name, force_load=False):
+        with self.lock:
+            if not force_load:
+                for cache in self.caches:
+                    temp = cache.get(name)
+                    if temp is not None:
+                        self.hits += 1
+                        self.update_caches(name, temp)
+                        return temp
+                future = self.pending.get(name)
+                if future is not None:
+                    self.waits += 1
+                    waiting = True
+                else:
+                    future = self.pending[name] = Future()
+                    waiting = False
+            else:
+                future = None
+                waiting = False
+            if not waiting:
+                self.misses += 1
+        if waiting:
+            return future.result()
+
+        # Load without holding the lock, so that other threads can load
+        # other resources meanwhile
+        try:
+            temp = self.actual_load(name)
+        except Exception:
+            if future is not None:
+                with self.lock:
+                    del self.pending[name]
+                future.set_exc_info(sys.exc_info())
+            raise
+        with self.lock:
+            self.update_caches(name, temp)
+            if future is not None:
+                del self.pending[name]
+        if future is not None:
+            future.set_result(temp)
+        return temp
+
+    def preload(self, names):
+        """
+        Load the resources in *names* with the threads of the loader_pool,
+        so that they are cached when load() is called for them. Return a
+        list with a Future for each resource, in the same order.
+        """
+        return [loader_pool.submit(self.load, name) for name in names]
+
+    def update_caches(self, name, temp):
+        for cache in self.caches:
+            cache.update_used(name, temp)
+
+    def actual_load(self, name):
+        raise NotImplementedError('Loader.actual_load() is abstract')
+
+    def clear(self):
+        """
+        Empty all the loader's caches.
+        """
+        with self.lock:
+            for cache in self.caches:
+                cache.clear()
+
+    def get_stats(self):
+        """
+        Return a dict with the loader's 'hits', 'misses' and 'waits',
+        the 'evictions' of all its caches, and the 'memory' taken by the
+        resources the caches keep, counting each resource once.
+        """
+        sizes = {}
+        evictions = 0
+        for cache in self.caches:
+            evictions += cache.evictions
+            sizes.update(getattr(cache, 'sizes', {}))
+        return {'hits': self.hits, 'misses': self.misses,
+                'waits': self.waits, 'evictions': evictions,
+                'memory': sum(sizes.itervalues())}
+
+
+class FileLoader(Loader):
+
+    """
+    A FileLoader loads resources from files, identified by their absolute
+    paths.
+    """
+
+    def load(self, name, force_load=False):
+        filename = os.path.abspath(name)
+        return Loader.load(self, filename, force_load)
+
+
+class TimestampedFileLoader(Loader):
+
+    """
+    A TimestampedFileLoader loads resources made from one or more files,
+    identified by their paths and modification times, so that a resource
+    is loaded again if one of its files changes.
+
+    The names passed to load() may be a filename or a tuple of filenames,
+    which are passed to load_files() when the resource is not cached.
+    """
+
+    def load(self, name, force_load=False):
+        if isinstance(name, basestring):
+            name = (name,)
+        key = tuple([(os.path.abspath(filename), os.path.getmtime(filename))
+                     for filename in name])
+        return Loader.load(self, key, force_load)
+
+    def actual_load(self, name):
+        return self.load_files(*[filename for filename, mtime in name])
+
+    def load_files(self, *filenames):
+        """
+        *Abstract.*
+
+        Load and return the resource made from *filenames*.
+        """
+        raise NotImplementedError('TimestampedFileLoader.load_files() is '
+                                  'abstract')
+
+
+class Manifest(object):
+
+    """
+    A Manifest lists the resources something will need, each with the
+    Loader that loads it, so that they can be preloaded before they are
+    needed. Maps and menus return their Manifests from get_manifest().
+
+    *entries* may be an iterable of (loader, name) tuples to start with.
+    """
+
+    def __init__(self, entries=None):
+        if entries is None:
+            self.entries = []
+        else:
+            self.entries = list(entries)
+
+    def add(self, loader, *names):
+        """
+        Add the resources with *names*, loaded by *loader*.
+        """
+        self.entries.extend([(loader, name) for name in names])
+
+    def extend(self, manifest):
+        """
+        Add the resources in another *manifest*.
+        """
+        self.entries.extend(manifest.entries)
+
+    def preload(self):
+        """
+        Start loading the resources with the threads of the loader_pool
+        and return a list with a Future for each entry, in order.
+        """
+        return [loader_pool.submit(loader.load, name)
+                for loader, name in self.entries]
+
+    def __len__(self):
+        return len(self.entries)
@@ -0,0 +1,196 @@
+"""
+The :mod:`mapfile` module reads and writes map layout files. Besides the
+CSV .map files, it supports a binary format whose layers are read
+straight into arrays without any parsing, and converts the former into the latter.
+
+A binary map file starts with a header with the MAGIC string followed by
+the format version, the map width, the map height and the number of
+scenario layers, all little-endian 16-bit unsigned integers. The
+terrain layer and then each scenario layer follow, each as width *
+height little-endian 16-bit unsigned tile ids, row by row.
+
+This module can be run as a script to convert a CSV .map file:
+``python -m librpg.mapfile layout.map [layout.bmap]``.
+"""
+
+import os
+import sys
+import csv
+import struct
+from array import array
+
+from librpg.loader import TimestampedFileLoader, TemporalCache
+
+
+MAGIC = 'LRPGMAP\0'
+VERSION = 1
+HEADER = struct.Struct('<8sHHHH')
+
+
+def read_map_file(filename):
+    """
+    Read the map layout file *filename*, either binary or CSV, and
+    return a (width, height, layers) tuple, where layers is a list of
+    array('H') with the ids of the terrain layer followed by those of
+    each scenario layer, row by row.
+    """
+    layout_file = open(filename, 'rb')
+    try:
+        binary = layout_file.read(len(MAGIC)) == MAGIC
+    finally:
+        layout_file.close()
+    if binary:
+        return read_binary_map(filename)
+    else:
+        return read_csv_map(filename)
+
+
+class LayoutLoader(TimestampedFileLoader):
+
+    """
+    Loads map layout files like read_map_file(), keeping the layouts of
+    the *capacity* most recently used files.
+    """
+
+    def __init__(self, capacity=16):
+        TimestampedFileLoader.__init__(self, [TemporalCache(capacity)])
+
+    def load_files(self, filename):
+        return read_map_file(filename)
+
+layout_loader = LayoutLoader()
+
+
+def load_map_file(filename):
+    """
+    Return the layout in *filename* like read_map_file(), reusing the one
+    read last time unless the file changed. The layers returned are
+    shared with every other caller and must not be changed; pass them to
+    TileMatrix.set_ids() with shared=True to have them copied only when
+    the layer is first changed.
+    """
+    return layout_loader.load(filename)
+
+
+def read_binary_map(filename):
+    """
+    Read the binary map layout file *filename* and return a (width,
+    height, layers) tuple like read_map_file().
+
+    Raise ValueError if the file is not as long as its header says.
+    """
+    layout_file = open(filename, 'rb')
+    try:
+        header = layout_file.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise ValueError('%s is truncated: it has no complete header'
+                             % filename)
+        magic, version, width, height, scenario_number = \
+            HEADER.unpack(header)
+        if version != VERSION:
+            raise ValueError('%s has map format version %d, expected %d'
+                             % (filename, version, VERSION))
+        file_size = os.fstat(layout_file.fileno()).st_size
+        expected_size = HEADER.size + \
+            width * height * 2 * (scenario_number + 1)
+        if file_size != expected_size:
+            raise ValueError('%s has %d bytes, but a %d x %d map with %d '
+                             'layers takes %d' % (filename, file_size,
+                             width, height, scenario_number + 1,
+                             expected_size))
+
+        # Read each layer straight into its array
+        layers = []
+        for i in xrange(scenario_number + 1):
+            layer = array('H')
+            try:
+                layer.fromfile(layout_file, width * height)
+            except EOFError:
+                raise ValueError('%s is truncated' % filename)
+            layers.append(layer)
+    finally:
+        layout_file.close()
+
+    if sys.byteorder == 'big':
+        for layer in layers:
+            layer.byteswap()
+    return width, height, layers
+
+
+def read_csv_map(filename):
+    """
+    Read the CSV map layout file *filename* and return a (width, height,
+    layers) tuple like read_map_file().
+
+    The first line holds the width, the height and the number of scenario
+    layers. Each layer follows as lines of width comma-separated tile ids.
+    Lines of other lengths, such as the blank lines between layers, are
+    skipped.
+    """
+    layout_file = open(filename)
+    try:
+        r = csv.reader(layout_file, delimiter=',')
+
+        first_line = r.next()
+        width = int(first_line[0])
+        height = int(first_line[1])
+        scenario_number = int(first_line[2])
+
+        layers = []
+        for i in xrange(scenario_number + 1):
+            layer = array('H')
+            y = 0
+            for line in r:
+                if len(line) == width:
+                    layer.extend([int(value) for value in line])
+                    y += 1
+                if y >= height:
+                    break
+            # Short files leave the remaining tiles with id 0
+            layer.extend(array('H', [0]) * (width * height - len(layer)))
+            layers.append(layer)
+    finally:
+        layout_file.close()
+    return width, height, layers
+
+
+def write_binary_map(filename, width, height, layers):
+    """
+    Write a binary map layout file *filename* for a map of *width* x
+    *height* tiles whose *layers* are given like read_map_file() returns
+    them.
+    """
+    layout_file = open(filename, 'wb')
+    try:
+        layout_file.write(HEADER.pack(MAGIC, VERSION, width, height,
+                                      len(layers) - 1))
+        for layer in layers:
+            if len(layer) != width * height:
+                raise ValueError('Layer has %d tiles, expected %d'
+                                 % (len(layer), width * height))
+            if sys.byteorder == 'big':
+                layer = array('H', layer)
+                layer.byteswap()
+            layout_file.write(layer.tostring())
+    finally:
+        layout_file.close()
+
+
+def convert_map_file(csv_filename, binary_filename=None):
+    """
+    Convert the CSV map layout file *csv_filename* to a binary one named
+    *binary_filename*, which defaults to the same name with the .bmap
+    extension. Return the name of the binary file.
+    """
+    if binary_filename is None:
+        binary_filename = os.path.splitext(csv_filename)[0] + '.bmap'
+    width, height, layers = read_csv_map(csv_filename)
+    write_binary_map(binary_filename, width, height, layers)
+    return binary_filename
+
+
+if __name__ == '__main__':
+    if len(sys.argv) not in (2, 3):
+        print 'Usage: python -m librpg.mapfile layout.map [layout.bmap]'
+        sys.exit(1)
+    print 'Wrote', convert_map_file(*sys.argv[1:])
@@ -1,170 +1,589 @@
-import pygame
-
-from librpg.config import graphics_config as g_cfg
-from librpg.tile import Tile
-from librpg.locals import UP, RIGHT, DOWN, LEFT, ANIMATION_PERIOD, SRCALPHA
-from librpg.color import BLACK
-from librpg.virtualscreen import get_screen
-from librpg.util import Position
-
-
-class MapView(object):
-
-    """
-    map_model: MapModel (read-only)
-    MapModel with the information to be drawn.
-
-    screen: Surface (read-only)
-    Screen surface to blit to.
-
-    background: Surface (private)
-    Surface containing the static terrain and scenario layers that are
-    drawn at the lower level.
-
-    foreground: Surface (private)
-    Surface containing the static scenario tiles that are drawn at
-    the upper level.
-
-    camera_mode: CameraMode (private)
-    CameraMode to calculate the map focus.
-    """
-
-    def __init__(self, map_model):
-        self.map_model = map_model
-
-        self.init_backgrounds()
-        self.init_foreground()
-        self.camera_mode = g_cfg.camera_mode
-        self.camera_mode.attach_to_map(self.map_model)
-
-        self.phase = 0
-
-    def init_backgrounds(self):
-        self.backgrounds = []
-        for animation_phase in xrange(ANIMATION_PERIOD):
-            self.backgrounds.append(self.init_background(animation_phase))
-
-    def init_background(self, animation_phase):
-        background_width = (g_cfg.tile_size * self.map_model.width +
-                            g_cfg.screen_width)
-        background_height = (g_cfg.tile_size * self.map_model.height +
-                             g_cfg.screen_height)
-        background = pygame.Surface((background_width, background_height))
-
-        background.fill(BLACK)
-
-        for y in xrange(self.map_model.height):
-            for x in xrange(self.map_model.width):
-                bg_x = (g_cfg.map_border_width
-                        + x * g_cfg.tile_size)
-                bg_y = (g_cfg.map_border_height
-                        + y * g_cfg.tile_size)
-                terrain_tile_surface = self.map_model.terrain_layer[x, y].\
-                                       get_surface(animation_phase)
-                background.blit(terrain_tile_surface, (bg_x, bg_y))
-
-                for i in range(self.map_model.scenario_number):
-                    scenario_tile = self.map_model.scenario_layer[i][x, y]
-                    if scenario_tile.obstacle != Tile.ABOVE:
-                        scenario_tile_surface = scenario_tile.get_surface()
-                        background.blit(scenario_tile_surface, (bg_x, bg_y))
-        return background
-
-    def init_foreground(self):
-        foreground_width = (g_cfg.tile_size * self.map_model.width
-                            + g_cfg.screen_width)
-        foreground_height = (g_cfg.tile_size * self.map_model.height
-                             + g_cfg.screen_height)
-        self.foreground = pygame.Surface((foreground_width, foreground_height),
-                                         SRCALPHA, 32)
-
-        for y in xrange(self.map_model.height):
-            for x in xrange(self.map_model.width):
-                for i in range(self.map_model.scenario_number):
-                    scenario_tile = self.map_model.scenario_layer[i][x, y]
-                    if scenario_tile.obstacle == Tile.ABOVE:
-                        fg_x = (g_cfg.map_border_width
-                                + x * g_cfg.tile_size)
-                        fg_y = (g_cfg.map_border_height
-                                + y * g_cfg.tile_size)
-                        scenario_tile_surface = scenario_tile.get_surface()
-                        self.foreground.blit(scenario_tile_surface,
-                                             (fg_x, fg_y))
-
-    def draw(self):
-        party_avatar = self.map_model.party_avatar
-
-        # Draw the background
-        if party_avatar:
-            party_pos = party_avatar.position
-            movement_offset = self.calc_object_movement_offset(party_avatar)
-            party_x_offset, party_y_offset = movement_offset
-        else:
-            party_pos = Position(0, 0)
-            party_x_offset, party_y_offset = 0, 0
-        self.bg_topleft = self.camera_mode.calc_bg_slice_topleft(
-                                                            party_pos,
-                                                            party_x_offset,
-                                                            party_y_offset)
-        bg_rect = pygame.Rect(self.bg_topleft, g_cfg.screen_dimensions)
-        phase = self.phase / g_cfg.animation_frame_period
-        get_screen().blit(self.backgrounds[phase], (0, 0), bg_rect)
-
-        # Draw the map objects
-        self.draw_object_layer(self.map_model.below_objects)
-        self.draw_object_layer(self.map_model.obstacle_objects)
-        self.draw_object_layer(self.map_model.above_objects)
-
-        # Draw the foreground
-        get_screen().blit(self.foreground, (0, 0), bg_rect)
-
-        # Update phase
-        self.phase = (self.phase + 1) % (ANIMATION_PERIOD
-                                       * g_cfg.animation_frame_period)
-
-    def draw_object_layer(self, object_layer):
-        if g_cfg.object_width > g_cfg.tile_size or\
-           g_cfg.object_height > g_cfg.tile_size:
-            object_layer.sort(key=lambda x: x.position)
-
-        for obj in object_layer:
-            obj_x_offset, obj_y_offset = self.calc_object_movement_offset(obj)
-            obj_topleft = self.camera_mode.\
-                    calc_object_topleft(self.bg_topleft, obj.position,
-                                        obj.image.width, obj.image.height,
-                                        obj_x_offset, obj_y_offset)
-            obj_rect = pygame.Rect(obj_topleft,
-                                   g_cfg.object_dimensions)
-            get_screen().blit(obj.get_surface(), obj_rect)
-
-    def calc_object_movement_offset(self, obj):
-        obj_x_offset, obj_y_offset = 0, 0
-        if obj.movement_phase > 0:
-            offset = obj.movement_phase * g_cfg.tile_size / obj.speed
-            if not obj.going_back:
-                if obj.facing == UP:
-                    obj_y_offset = offset
-                elif obj.facing == RIGHT:
-                    obj_x_offset = - offset
-                elif obj.facing == DOWN:
-                    obj_y_offset = - offset
-                elif obj.facing == LEFT:
-                    obj_x_offset = offset
-            else:
-                if obj.facing == UP:
-                    obj_y_offset = - offset
-                elif obj.facing == RIGHT:
-                    obj_x_offset = offset
-                elif obj.facing == DOWN:
-                    obj_y_offset = offset
-                elif obj.facing == LEFT:
-                    obj_x_offset = - offset
-        return obj_x_offset, obj_y_offset
-
-    def calc_pos_from_mouse(self, pos):
-        scr_x, scr_y = pos
-        x = int((scr_x + self.bg_topleft[0] - g_cfg.map_border_width)
-                / g_cfg.tile_size)
-        y = int((scr_y + self.bg_topleft[1] - g_cfg.map_border_height)
-                / g_cfg.tile_size)
-        return x, y
+import os
+import hashlib
+from collections import OrderedDict
+
+import pygame
+
+from librpg.config import graphics_config as g_cfg
+from librpg.tile import Tile, TileMatrix
+from librpg.locals import UP, RIGHT, DOWN, LEFT, ANIMATION_PERIOD, SRCALPHA
+from librpg.color import BLACK
+from librpg.virtualscreen import get_screen, invalidate
+from librpg.util import Position
+from librpg.spatial import DepthOrder
+from librpg.animation import get_tick
+from librpg.render import RenderQueue
+
+
+class ChunkCache(object):
+
+    """
+    A least recently used store of rendered map pieces.
+
+    *capacity* is the amount of memory, in bytes, that the stored
+    surfaces may take. When it is exceeded, the least recently used
+    surfaces are discarded, so they will have to be rendered again.
+    Their scaled copies are discarded as well, if the screen is a
+    PrescaledScreen.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.memory = 0
+        self.surfaces = OrderedDict()
+
+    def get(self, key):
+        """
+        Return the surface stored at *key*, or None if it is not stored.
+        """
+        surface = self.surfaces.pop(key, None)
+        if surface is not None:
+            self.surfaces[key] = surface
+        return surface
+
+    def put(self, key, surface, keep=0):
+        """
+        Store *surface* at *key*, discarding the least recently used
+        surfaces while the capacity is exceeded.
+
+        The *keep* most recently used surfaces are never discarded, which
+        protects the ones that are in use in the current frame.
+        """
+        self.surfaces[key] = surface
+        self.memory += surface_memory(surface)
+        while self.memory > self.capacity and len(self.surfaces) > keep:
+            _, old = self.surfaces.popitem(last=False)
+            self.memory -= surface_memory(old)
+            invalidate(old)
+
+    def discard(self, key):
+        """
+        Remove the surface stored at *key*, if there is one.
+        """
+        surface = self.surfaces.pop(key, None)
+        if surface is not None:
+            self.memory -= surface_memory(surface)
+            invalidate(surface)
+
+    def clear(self):
+        for surface in self.surfaces.itervalues():
+            invalidate(surface)
+        self.surfaces.clear()
+        self.memory = 0
+
+
+def surface_memory(surface):
+    """
+    Return an estimate of how many bytes *surface* takes.
+    """
+    return surface.get_bytesize() * surface.get_width() * surface.get_height()
+
+
+class ViewCache(object):
+
+    """
+    A ViewCache keeps the rendered pieces of the *capacity* maps whose
+    MapViews were put into it last, so that a map that looks exactly
+    the same when it is shown again is not rendered again.
+
+    Maps look the same when they have the same tiles, from the same
+    tileset files, and the chunk and tile sizes did not change. Their
+    layers must be TileMatrix for them to be cached.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.rendered = OrderedDict()
+
+    def key(self, map_model):
+        """
+        Return a key identifying how *map_model* looks, or None if it
+        cannot be cached.
+        """
+        layers = [map_model.terrain_layer] + map_model.scenario_layer
+        tilesets = [map_model.terrain_tileset] + map_model.scenario_tileset
+        if not all(isinstance(layer, TileMatrix) for layer in layers):
+            return None
+        digest = hashlib.md5()
+        for layer in layers:
+            digest.update(layer.ids.tostring())
+        files = tuple([(os.path.abspath(tileset.image_file),
+                        os.path.getmtime(tileset.image_file))
+                       for tileset in tilesets])
+        return (map_model.width, map_model.height, g_cfg.map_chunk_size,
+                g_cfg.tile_size, files, digest.hexdigest())
+
+    def take(self, map_model):
+        """
+        Remove and return the rendered pieces stored for a map that looks
+        like *map_model*, or None if there are none.
+        """
+        key = self.key(map_model)
+        if key is None:
+            return None
+        return self.rendered.pop(key, None)
+
+    def put(self, map_view):
+        """
+        Store the rendered pieces of *map_view*, discarding those of the
+        least recently stored maps if there are too many.
+        """
+        key = self.key(map_view.map_model)
+        if key is None or self.capacity <= 0:
+            return
+        self.rendered.pop(key, None)
+        self.rendered[key] = map_view.get_rendered()
+        while len(self.rendered) > self.capacity:
+            _, (chunks, _, _) = self.rendered.popitem(last=False)
+            chunks.clear()
+
+
+class MapView(object):
+
+    """
+    map_model: MapModel (read-only)
+    MapModel with the information to be drawn.
+
+    chunks: ChunkCache (private)
+    Rendered pieces of the map, each one covering a square of
+    graphics_config.map_chunk_size tiles. Each piece has one background,
+    containing the terrain and the scenario tiles that are drawn at the
+    lower level, stored with key (x, y, MapView.BACKGROUND). Pieces with
+    scenario tiles drawn at the upper level also have a foreground, stored
+    with key (x, y, MapView.FOREGROUND).
+
+    chunk_info: dict (private)
+    Maps each piece's (x, y) to a 2-tuple with the positions of its
+    animated terrain tiles and whether it has a foreground. When the
+    animation phase changes, only the animated positions of the
+    backgrounds are blitted again.
+
+    camera_mode: CameraMode (private)
+    CameraMode to calculate the map focus.
+
+    render_queue: RenderQueue (private)
+    Collects the chunks and the objects blitted by draw(), to blit them
+    onto the screen with a single call.
+    """
+
+    BACKGROUND, FOREGROUND = 0, 1
+    PREFETCHED_CHUNKS_PER_FRAME = 1
+
+    def __init__(self, map_model, rendered=None):
+        self.map_model = map_model
+
+        self.init_chunks(rendered)
+        self.camera_mode = g_cfg.camera_mode
+        self.camera_mode.attach_to_map(self.map_model)
+        self.render_queue = RenderQueue()
+
+        self.bg_topleft = None
+        self.drawn_phase = None
+        self.drawn_objects = {}
+        self.changed_tiles = []
+
+    def init_chunks(self, rendered=None):
+        self.chunk_size = g_cfg.map_chunk_size
+        self.chunk_pixels = self.chunk_size * g_cfg.tile_size
+        self.chunks_wide = ((self.map_model.width + self.chunk_size - 1)
+                            / self.chunk_size)
+        self.chunks_high = ((self.map_model.height + self.chunk_size - 1)
+                            / self.chunk_size)
+        if rendered is not None:
+            self.chunks, self.chunk_info, self.background_phases = rendered
+        else:
+            self.chunks = ChunkCache(g_cfg.map_chunk_cache_size)
+            self.chunk_info = {}
+            self.background_phases = {}
+        self.used_chunks = 0
+
+    def get_rendered(self):
+        """
+        Return the rendered pieces of the map, which may be passed to the
+        constructor of a MapView of an identical map to reuse them.
+        """
+        return self.chunks, self.chunk_info, self.background_phases
+
+    def get_chunk_info(self, cx, cy):
+        """
+        Return a 2-tuple with the positions of the animated terrain tiles
+        in the chunk at (*cx*, *cy*) and whether it has tiles drawn at the
+        upper level.
+        """
+        info = self.chunk_info.get((cx, cy))
+        if info is None:
+            animated, has_foreground = [], False
+            for x, y in self.chunk_tiles(cx, cy):
+                if self.map_model.terrain_layer[x, y].is_animated():
+                    animated.append((x, y))
+                for i in xrange(self.map_model.scenario_number):
+                    scenario_tile = self.map_model.scenario_layer[i][x, y]
+                    if scenario_tile.obstacle == Tile.ABOVE:
+                        has_foreground = True
+            info = (tuple(animated), has_foreground)
+            self.chunk_info[cx, cy] = info
+        return info
+
+    def chunk_tiles(self, cx, cy):
+        left, top = cx * self.chunk_size, cy * self.chunk_size
+        right = min(left + self.chunk_size, self.map_model.width)
+        bottom = min(top + self.chunk_size, self.map_model.height)
+        for y in xrange(top, bottom):
+            for x in xrange(left, right):
+                yield x, y
+
+    def create_chunk_surface(self, cx, cy, flags=0, depth=0):
+        left, top = cx * self.chunk_size, cy * self.chunk_size
+        width = min(self.chunk_size, self.map_model.width - left)
+        height = min(self.chunk_size, self.map_model.height - top)
+        size = (width * g_cfg.tile_size, height * g_cfg.tile_size)
+        if flags:
+            return pygame.Surface(size, flags, depth)
+        else:
+            return pygame.Surface(size)
+
+    def render_background(self, cx, cy, animation_phase):
+        background = self.create_chunk_surface(cx, cy)
+        background.fill(BLACK)
+        for x, y in self.chunk_tiles(cx, cy):
+            self.render_background_tile(background, cx, cy, x, y,
+                                        animation_phase)
+        self.background_phases[cx, cy] = animation_phase
+        return background
+
+    def render_background_tile(self, background, cx, cy, x, y,
+                               animation_phase):
+        bg_x = (x - cx * self.chunk_size) * g_cfg.tile_size
+        bg_y = (y - cy * self.chunk_size) * g_cfg.tile_size
+        terrain_tile_surface = self.map_model.terrain_layer[x, y].\
+                               get_surface(animation_phase)
+        background.blit(terrain_tile_surface, (bg_x, bg_y))
+
+        for i in range(self.map_model.scenario_number):
+            scenario_tile = self.map_model.scenario_layer[i][x, y]
+            if scenario_tile.obstacle != Tile.ABOVE:
+                scenario_tile_surface = scenario_tile.get_surface()
+                background.blit(scenario_tile_surface, (bg_x, bg_y))
+
+    def animate_background(self, background, cx, cy, animation_phase):
+        """
+        Bring the *background* of the chunk at (*cx*, *cy*) to
+        *animation_phase*, blitting again only its animated tiles.
+        """
+        if self.background_phases[cx, cy] == animation_phase:
+            return
+        animated, _ = self.get_chunk_info(cx, cy)
+        tile_size = g_cfg.tile_size
+        for x, y in animated:
+            # Clear the old frame, which may show through transparent
+            # parts of the new one
+            rect = pygame.Rect((x - cx * self.chunk_size) * tile_size,
+                               (y - cy * self.chunk_size) * tile_size,
+                               tile_size, tile_size)
+            background.fill(BLACK, rect)
+            self.render_background_tile(background, cx, cy, x, y,
+                                        animation_phase)
+            # Only the tile is scaled again, if the screen prescales
+            invalidate(background, rect)
+        self.background_phases[cx, cy] = animation_phase
+
+    def render_foreground(self, cx, cy):
+        foreground = self.create_chunk_surface(cx, cy, SRCALPHA, 32)
+
+        left, top = cx * self.chunk_size, cy * self.chunk_size
+        for x, y in self.chunk_tiles(cx, cy):
+            for i in range(self.map_model.scenario_number):
+                scenario_tile = self.map_model.scenario_layer[i][x, y]
+                if scenario_tile.obstacle == Tile.ABOVE:
+                    fg_x = (x - left) * g_cfg.tile_size
+                    fg_y = (y - top) * g_cfg.tile_size
+                    scenario_tile_surface = scenario_tile.get_surface()
+                    foreground.blit(scenario_tile_surface, (fg_x, fg_y))
+        return foreground
+
+    def get_background(self, cx, cy, animation_phase):
+        key = (cx, cy, MapView.BACKGROUND)
+        background = self.chunks.get(key)
+        if background is None:
+            background = self.render_background(cx, cy, animation_phase)
+            self.chunks.put(key, background, self.used_chunks)
+        else:
+            self.animate_background(background, cx, cy, animation_phase)
+        self.used_chunks += 1
+        return background
+
+    def get_foreground(self, cx, cy):
+        _, has_foreground = self.get_chunk_info(cx, cy)
+        if not has_foreground:
+            return None
+        key = (cx, cy, MapView.FOREGROUND)
+        foreground = self.chunks.get(key)
+        if foreground is None:
+            foreground = self.render_foreground(cx, cy)
+            self.chunks.put(key, foreground, self.used_chunks)
+        self.used_chunks += 1
+        return foreground
+
+    def invalidate_tile(self, position):
+        """
+        Discard the rendered chunk containing the tile at *position*, so
+        that it is rendered again with the tiles currently in the map.
+        """
+        cx = position[0] / self.chunk_size
+        cy = position[1] / self.chunk_size
+        self.chunks.discard((cx, cy, MapView.BACKGROUND))
+        self.chunks.discard((cx, cy, MapView.FOREGROUND))
+        self.chunk_info.pop((cx, cy), None)
+        self.changed_tiles.append(position)
+
+    def calc_chunk_range(self, bg_topleft, margin=0):
+        """
+        Return the (left, top, right, bottom) range of chunks, inclusive,
+        that are seen by a camera at *bg_topleft*, extended by *margin*
+        chunks in each direction.
+        """
+        map_x = bg_topleft[0] - g_cfg.map_border_width
+        map_y = bg_topleft[1] - g_cfg.map_border_height
+        left = max(map_x / self.chunk_pixels - margin, 0)
+        top = max(map_y / self.chunk_pixels - margin, 0)
+        right = min((map_x + g_cfg.screen_width - 1) / self.chunk_pixels
+                    + margin, self.chunks_wide - 1)
+        bottom = min((map_y + g_cfg.screen_height - 1) / self.chunk_pixels
+                     + margin, self.chunks_high - 1)
+        return left, top, right, bottom
+
+    def calc_visible_rect(self, margin=0):
+        """
+        Return the (left, top, width, height) rect, in tiles, seen by the
+        camera when the map was last drawn, extended by *margin* tiles in
+        each direction. Return None if the map was not drawn yet.
+        """
+        if self.bg_topleft is None:
+            return None
+        tile_size = g_cfg.tile_size
+        map_x = self.bg_topleft[0] - g_cfg.map_border_width
+        map_y = self.bg_topleft[1] - g_cfg.map_border_height
+        left = map_x / tile_size - margin
+        top = map_y / tile_size - margin
+        right = (map_x + g_cfg.screen_width - 1) / tile_size + margin
+        bottom = (map_y + g_cfg.screen_height - 1) / tile_size + margin
+        return (left, top, right - left + 1, bottom - top + 1)
+
+    def calc_chunk_topleft(self, cx, cy):
+        return (g_cfg.map_border_width + cx * self.chunk_pixels
+                - self.bg_topleft[0],
+                g_cfg.map_border_height + cy * self.chunk_pixels
+                - self.bg_topleft[1])
+
+    def prefetch_chunks(self, visible, animation_phase):
+        left, top, right, bottom = self.calc_chunk_range(self.bg_topleft, 1)
+        budget = MapView.PREFETCHED_CHUNKS_PER_FRAME
+        for cy in xrange(top, bottom + 1):
+            for cx in xrange(left, right + 1):
+                if budget <= 0:
+                    return
+                if (visible[0] <= cx <= visible[2]
+                    and visible[1] <= cy <= visible[3]):
+                    continue
+                key = (cx, cy, MapView.BACKGROUND)
+                if key not in self.chunks.surfaces:
+                    self.chunks.put(key,
+                                    self.render_background(cx, cy,
+                                                           animation_phase),
+                                    self.used_chunks)
+                    budget -= 1
+                _, has_foreground = self.get_chunk_info(cx, cy)
+                key = (cx, cy, MapView.FOREGROUND)
+                if (has_foreground and budget > 0
+                    and key not in self.chunks.surfaces):
+                    self.chunks.put(key, self.render_foreground(cx, cy),
+                                    self.used_chunks)
+                    budget -= 1
+
+    def calc_bg_topleft(self):
+        party_avatar = self.map_model.party_avatar
+        if party_avatar:
+            party_pos = party_avatar.position
+            movement_offset = self.calc_object_movement_offset(party_avatar)
+            party_x_offset, party_y_offset = movement_offset
+        else:
+            party_pos = Position(0, 0)
+            party_x_offset, party_y_offset = 0, 0
+        return self.camera_mode.calc_bg_slice_topleft(party_pos,
+                                                      party_x_offset,
+                                                      party_y_offset)
+
+    def calc_animation_phase(self):
+        return (get_tick() / g_cfg.animation_frame_period) % ANIMATION_PERIOD
+
+    def calc_tile_rect(self, position):
+        return pygame.Rect(g_cfg.map_border_width - self.bg_topleft[0]
+                           + position[0] * g_cfg.tile_size,
+                           g_cfg.map_border_height - self.bg_topleft[1]
+                           + position[1] * g_cfg.tile_size,
+                           g_cfg.tile_size, g_cfg.tile_size)
+
+    def get_dirty_rects(self):
+        """
+        Return a list with the pygame Rects of the screen that draw()
+        would change, or None if the camera moved and the whole map has
+        to be drawn again.
+        """
+        if self.bg_topleft is None or \
+           self.calc_bg_topleft() != self.bg_topleft:
+            return None
+
+        rects = [self.calc_tile_rect(position)
+                 for position in self.changed_tiles]
+
+        # Animated tiles
+        if self.calc_animation_phase() != self.drawn_phase:
+            left, top, right, bottom = self.calc_chunk_range(self.bg_topleft)
+            for cy in xrange(top, bottom + 1):
+                for cx in xrange(left, right + 1):
+                    animated, _ = self.get_chunk_info(cx, cy)
+                    rects.extend([self.calc_tile_rect(position)
+                                  for position in animated])
+
+        # Objects that moved, changed frame, appeared or disappeared
+        drawn_objects = self.drawn_objects
+        seen = set()
+        depth_order = self.map_model.depth_order
+        rect = self.calc_visible_rect(self.calc_object_margin())
+        for layer in (DepthOrder.BELOW, DepthOrder.OBSTACLE,
+                      DepthOrder.ABOVE):
+            for obj in depth_order.objects_in_rect(layer, rect):
+                seen.add(obj)
+                sprite = self.calc_object_sprite(obj)
+                drawn = drawn_objects.get(obj)
+                if drawn is not None and drawn[0] is sprite[0] and \
+                   drawn[1] == sprite[1] and drawn[2] is sprite[2]:
+                    continue
+                rects.append(self.calc_sprite_rect(sprite))
+                if drawn is not None:
+                    rects.append(self.calc_sprite_rect(drawn))
+        for obj, drawn in drawn_objects.iteritems():
+            if obj not in seen:
+                rects.append(self.calc_sprite_rect(drawn))
+        return rects
+
+    def calc_sprite_rect(self, sprite):
+        surface, topleft, area = sprite
+        if area is None:
+            return pygame.Rect(topleft, surface.get_size())
+        else:
+            return pygame.Rect(topleft, area.size)
+
+    def draw(self):
+        screen = get_screen()
+        queue = self.render_queue
+        queue.target = screen
+
+        # Draw the background
+        self.bg_topleft = self.calc_bg_topleft()
+        phase = self.calc_animation_phase()
+        self.drawn_phase = phase
+        self.changed_tiles = []
+
+        map_x = self.bg_topleft[0] - g_cfg.map_border_width
+        map_y = self.bg_topleft[1] - g_cfg.map_border_height
+        if (map_x < 0 or map_y < 0 or
+            map_x + g_cfg.screen_width > self.map_model.width
+                                          * g_cfg.tile_size or
+            map_y + g_cfg.screen_height > self.map_model.height
+                                          * g_cfg.tile_size):
+            screen.fill(BLACK)
+
+        self.used_chunks = 0
+        visible = self.calc_chunk_range(self.bg_topleft)
+        left, top, right, bottom = visible
+        for cy in xrange(top, bottom + 1):
+            for cx in xrange(left, right + 1):
+                queue.blit(self.get_background(cx, cy, phase),
+                           self.calc_chunk_topleft(cx, cy))
+
+        # Draw the map objects around the camera
+        self.drawn_objects = {}
+        depth_order = self.map_model.depth_order
+        rect = self.calc_visible_rect(self.calc_object_margin())
+        for layer in (DepthOrder.BELOW, DepthOrder.OBSTACLE,
+                      DepthOrder.ABOVE):
+            self.draw_object_layer(depth_order.objects_in_rect(layer, rect))
+
+        # Draw the foreground
+        for cy in xrange(top, bottom + 1):
+            for cx in xrange(left, right + 1):
+                foreground = self.get_foreground(cx, cy)
+                if foreground is not None:
+                    queue.blit(foreground, self.calc_chunk_topleft(cx, cy))
+        queue.flush()
+
+        # Render the chunks the camera is approaching
+        self.prefetch_chunks(visible, phase)
+
+    def calc_object_margin(self):
+        """
+        Return how many tiles away from the camera rect an object may be
+        and still be seen, either because it is larger than a tile or
+        because it is in the middle of a step.
+        """
+        overhang = max(g_cfg.object_width, g_cfg.object_height) \
+                   - g_cfg.tile_size
+        return 1 + max(0, (overhang + g_cfg.tile_size - 1) / g_cfg.tile_size)
+
+    def draw_object_layer(self, object_layer):
+        """
+        Queue the objects in *object_layer*, an iterable of MapObjects in
+        the order they should be drawn, to be drawn by draw().
+        """
+        queue = self.render_queue
+        drawn_objects = self.drawn_objects
+        for obj in object_layer:
+            sprite = self.calc_object_sprite(obj)
+            queue.blit(*sprite)
+            drawn_objects[obj] = sprite
+
+    def calc_object_sprite(self, obj):
+        """
+        Return a (surface, topleft, area) tuple with how *obj* is drawn
+        on the screen, area being the Rect of surface to blit or None.
+        """
+        obj_x_offset, obj_y_offset = self.calc_object_movement_offset(obj)
+        obj_topleft = self.camera_mode.\
+                calc_object_topleft(self.bg_topleft, obj.position,
+                                    obj.image.width, obj.image.height,
+                                    obj_x_offset, obj_y_offset)
+        surface, area = obj.get_sprite()
+        return surface, obj_topleft, area
+
+    def calc_object_movement_offset(self, obj):
+        obj_x_offset, obj_y_offset = 0, 0
+        if obj.movement_phase > 0:
+            offset = obj.movement_phase * g_cfg.tile_size / obj.speed
+            if not obj.going_back:
+                if obj.facing == UP:
+                    obj_y_offset = offset
+                elif obj.facing == RIGHT:
+                    obj_x_offset = - offset
+                elif obj.facing == DOWN:
+                    obj_y_offset = - offset
+                elif obj.facing == LEFT:
+                    obj_x_offset = offset
+            else:
+                if obj.facing == UP:
+                    obj_y_offset = - offset
+                elif obj.facing == RIGHT:
+                    obj_x_offset = offset
+                elif obj.facing == DOWN:
+                    obj_y_offset = offset
+                elif obj.facing == LEFT:
+                    obj_x_offset = - offset
+        return obj_x_offset, obj_y_offset
+
+    def calc_pos_from_mouse(self, pos):
+        scr_x, scr_y = pos
+        x = int((scr_x + self.bg_topleft[0] - g_cfg.map_border_width)
+                / g_cfg.tile_size)
+        y = int((scr_y + self.bg_topleft[1] - g_cfg.map_border_height)
+                / g_cfg.tile_size)
+        return x, y
@@ -1,20 +1,20 @@
-"""
-The :mod:`menu` module is one of the main modules in LibRPG. It contains
-the definition of classes that compose the core functionality of LibRPG
-menus, most notably Menu, Widget, Cursor and Div.
-"""
-
-from alignment import *
-from bar import *
-from cursor import *
-from div import *
-from grid import *
-from imagewidget import *
-from label import *
-from menu import *
-from navigator import *
-from panel import *
-from scrollarea import *
-from tab import *
-from theme import *
-from widget import *
+"""
+The :mod:`menu` module is one of the main modules in LibRPG. It contains
+the definition of classes that compose the core functionality of LibRPG
+menus, most notably Menu, Widget, Cursor and Div.
+"""
+
+from alignment import *
+from bar import *
+from cursor import *
+from div import *
+from grid import *
+from imagewidget import *
+from label import *
+from menu import *
+from navigator import *
+from panel import *
+from scrollarea import *
+from tab import *
+from theme import *
+from widget import *
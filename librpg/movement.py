@@ -1,244 +1,503 @@
-"""
-The :mod:`movement` module provides Movement objects that describe
-a MapObject's movements. These can be used both for one-time movement
-or for routine movement.
-"""
-
-
-class Movement(object):
-
-    """
-    Movements are instructions for a MapObject to move.
-
-    Movements can be used on a MapObject in two ways: one is to push them
-    to the object's movement queue, which will make the object execute it
-    once, as soon as the others that are already in progress or enqueued
-    are done. The other way is to insert them into the object's behavior
-    to have it execute it as part of its cyclic routine movement.
-    """
-
-    def flow(self, obj):
-        """
-        *Abstract.*
-
-        Manipulate the object to have it moved.
-
-        Return True if the Movement is done and the next can be executed (right
-        after the MapObject's *movement_phase* becomes 0, that is, the object
-        stops. Return False if it requires more flow() calls to complete.
-        """
-        raise NotImplementedError('Movement.flow() is abstract')
-
-
-class MovementQueue(Movement, list):
-
-    """
-    A MovementQueue is the object that holds Movements waiting to be
-    executed. To fill it, either pass a list in its *contents* parameter
-    with the intended contents or append/extend Movements to it like
-    any other list.
-
-    MovementQueues may be inserted in MovementQueues, and will execute all
-    their contents before yielding control.
-    """
-
-    def __init__(self, contents=None):
-        list.__init__(self)
-        if contents:
-            self.extend(contents)
-
-    def flow(self, obj):
-        if len(self) == 0:
-            return (True,)
-        first = self[0]
-        should_remove = first.flow(obj)[0]
-        if should_remove:
-            del self[0]
-        if len(self) == 0:
-            return (True, True)
-        else:
-            return (False, False)
-
-    def clear(self):
-        del self[:]
-
-
-class MovementCycle(Movement):
-
-    """
-    A MovementCycle holds Movements that are routinely executed. The
-    Movements are not removed from it when executed, but just passed,
-    and when the end of the MovementCycle is reached, it starts over.
-
-    To fill it, either pass a list in its *contents* parameter
-    with the intended contents or append/extend Movements to it like
-    any other list.
-
-    MovementCycles never yield control.
-    """
-
-    def __init__(self, contents=None):
-        if contents is not None:
-            self.movements = contents
-        else:
-            self.movements = []
-        self.current = 0
-
-    def flow(self, obj):
-        if len(self.movements) == 0:
-            return (False, False)
-        current = self.movements[self.current]
-        should_skip = current.flow(obj)[0]
-        if should_skip:
-            self.current = (self.current + 1) % len(self.movements)
-        return (False, False)
-
-
-class OneTileMovement(Movement):
-
-    """
-    Base class for one tile movements.
-    """
-
-    def __init__(self, direction, slide, back, tries):
-        """
-        *Constructor.*
-
-        If *slide* is True, the object will keep its stopped animation.
-
-        If *back* is True, the movement will be backwards.
-
-        If *tries* is None, the movement will be forced, that is, will
-        not yield control until it is executed.
-        """
-        self.direction = direction
-        self.slide = slide
-        self.back = back
-        if tries is None:
-            self.forced = True
-        else:
-            self.forced = False
-            self.tries_left = tries
-
-    def flow(self, obj):
-        done = obj.map.try_to_move_object(obj, self.direction,
-                                          slide=self.slide,
-                                          back=self.back)
-        if self.forced:
-            return (done, done)
-        elif done:
-            return (True, True)
-        elif self.tries_left:
-            self.tries_left -= 1
-            return (False, False)
-        else:
-            return (True, False)
-
-
-class Step(OneTileMovement):
-
-    """
-    Tries to make the object take one step to *direction*. Yields
-    control after the step worked or after *tries* frames have passed.
-
-    If *back* is True, the step will be backwards.
-    """
-
-    def __init__(self, direction, back=False, tries=2):
-        OneTileMovement.__init__(self, direction, False, back, tries)
-
-
-class Face(Movement):
-
-    """
-    Changes the object's facing to *direction* and immediately yields
-    control.
-    """
-
-    def __init__(self, direction):
-        self.direction = direction
-
-    def flow(self, obj):
-        obj.facing = self.direction
-        return (True, True)
-
-
-class Wait(Movement):
-
-    """
-    Waits *delay* frames before yielding control.
-    """
-
-    def __init__(self, delay):
-        self.initial_delay = delay
-        self.delay = delay
-
-    def flow(self, obj):
-        self.delay -= 1
-        if self.delay == 0:
-            self.delay = self.initial_delay
-            return (True, True)
-        else:
-            return (False, False)
-
-
-class Slide(OneTileMovement):
-
-    """
-    Tries to make the object slide one tile to *direction*. Yields
-    control after the slide worked or after *tries* frames have passed.
-
-    If *back* is True, the slide will be backwards.
-    """
-
-    def __init__(self, direction, back=False, tries=2):
-        OneTileMovement.__init__(self, direction, True, back, tries)
-
-
-class ForcedStep(OneTileMovement):
-
-    """
-    Tries to make the object take one step to *direction*. Yields
-    control only when the step is taken.
-    """
-
-    def __init__(self, direction, back=False):
-        OneTileMovement.__init__(self, direction, False, back, tries=None)
-
-
-class ForcedSlide(OneTileMovement):
-
-    """
-    Tries to make the object slide one tile to *direction*. Yields
-    control only when the slide works.
-    """
-
-    def __init__(self, direction, back=False):
-        OneTileMovement.__init__(self, direction, True, back, tries=None)
-
-import starA
-
-
-class PathMovement(Movement):
-
-    def __init__(self, mapmodel, obj, dest):
-        self.mapmodel = mapmodel
-        self.dest = dest
-        self.cur_step = None
-
-    def flow(self, obj):
-        if self.cur_step is None:
-            v = starA.StarA(self.mapmodel, obj.position,
-                            self.dest).calculate()
-            if not v:
-                return (True, True)
-            self.cur_step = Step(v[0])
-
-        done, worked = self.cur_step.flow(obj)
-        if done:
-            self.cur_step = None
-            if worked:
-                return (False, False)
-            else:
-                return (True, False)
-        return (False, False)
+"""
+The :mod:`movement` module provides Movement objects that describe
+a MapObject's movements. These can be used both for one-time movement
+or for routine movement.
+"""
+
+from librpg.pathfinding import PathSearch
+from librpg.hpa import ClusterSearch
+from librpg.config import game_config
+
+
+class Movement(object):
+
+    """
+    Movements are instructions for a MapObject to move.
+
+    Movements can be used on a MapObject in two ways: one is to push them
+    to the object's movement queue, which will make the object execute it
+    once, as soon as the others that are already in progress or enqueued
+    are done. The other way is to insert them into the object's behavior
+    to have it execute it as part of its cyclic routine movement.
+    """
+
+    def flow(self, obj):
+        """
+        *Abstract.*
+
+        Manipulate the object to have it moved.
+
+        Return True if the Movement is done and the next can be executed (right
+        after the MapObject's *movement_phase* becomes 0, that is, the object
+        stops. Return False if it requires more flow() calls to complete.
+        """
+        raise NotImplementedError('Movement.flow() is abstract')
+
+    def cancel(self):
+        """
+        *Virtual.*
+
+        Release whatever the Movement holds while in progress, such as
+        pending path searches, because it will not be flowed anymore.
+        """
+        pass
+
+    def is_idle(self):
+        """
+        *Virtual.*
+
+        Return whether flowing the Movement would never move the object,
+        so that the object may fall asleep. By default, False.
+        """
+        return False
+
+
+class WakingList(list):
+
+    """
+    A list of Movements that wakes its :attr:`owner`, a MapObject, when
+    Movements are added to it, so that an object that fell asleep for
+    lack of movements starts moving again.
+    """
+
+    owner = None
+
+    def added(self):
+        owner = self.owner
+        if owner is not None:
+            owner.wake()
+
+    def append(self, movement):
+        list.append(self, movement)
+        self.added()
+
+    def extend(self, movements):
+        list.extend(self, movements)
+        self.added()
+
+    def insert(self, index, movement):
+        list.insert(self, index, movement)
+        self.added()
+
+    def __iadd__(self, movements):
+        list.extend(self, movements)
+        self.added()
+        return self
+
+    def __setitem__(self, index, value):
+        list.__setitem__(self, index, value)
+        self.added()
+
+    def __setslice__(self, i, j, movements):
+        list.__setslice__(self, i, j, movements)
+        self.added()
+
+
+class MovementList(WakingList):
+
+    """
+    The list of Movements of *cycle*, a MovementCycle, which wakes the
+    cycle's owner when Movements are added to it.
+    """
+
+    def __init__(self, cycle, contents=()):
+        list.__init__(self, contents)
+        self.cycle = cycle
+
+    owner = property(lambda self: self.cycle.owner)
+
+
+class MovementQueue(Movement, WakingList):
+
+    """
+    A MovementQueue is the object that holds Movements waiting to be
+    executed. To fill it, either pass a list in its *contents* parameter
+    with the intended contents or append/extend Movements to it like
+    any other list.
+
+    MovementQueues may be inserted in MovementQueues, and will execute all
+    their contents before yielding control.
+
+    If its :attr:`owner` is set to a MapObject, as for the object's
+    scheduled_movement, adding Movements to the queue wakes the object.
+    """
+
+    def __init__(self, contents=None):
+        list.__init__(self)
+        if contents:
+            self.extend(contents)
+
+    def flow(self, obj):
+        if len(self) == 0:
+            return (True,)
+        first = self[0]
+        should_remove = first.flow(obj)[0]
+        if should_remove:
+            del self[0]
+        if len(self) == 0:
+            return (True, True)
+        else:
+            return (False, False)
+
+    def cancel(self):
+        for movement in self:
+            movement.cancel()
+
+    def is_idle(self):
+        return len(self) == 0
+
+    def clear(self):
+        self.cancel()
+        del self[:]
+
+
+class MovementCycle(Movement):
+
+    """
+    A MovementCycle holds Movements that are routinely executed. The
+    Movements are not removed from it when executed, but just passed,
+    and when the end of the MovementCycle is reached, it starts over.
+
+    To fill it, either pass a list in its *contents* parameter
+    with the intended contents or append/extend Movements to it like
+    any other list.
+
+    MovementCycles never yield control.
+
+    If its :attr:`owner` is set to a MapObject, as for the object's
+    movement_behavior, adding Movements to :attr:`movements` wakes the
+    object.
+    """
+
+    owner = None
+
+    def __init__(self, contents=None):
+        if contents is not None:
+            self.movements = contents
+        else:
+            self.movements = []
+        self.current = 0
+
+    def get_movements(self):
+        return self._movements
+
+    def set_movements(self, movements):
+        self._movements = MovementList(self, movements)
+        self._movements.added()
+
+    movements = property(get_movements, set_movements)
+
+    def flow(self, obj):
+        if len(self.movements) == 0:
+            return (False, False)
+        current = self.movements[self.current]
+        should_skip = current.flow(obj)[0]
+        if should_skip:
+            self.current = (self.current + 1) % len(self.movements)
+        return (False, False)
+
+    def cancel(self):
+        for movement in self.movements:
+            movement.cancel()
+
+    def is_idle(self):
+        return not self.movements
+
+
+class OneTileMovement(Movement):
+
+    """
+    Base class for one tile movements.
+    """
+
+    def __init__(self, direction, slide, back, tries):
+        """
+        *Constructor.*
+
+        If *slide* is True, the object will keep its stopped animation.
+
+        If *back* is True, the movement will be backwards.
+
+        If *tries* is None, the movement will be forced, that is, will
+        not yield control until it is executed.
+        """
+        self.direction = direction
+        self.slide = slide
+        self.back = back
+        if tries is None:
+            self.forced = True
+        else:
+            self.forced = False
+            self.tries_left = tries
+
+    def flow(self, obj):
+        done = obj.map.try_to_move_object(obj, self.direction,
+                                          slide=self.slide,
+                                          back=self.back)
+        if self.forced:
+            return (done, done)
+        elif done:
+            return (True, True)
+        elif self.tries_left:
+            self.tries_left -= 1
+            return (False, False)
+        else:
+            return (True, False)
+
+
+class Step(OneTileMovement):
+
+    """
+    Tries to make the object take one step to *direction*. Yields
+    control after the step worked or after *tries* frames have passed.
+
+    If *back* is True, the step will be backwards.
+    """
+
+    def __init__(self, direction, back=False, tries=2):
+        OneTileMovement.__init__(self, direction, False, back, tries)
+
+
+class Face(Movement):
+
+    """
+    Changes the object's facing to *direction* and immediately yields
+    control.
+    """
+
+    def __init__(self, direction):
+        self.direction = direction
+
+    def flow(self, obj):
+        obj.facing = self.direction
+        return (True, True)
+
+
+class Wait(Movement):
+
+    """
+    Waits *delay* frames before yielding control.
+    """
+
+    def __init__(self, delay):
+        self.initial_delay = delay
+        self.delay = delay
+
+    def flow(self, obj):
+        self.delay -= obj.flow_frames
+        if self.delay <= 0:
+            self.delay = self.initial_delay
+            return (True, True)
+        else:
+            return (False, False)
+
+
+class Slide(OneTileMovement):
+
+    """
+    Tries to make the object slide one tile to *direction*. Yields
+    control after the slide worked or after *tries* frames have passed.
+
+    If *back* is True, the slide will be backwards.
+    """
+
+    def __init__(self, direction, back=False, tries=2):
+        OneTileMovement.__init__(self, direction, True, back, tries)
+
+
+class ForcedStep(OneTileMovement):
+
+    """
+    Tries to make the object take one step to *direction*. Yields
+    control only when the step is taken.
+    """
+
+    def __init__(self, direction, back=False):
+        OneTileMovement.__init__(self, direction, False, back, tries=None)
+
+
+class ForcedSlide(OneTileMovement):
+
+    """
+    Tries to make the object slide one tile to *direction*. Yields
+    control only when the slide works.
+    """
+
+    def __init__(self, direction, back=False):
+        OneTileMovement.__init__(self, direction, True, back, tries=None)
+
+class PathMovement(Movement):
+
+    """
+    Walks the object to *dest* through the shortest path, avoiding the
+    tiles and obstacles on the way. Yields control when *dest* is reached
+    or when there is no way to reach it.
+
+    The path is calculated once and followed step by step. It is only
+    changed when the next step is blocked, in which case a detour to the
+    rest of the path is looked for before calculating a whole new path.
+
+    If game_config.pathfinding_hierarchical is set, whole paths are
+    planned with the map's ClusterGraph, and only detours are searched
+    cell by cell. If a pathfinding budget is set in game_config, whole
+    paths are searched by the map's PathScheduler over several frames,
+    while the object waits.
+    """
+
+    def __init__(self, mapmodel, obj, dest):
+        self.mapmodel = mapmodel
+        self.dest = dest
+        self.cur_step = None
+        self.path = None
+        self.cells = None
+        self.next = 0
+        self.expected = None
+        self.pending = None
+
+    def flow(self, obj):
+        if self.cur_step is None:
+            direction = self.next_direction(obj)
+            if direction is None:
+                if self.pending is not None:
+                    return (False, False)
+                return (True, True)
+            self.cur_step = Step(direction)
+
+        done, worked = self.cur_step.flow(obj)
+        if done:
+            self.cur_step = None
+            if worked:
+                self.next += 1
+                self.expected = obj.position
+                return (False, False)
+            else:
+                return (True, False)
+        return (False, False)
+
+    def next_direction(self, obj):
+        """
+        Return the direction of the next step to take along the path, or
+        None if *dest* was reached or cannot be reached, or if the path is
+        still being searched.
+        """
+        position = obj.position
+        if self.pending is not None:
+            if not self.pending.done:
+                return None
+            path, self.pending = self.pending.result, None
+            if not path:
+                return None
+            self.set_path(position, path)
+        elif self.path is None or position != self.expected:
+            if not self.plan(position) or self.pending is not None:
+                return None
+
+        if self.next >= len(self.path):
+            return None
+
+        direction = self.path[self.next]
+        if not self.mapmodel.can_move(position, position.step(direction),
+                                      direction):
+            if not self.repair(position):
+                if not self.plan(position) or self.pending is not None:
+                    return None
+            if self.next >= len(self.path):
+                return None
+            direction = self.path[self.next]
+        return direction
+
+    def plan(self, start):
+        """
+        Calculate a new path from *start*, returning False if there is
+        none. If pathfinding is time sliced, the search is only requested
+        to the map's PathScheduler and left pending.
+        """
+        self.path = None
+        if game_config.pathfinding_hierarchical:
+            search = ClusterSearch(self.mapmodel.get_cluster_graph(), start,
+                                   self.dest)
+        else:
+            search = PathSearch(self.mapmodel, start, self.dest)
+        if game_config.pathfinding_node_budget is not None or \
+           game_config.pathfinding_time_budget is not None:
+            self.pending = self.mapmodel.path_scheduler.request(search)
+            return True
+        path = search.calculate()
+        if not path:
+            return False
+        self.set_path(start, path)
+        return True
+
+    def repair(self, start):
+        """
+        Replace the blocked part of the path by a detour from *start* to
+        the first cell after it that is not occupied by an obstacle.
+        Return whether a detour was found.
+        """
+        object_layer = self.mapmodel.object_layer
+        for rejoin in xrange(self.next + 1, len(self.cells)):
+            if object_layer[self.cells[rejoin]].obstacle is None:
+                break
+        else:
+            return False
+
+        # When time slicing, a detour may not cost more than a frame
+        budget = game_config.pathfinding_node_budget
+        detour = PathSearch(self.mapmodel, start, self.cells[rejoin],
+                            max_expansions=budget).calculate()
+        if not detour:
+            return False
+        self.set_path(start, detour + self.path[rejoin + 1:])
+        return True
+
+    def cancel(self):
+        if self.pending is not None:
+            self.mapmodel.path_scheduler.cancel(self.pending)
+            self.pending = None
+        self.path = None
+        self.cur_step = None
+
+    def set_path(self, start, path):
+        self.path = path
+        self.cells = []
+        pos = start
+        for direction in path:
+            pos = pos.step(direction)
+            self.cells.append(pos)
+        self.next = 0
+        self.expected = start
+
+
+class FlowFieldMovement(Movement):
+
+    """
+    Takes one step towards *target*, which may be a MapObject or a
+    Position, along the map's flow field. Yields control after the step
+    is taken, or right away if the target was reached, cannot be reached
+    or every step towards it is blocked.
+
+    Unlike PathMovement, the objects using it share the flow field to the
+    same target, calculated once for all of them, which makes it suitable
+    for many objects chasing the party at once. Put it in a MovementCycle
+    to keep chasing.
+    """
+
+    def __init__(self, target):
+        self.target = target
+        self.cur_step = None
+
+    def flow(self, obj):
+        if self.cur_step is None:
+            goal = getattr(self.target, 'position', self.target)
+            if goal is None:
+                return (True, False)
+            field = obj.map.get_flow_field(goal)
+            direction = field.next_direction(obj.position)
+            if direction is None:
+                return (True, False)
+            self.cur_step = Step(direction)
+
+        done, worked = self.cur_step.flow(obj)
+        if done:
+            self.cur_step = None
+        return (done, worked)
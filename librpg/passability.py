@@ -0,0 +1,111 @@
+"""
+The :mod:`passability` module contains the PassabilityGrid, a compact
+representation of which sides of each map tile can be crossed, compiled
+from the terrain and scenario layers of a MapModel.
+"""
+
+from array import array
+
+from librpg.locals import UP, RIGHT, DOWN, LEFT
+from librpg.util import inverse
+
+
+class PassabilityGrid(object):
+
+    """
+    A PassabilityGrid stores, for each cell of a *width* x *height* map,
+    which of its four sides are closed.
+
+    Cells are identified by their index, y * width + x. A side is closed
+    when the tiles on that cell do not allow an object to leave the cell
+    through that side or to enter the cell through it. The sides facing
+    out of the map are always closed.
+
+    :attr:`width`
+        Grid width in cells.
+
+    :attr:`height`
+        Grid height in cells.
+
+    :attr:`cells`
+        array('B') with one byte per cell, in which bit (side - 1) is set
+        if the side is closed.
+
+    :attr:`occupied`
+        array('B') with one byte per cell, which is 1 if there is an
+        obstacle MapObject in the cell and 0 otherwise.
+
+    :attr:`version`
+        Number incremented whenever a cell's sides change, so that data
+        derived from the grid can tell when it is outdated.
+    """
+
+    SIDE_BIT = {UP: 1, RIGHT: 2, DOWN: 4, LEFT: 8}
+    ALL_SIDES = 15
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.cells = array('B', [0]) * (width * height)
+        self.occupied = array('B', [0]) * (width * height)
+        self.version = 0
+
+        # Offsets to add to a cell index to reach its neighbour.
+        self.offset = {UP: -width, RIGHT: 1, DOWN: width, LEFT: -1}
+
+    def index(self, x, y):
+        """
+        Return the index of the cell at (*x*, *y*).
+        """
+        return y * self.width + x
+
+    def coordinates(self, index):
+        """
+        Return the (x, y) coordinates of the cell with *index*.
+        """
+        return index % self.width, index / self.width
+
+    def set_closed_sides(self, x, y, closed):
+        """
+        Set the sides of the cell at (*x*, *y*) that are closed. *closed*
+        should be an iterable with the closed sides.
+        """
+        value = 0
+        for side in closed:
+            value |= PassabilityGrid.SIDE_BIT[side]
+        if x == 0:
+            value |= PassabilityGrid.SIDE_BIT[LEFT]
+        if x == self.width - 1:
+            value |= PassabilityGrid.SIDE_BIT[RIGHT]
+        if y == 0:
+            value |= PassabilityGrid.SIDE_BIT[UP]
+        if y == self.height - 1:
+            value |= PassabilityGrid.SIDE_BIT[DOWN]
+
+        i = y * self.width + x
+        if self.cells[i] != value:
+            self.cells[i] = value
+            self.version += 1
+
+    def set_occupied(self, x, y, occupied):
+        """
+        Set whether there is an obstacle in the cell at (*x*, *y*).
+        """
+        self.occupied[y * self.width + x] = 1 if occupied else 0
+
+    def is_closed(self, index, side):
+        """
+        Return whether the *side* of the cell with *index* is closed.
+        """
+        return self.cells[index] & PassabilityGrid.SIDE_BIT[side] != 0
+
+    def can_cross(self, index, direction):
+        """
+        Return whether the tiles allow moving from the cell with *index*
+        to its neighbour towards *direction*.
+        """
+        cells = self.cells
+        bit = PassabilityGrid.SIDE_BIT
+        return (not cells[index] & bit[direction] and
+                not cells[index + self.offset[direction]]
+                    & bit[inverse(direction)])
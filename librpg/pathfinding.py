@@ -0,0 +1,594 @@
+"""
+The :mod:`pathfinding` module finds paths between positions of a
+MapModel. It works on the cell indices of the map's PassabilityGrid
+rather than on Positions, so that no objects are created while
+searching.
+"""
+
+import time
+import heapq
+from array import array
+from collections import deque
+
+from librpg.locals import UP, RIGHT, DOWN, LEFT
+from librpg.passability import PassabilityGrid
+from librpg.config import game_config
+
+
+HORIZONTAL = (LEFT, RIGHT)
+VERTICAL = (UP, DOWN)
+OPPOSITE = {UP: DOWN, DOWN: UP, LEFT: RIGHT, RIGHT: LEFT}
+
+
+class PathSearch(object):
+
+    """
+    A PathSearch looks for the shortest path for an obstacle to walk from
+    *start* to *goal* in *mapmodel*, avoiding the closed sides of the
+    tiles and the cells occupied by obstacles.
+
+    If *jump_points* is True, Jump Point Search is used, which skips the
+    cells in the middle of straight corridors and open areas instead of
+    expanding each one of them. The paths found are as short as with
+    plain A*.
+
+    If *max_expansions* is given, the search gives up after expanding
+    that many cells, as if there were no path. With jump points, each
+    cell scanned while jumping counts as an expansion too.
+
+    Goals that cannot be reached according to the map's
+    ReachabilityIndex are given up at once.
+
+    If *jump_points* or *max_expansions* are not passed, the defaults in
+    game_config are used.
+
+    :attr:`done`
+        Whether the search is over.
+
+    :attr:`result`
+        List of directions from start to goal once the search is over,
+        or None if there is no path.
+    """
+
+    def __init__(self, mapmodel, start, goal, jump_points=None,
+                 max_expansions=None):
+        grid = mapmodel.passability
+        self.grid = grid
+        self.width = grid.width
+        self.cells = grid.cells
+        self.occupied = grid.occupied
+        self.offset = grid.offset
+
+        if jump_points is None:
+            jump_points = game_config.pathfinding_jump_points
+        if max_expansions is None:
+            max_expansions = game_config.pathfinding_max_expansions
+        self.jump_points = jump_points
+        self.max_expansions = max_expansions
+
+        self.reachability = getattr(mapmodel, 'reachability', None)
+        self.origin, self.destination = start, goal
+
+        self.start = grid.index(start[0], start[1])
+        self.goal = grid.index(goal[0], goal[1])
+        self.goal_x, self.goal_y = goal[0], goal[1]
+
+        self.g = {self.start: 0}
+        self.came_from = {self.start: (-1, None)}
+        self.open = [(self.h(self.start), self.h(self.start), 0,
+                      self.start)]
+        self.expansions = 0
+        self.jump_limit = None
+        self.done = False
+        self.result = None
+
+    def calculate(self):
+        """
+        Return a list with the directions to follow from start to goal,
+        or None if there is no path.
+        """
+        self.run()
+        return self.result
+
+    def run(self, expansions=None):
+        """
+        Go on with the search, expanding at most *expansions* cells, or as
+        many as needed if it is None. Return whether the search is over,
+        in which case the path found, or None, is in :attr:`result`.
+
+        This lets long searches be spread over several frames.
+        """
+        if self.done:
+            return True
+        if self.start == self.goal:
+            return self.finish([])
+        if self.occupied[self.goal]:
+            return self.finish(None)
+        reachability = self.reachability
+        if reachability is not None and not self.expansions and \
+           not reachability.reachable(self.origin, self.destination):
+            return self.finish(None)
+
+        open, g, came_from = self.open, self.g, self.came_from
+        heappush, heappop = heapq.heappush, heapq.heappop
+        max_expansions = self.max_expansions
+        pause = limit = None
+        if expansions is not None:
+            pause = limit = self.expansions + expansions
+        if max_expansions is not None and \
+           (limit is None or max_expansions + 1 < limit):
+            limit = max_expansions + 1
+        self.jump_limit = limit
+
+        while open:
+            if pause is not None and self.expansions >= pause:
+                return False
+            _, _, cost, current = heappop(open)
+            if cost > g[current]:
+                continue
+            if current == self.goal:
+                return self.finish(self.follow(current))
+
+            self.expansions += 1
+            if max_expansions is not None and \
+               self.expansions > max_expansions:
+                return self.finish(None)
+
+            for direction, successor in self.successors(current):
+                new_cost = cost + self.distance(current, successor)
+                if new_cost < g.get(successor, new_cost + 1):
+                    g[successor] = new_cost
+                    came_from[successor] = (current, direction)
+                    h = self.h(successor)
+                    heappush(open, (new_cost + h, h, new_cost, successor))
+
+        # The index let an unreachable goal through, so it is outdated
+        if reachability is not None and reachability.stale:
+            reachability.invalidate()
+        return self.finish(None)
+
+    def finish(self, result):
+        self.result = result
+        self.done = True
+        self.open = self.g = self.came_from = None
+        return True
+
+    def h(self, index):
+        """
+        Manhattan distance from the cell with *index* to the goal.
+        """
+        return (abs(index % self.width - self.goal_x) +
+                abs(index / self.width - self.goal_y))
+
+    def distance(self, a, b):
+        width = self.width
+        return abs(a % width - b % width) + abs(a / width - b / width)
+
+    def step(self, index, direction):
+        """
+        Return the index of the neighbour of the cell with *index* towards
+        *direction*, or -1 if it cannot be entered from that cell.
+        """
+        bit = PassabilityGrid.SIDE_BIT
+        cells = self.cells
+        if cells[index] & bit[direction]:
+            return -1
+        neighbour = index + self.offset[direction]
+        if cells[neighbour] & bit[OPPOSITE[direction]] or \
+           self.occupied[neighbour]:
+            return -1
+        return neighbour
+
+    def successors(self, index):
+        """
+        Return a list of (direction, cell index) pairs with the cells
+        that may follow the cell with *index* in the path.
+        """
+        if not self.jump_points:
+            result = []
+            for direction in (UP, RIGHT, DOWN, LEFT):
+                neighbour = self.step(index, direction)
+                if neighbour >= 0:
+                    result.append((direction, neighbour))
+            return result
+
+        arrived_with = self.came_from[index][1]
+        result = []
+        for direction in (UP, RIGHT, DOWN, LEFT):
+            if arrived_with is not None and \
+               direction == OPPOSITE[arrived_with]:
+                continue
+            jump_point = self.jump(index, direction)
+            if jump_point >= 0:
+                result.append((direction, jump_point))
+        return result
+
+    def jump(self, index, direction):
+        """
+        Walk from the cell with *index* towards *direction* and return the
+        first cell in which the path may have to turn, or -1 if a closed
+        side is reached first.
+
+        Each cell walked counts as an expansion. Once :attr:`jump_limit`
+        is reached, the cell walked into is returned, so that the search
+        stops there and goes on from it in its next run().
+        """
+        goal = self.goal
+        step = self.step
+        limit = self.jump_limit
+        if direction in HORIZONTAL:
+            sides = VERTICAL
+        else:
+            sides = HORIZONTAL
+
+        previous = index
+        current = step(previous, direction)
+        while current >= 0:
+            self.expansions += 1
+            if current == goal or \
+               (limit is not None and self.expansions >= limit):
+                return current
+            for side in sides:
+                if self.forced(previous, current, direction, side):
+                    return current
+            if direction in VERTICAL and \
+               (self.jump(current, LEFT) >= 0 or
+                self.jump(current, RIGHT) >= 0):
+                return current
+            previous, current = current, step(current, direction)
+        return -1
+
+    def forced(self, previous, current, direction, side):
+        """
+        Return whether, having moved from *previous* to *current* towards
+        *direction*, the neighbour of *current* towards *side* can only be
+        reached as fast by turning at *current*.
+        """
+        step = self.step
+        neighbour = step(current, side)
+        if neighbour < 0:
+            return False
+        detour = step(previous, side)
+        return detour < 0 or step(detour, direction) != neighbour
+
+    def follow(self, index):
+        """
+        Return the list of directions from start to the cell with *index*,
+        following the came_from links back from it.
+        """
+        width = self.width
+        path = []
+        came_from = self.came_from
+        parent, direction = came_from[index]
+        while parent >= 0:
+            length = (abs(index % width - parent % width) +
+                      abs(index / width - parent / width))
+            path.extend([direction] * length)
+            index = parent
+            parent, direction = came_from[index]
+        path.reverse()
+        return path
+
+
+class ReachabilityIndex(object):
+
+    """
+    A ReachabilityIndex labels the connected components of the cells of
+    a PassabilityGrid that are not occupied by obstacles, so that whether
+    a position can be reached from another can be told at once, without
+    searching.
+
+    The index is rebuilt when the tiles change and kept up to date as
+    obstacles move. Cells left by obstacles are joined to their
+    neighbours' components right away. Cells taken by obstacles might
+    split a component, which is only checked when the index is rebuilt,
+    so until then the index is :attr:`stale` and may tell that a cell is
+    reachable when it is not. It never tells that a reachable cell is
+    unreachable.
+
+    MapModels keep one in their reachability attribute, which PathSearch
+    checks before searching.
+
+    :attr:`stale`
+        Whether obstacles took cells since the index was built.
+    """
+
+    def __init__(self, grid):
+        self.grid = grid
+        self.parent = None
+        self.version = None
+        self.stale = False
+
+    def update(self):
+        """
+        Rebuild the index if the tiles changed or rebuild() was asked for.
+        """
+        if self.version != self.grid.version:
+            self.rebuild()
+
+    def rebuild(self):
+        """
+        Label the components again from scratch.
+        """
+        grid = self.grid
+        occupied = grid.occupied
+        size = grid.width * grid.height
+        parent = array('i', [-1]) * size
+        step = self.__step
+        for root in xrange(size):
+            if parent[root] >= 0:
+                continue
+            parent[root] = root
+            if occupied[root]:
+                continue
+            stack = [root]
+            while stack:
+                current = stack.pop()
+                for direction in (UP, RIGHT, DOWN, LEFT):
+                    neighbour = step(current, direction)
+                    if neighbour >= 0 and parent[neighbour] < 0:
+                        parent[neighbour] = root
+                        stack.append(neighbour)
+        self.parent = parent
+        self.version = grid.version
+        self.stale = False
+
+    def invalidate(self):
+        """
+        Have the index rebuilt before it is used again.
+        """
+        self.version = None
+
+    def __step(self, index, direction):
+        grid = self.grid
+        bit = PassabilityGrid.SIDE_BIT
+        cells = grid.cells
+        if cells[index] & bit[direction]:
+            return -1
+        neighbour = index + grid.offset[direction]
+        if cells[neighbour] & bit[OPPOSITE[direction]] or \
+           grid.occupied[neighbour]:
+            return -1
+        return neighbour
+
+    def find(self, index):
+        """
+        Return the index of the cell representing the component of the
+        cell with *index*.
+        """
+        parent = self.parent
+        root = index
+        while parent[root] != root:
+            root = parent[root]
+        while parent[index] != root:
+            parent[index], index = root, parent[index]
+        return root
+
+    def cell_freed(self, x, y):
+        """
+        Join the cell at (*x*, *y*), just left by an obstacle, to its
+        neighbours' components.
+        """
+        if self.version != self.grid.version:
+            return
+        index = self.grid.index(x, y)
+        parent = self.parent
+
+        # Only roots are joined: cells of other components may lead to
+        # their root through this one, so it keeps its own parent
+        for direction in (UP, RIGHT, DOWN, LEFT):
+            neighbour = self.__step(index, direction)
+            if neighbour >= 0:
+                root, neighbour_root = self.find(index), self.find(neighbour)
+                if root != neighbour_root:
+                    parent[neighbour_root] = root
+
+    def cell_taken(self, x, y):
+        """
+        Take the cell at (*x*, *y*), just entered by an obstacle, into
+        account.
+        """
+        self.stale = True
+
+    def reachable(self, start, goal):
+        """
+        Return whether an obstacle at the *start* position may be able to
+        walk to the *goal* position.
+        """
+        self.update()
+        grid = self.grid
+        start = grid.index(start[0], start[1])
+        goal = grid.index(goal[0], goal[1])
+        if start == goal:
+            return True
+        if grid.occupied[goal]:
+            return False
+        component = self.find(goal)
+        for direction in (UP, RIGHT, DOWN, LEFT):
+            neighbour = self.__step(start, direction)
+            if neighbour >= 0 and self.find(neighbour) == component:
+                return True
+        return False
+
+
+class PathScheduler(object):
+
+    """
+    A PathScheduler runs path searches a little at a time, so that long
+    searches are spread over several frames instead of making one of
+    them take too long.
+
+    Each frame, update() expands at most *node_budget* cells in total,
+    and stops after *time_budget* microseconds, if they are not None. The
+    budget is shared fairly by the pending searches, which take turns
+    expanding their share of it.
+
+    If *node_budget* or *time_budget* are not passed, the ones in
+    game_config are used.
+
+    MapModels have a PathScheduler in their path_scheduler attribute,
+    which their MapController updates every frame.
+    """
+
+    # Cells each search expands per turn when only time is limited
+    TIME_SLICE = 64
+
+    def __init__(self, node_budget=None, time_budget=None):
+        if node_budget is None:
+            node_budget = game_config.pathfinding_node_budget
+        if time_budget is None:
+            time_budget = game_config.pathfinding_time_budget
+        self.node_budget = node_budget
+        self.time_budget = time_budget
+        self.queue = deque()
+
+    def request(self, search):
+        """
+        Schedule *search*, a PathSearch, to be run and return it. Its
+        done attribute tells whether its result is ready.
+        """
+        self.queue.append(search)
+        return search
+
+    def cancel(self, search):
+        """
+        Drop *search* from the queue if it is still pending.
+        """
+        try:
+            self.queue.remove(search)
+        except ValueError:
+            pass
+
+    def update(self):
+        """
+        Spend a frame's budget running the pending searches.
+        """
+        queue = self.queue
+        nodes_left = self.node_budget
+        if self.time_budget is not None:
+            deadline = time.time() + self.time_budget / 1000000.0
+        while queue:
+            if nodes_left is None:
+                share = PathScheduler.TIME_SLICE
+            else:
+                share = max(1, nodes_left / len(queue))
+            search = queue.popleft()
+            before = search.expansions
+            if not search.run(share):
+                queue.append(search)
+            if nodes_left is not None:
+                nodes_left -= max(1, search.expansions - before)
+                if nodes_left <= 0:
+                    break
+            if self.time_budget is not None and time.time() >= deadline:
+                break
+
+
+class FlowField(object):
+
+    """
+    A FlowField holds the distance from every cell of *mapmodel* to the
+    *goal* position, so that any number of objects heading to that goal
+    can find their next step with a constant time lookup instead of
+    searching a path each.
+
+    Distances only account for the tiles, not for the objects on the map,
+    which makes the field valid until the map's passability changes.
+    Occupied cells are avoided when choosing the next step instead.
+
+    FlowFields are usually obtained with MapModel.get_flow_field(), which
+    shares them among all objects with the same goal and recalculates them
+    when needed.
+
+    :attr:`goal`
+        Index of the goal cell.
+
+    :attr:`version`
+        Version of the PassabilityGrid the field was calculated for.
+
+    :attr:`distance`
+        array('i') with the number of steps from each cell to the goal,
+        -1 if the goal cannot be reached from it.
+    """
+
+    def __init__(self, mapmodel, goal):
+        grid = mapmodel.passability
+        self.grid = grid
+        self.goal = grid.index(goal[0], goal[1])
+        self.version = None
+        self.distance = None
+        self.calculate()
+
+    def calculate(self):
+        """
+        Fill the distance array by walking back from the goal.
+        """
+        grid = self.grid
+        cells = grid.cells
+        offset = grid.offset
+        bit = PassabilityGrid.SIDE_BIT
+        distance = array('i', [-1]) * (grid.width * grid.height)
+        distance[self.goal] = 0
+
+        # For each direction, the bits that must be open for an object in
+        # a neighbour of the current cell to step into it.
+        backwards = [(offset[OPPOSITE[direction]], bit[direction],
+                      bit[OPPOSITE[direction]])
+                     for direction in (UP, RIGHT, DOWN, LEFT)]
+
+        queue = deque([self.goal])
+        popleft, append = queue.popleft, queue.append
+        while queue:
+            current = popleft()
+            next_distance = distance[current] + 1
+            for delta, side, neighbour_side in backwards:
+                if cells[current] & neighbour_side:
+                    continue
+                neighbour = current + delta
+                if distance[neighbour] < 0 and \
+                   not cells[neighbour] & side:
+                    distance[neighbour] = next_distance
+                    append(neighbour)
+
+        self.distance = distance
+        self.version = grid.version
+
+    def is_outdated(self):
+        """
+        Return whether the map's passability changed since the field was
+        calculated.
+        """
+        return self.version != self.grid.version
+
+    def distance_from(self, position):
+        """
+        Return the number of steps from *position* to the goal, or -1 if
+        it cannot be reached.
+        """
+        return self.distance[self.grid.index(position[0], position[1])]
+
+    def next_direction(self, position):
+        """
+        Return the direction of a step from *position* that gets closer to
+        the goal into a cell not occupied by an obstacle, or None if the
+        goal was reached, cannot be reached or all such steps are blocked
+        for now.
+        """
+        grid = self.grid
+        index = grid.index(position[0], position[1])
+        distance = self.distance
+        current = distance[index]
+        if current <= 0:
+            return None
+
+        cells, occupied = grid.cells, grid.occupied
+        bit = PassabilityGrid.SIDE_BIT
+        for direction in (UP, RIGHT, DOWN, LEFT):
+            if cells[index] & bit[direction]:
+                continue
+            neighbour = index + grid.offset[direction]
+            if distance[neighbour] == current - 1 and \
+               not occupied[neighbour] and \
+               not cells[neighbour] & bit[OPPOSITE[direction]]:
+                return direction
+        return None
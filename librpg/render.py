@@ -0,0 +1,69 @@
+"""
+The :mod:`render` module contains the RenderQueue, which gathers the
+blits meant for a Surface and does them with a single Surface.blits()
+call, rather than one Python-level blit() call each.
+"""
+
+import pygame
+
+from librpg.virtualscreen import get_screen
+
+
+def blits(target, sequence):
+    """
+    Blit each (source, dest) or (source, dest, area) or (source, dest,
+    area, special_flags) tuple in *sequence* onto *target*, in order.
+
+    This uses Surface.blits() when pygame has it, falling back to one
+    blit() call per tuple otherwise.
+    """
+    if hasattr(target, 'blits'):
+        target.blits(sequence, 0)
+    else:
+        for item in sequence:
+            target.blit(*item)
+
+
+class RenderQueue(object):
+
+    """
+    A RenderQueue collects blits meant for *target*, a Surface, and does
+    them all at once when flushed. *target* defaults to the screen
+    returned by get_screen() at the time of the flush.
+
+    It has a blit() method like a Surface's, so it may be passed instead
+    of the screen to code that only blits onto it, such as
+    Widget.render(). Blits are done in the order they were queued, so
+    anything drawn directly onto the target after queueing should wait
+    for flush().
+    """
+
+    def __init__(self, target=None):
+        self.target = target
+        self.items = []
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        """
+        Queue blitting *source* at *dest*, with the same parameters as
+        Surface.blit().
+        """
+        if special_flags:
+            self.items.append((source, dest, area, special_flags))
+        elif area is not None:
+            self.items.append((source, dest, area))
+        else:
+            self.items.append((source, dest))
+
+    def flush(self):
+        """
+        Do the queued blits and empty the queue.
+        """
+        if self.items:
+            target = self.target
+            if target is None:
+                target = get_screen()
+            blits(target, self.items)
+            self.items = []
+
+    def __len__(self):
+        return len(self.items)
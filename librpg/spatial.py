@@ -0,0 +1,212 @@
+"""
+The :mod:`spatial` module contains the SpatialIndex, which finds the
+MapObjects in a region of a map without going through all of them, and
+the DepthOrder, which keeps them in the order they are drawn.
+"""
+
+import bisect
+import itertools
+
+from librpg.util import OrderedSet
+
+
+class SpatialIndex(object):
+
+    """
+    A SpatialIndex keeps the objects of a *width* x *height* map in a
+    grid of square buckets of *bucket_size* tiles, so that queries only
+    look at the buckets overlapping the region asked for. Their cost
+    depends on the number of objects around that region rather than on
+    the number of objects in the map.
+
+    MapModels keep one in their spatial_index attribute, updated when
+    objects are added, moved, teleported and removed, and offer its
+    queries as methods.
+
+    :attr:`bucket_size`
+        Width and height of the buckets, in tiles.
+    """
+
+    BUCKET_SIZE = 8
+
+    def __init__(self, width, height, bucket_size=None):
+        if bucket_size is None:
+            bucket_size = SpatialIndex.BUCKET_SIZE
+        self.width = width
+        self.height = height
+        self.bucket_size = bucket_size
+        self.buckets_wide = (width + bucket_size - 1) / bucket_size
+        self.buckets_high = (height + bucket_size - 1) / bucket_size
+        self.buckets = [OrderedSet() for i in xrange(self.buckets_wide *
+                                           self.buckets_high)]
+
+    def __bucket(self, position):
+        size = self.bucket_size
+        return self.buckets[position[1] / size * self.buckets_wide +
+                            position[0] / size]
+
+    def move(self, obj, old_pos, new_pos):
+        """
+        Update the index after *obj* moved from *old_pos* to *new_pos*,
+        either of which may be None if the object was added or removed.
+        """
+        if old_pos is not None:
+            old_bucket = self.__bucket(old_pos)
+        else:
+            old_bucket = None
+        if new_pos is not None:
+            new_bucket = self.__bucket(new_pos)
+        else:
+            new_bucket = None
+        if old_bucket is not new_bucket:
+            if old_bucket is not None:
+                old_bucket.remove(obj)
+            if new_bucket is not None:
+                new_bucket.add(obj)
+
+    def objects_in_rect(self, rect):
+        """
+        Return a list with the objects inside *rect* == (left, top, width,
+        height), in tiles.
+        """
+        left, top, width, height = rect
+        right, bottom = left + width, top + height
+        size = self.bucket_size
+        result = []
+        for by in xrange(max(0, top / size),
+                         min(self.buckets_high, (bottom - 1) / size + 1)):
+            row = by * self.buckets_wide
+            for bx in xrange(max(0, left / size),
+                             min(self.buckets_wide, (right - 1) / size + 1)):
+                for obj in self.buckets[row + bx]:
+                    x, y = obj.position
+                    if left <= x < right and top <= y < bottom:
+                        result.append(obj)
+        return result
+
+    def objects_in_radius(self, position, radius):
+        """
+        Return a list with the objects at most *radius* tiles away from
+        *position*, in a straight line.
+        """
+        cx, cy = position
+        square = radius * radius
+        result = []
+        for obj in self.objects_in_rect((cx - radius, cy - radius,
+                                         2 * radius + 1, 2 * radius + 1)):
+            x, y = obj.position
+            if (x - cx) * (x - cx) + (y - cy) * (y - cy) <= square:
+                result.append(obj)
+        return result
+
+    def nearest_object(self, position, predicate=None, max_distance=None):
+        """
+        Return the object closest to *position* in a straight line for
+        which *predicate*, a function taking the object, returns True, or
+        None if there is none within *max_distance* tiles.
+
+        If *predicate* is None, any object will do. Objects at *position*
+        count as well.
+        """
+        cx, cy = position
+        size = self.bucket_size
+        bx, by = cx / size, cy / size
+        best, best_distance = None, None
+        if max_distance is not None:
+            best_distance = max_distance * max_distance
+        max_ring = max(self.buckets_wide, self.buckets_high)
+
+        for ring in xrange(max_ring):
+            # Buckets in this ring are at least this far along some axis
+            nearest = max(0, (ring - 1) * size)
+            if best_distance is not None and \
+               nearest * nearest > best_distance:
+                break
+            for obj in self.__ring(bx, by, ring):
+                x, y = obj.position
+                distance = (x - cx) * (x - cx) + (y - cy) * (y - cy)
+                if best_distance is not None and \
+                   (distance > best_distance or
+                    distance == best_distance and best is not None):
+                    continue
+                if predicate is None or predicate(obj):
+                    best, best_distance = obj, distance
+        return best
+
+    def __ring(self, bx, by, ring):
+        # Yield the objects in the buckets *ring* buckets away from
+        # (bx, by) along either axis
+        wide, high = self.buckets_wide, self.buckets_high
+        for y in xrange(by - ring, by + ring + 1):
+            if y < 0 or y >= high:
+                continue
+            if y == by - ring or y == by + ring:
+                columns = xrange(bx - ring, bx + ring + 1)
+            else:
+                columns = (bx - ring, bx + ring)
+            for x in columns:
+                if 0 <= x < wide:
+                    for obj in self.buckets[y * wide + x]:
+                        yield obj
+
+
+class DepthOrder(object):
+
+    """
+    A DepthOrder keeps the MapObjects of a map sorted in the order they
+    are drawn: by layer, then by row, then by column, then in the order
+    they were added. It is updated as objects move, so that the objects
+    in a region are found in order without sorting the whole map every
+    frame.
+
+    MapModels keep one in their depth_order attribute, updated along with
+    their spatial_index.
+    """
+
+    BELOW, OBSTACLE, ABOVE = 0, 1, 2
+
+    def __init__(self):
+        self.entries = []
+        self.object_entries = {}
+        self.counter = itertools.count()
+
+    def layer(self, obj):
+        """
+        Return the layer *obj* is drawn in: BELOW, OBSTACLE or ABOVE.
+        """
+        if obj.is_below():
+            return DepthOrder.BELOW
+        elif obj.is_obstacle():
+            return DepthOrder.OBSTACLE
+        else:
+            return DepthOrder.ABOVE
+
+    def move(self, obj, old_pos, new_pos):
+        """
+        Update the order after *obj* moved from *old_pos* to *new_pos*,
+        either of which may be None if the object was added or removed.
+        """
+        entries = self.entries
+        entry = self.object_entries.pop(obj, None)
+        if entry is not None:
+            del entries[bisect.bisect_left(entries, entry)]
+            seq = entry[3]
+        else:
+            seq = self.counter.next()
+        if new_pos is not None:
+            entry = (self.layer(obj), new_pos[1], new_pos[0], seq, obj)
+            bisect.insort(entries, entry)
+            self.object_entries[obj] = entry
+
+    def objects_in_rect(self, layer, rect):
+        """
+        Return a list with the objects of *layer* inside *rect* == (left,
+        top, width, height), in tiles, in the order they are drawn.
+        """
+        left, top, width, height = rect
+        right = left + width
+        entries = self.entries
+        first = bisect.bisect_left(entries, (layer, top))
+        last = bisect.bisect_left(entries, (layer, top + height), first)
+        return [entry[4] for entry in entries[first:last]
+                if left <= entry[2] < right]
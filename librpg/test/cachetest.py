@@ -0,0 +1,200 @@
+import unittest
+from array import array
+
+from librpg.loader import (resource_memory, Loader, TemporalCache,
+                           FrequencyCache)
+
+
+def resource(size):
+    """
+    Return a resource taking *size* bytes.
+    """
+    return array('B', [0]) * size
+
+
+class FakeSurface(object):
+
+    def get_bytesize(self):
+        return 4
+
+    def get_width(self):
+        return 10
+
+    def get_height(self):
+        return 3
+
+
+class Measured(object):
+
+    def get_memory(self):
+        return 123
+
+
+class ResourceMemoryTest(unittest.TestCase):
+
+    def test_arrays(self):
+        self.assertEqual(resource_memory(array('B', [0]) * 10), 10)
+        self.assertEqual(resource_memory(array('H', [0]) * 10), 20)
+
+    def test_surfaces(self):
+        self.assertEqual(resource_memory(FakeSurface()), 120)
+
+    def test_get_memory(self):
+        self.assertEqual(resource_memory(Measured()), 123)
+
+    def test_sequences(self):
+        self.assertEqual(resource_memory((resource(5), [resource(7),
+                                                        Measured()])),
+                         135)
+
+    def test_unknown(self):
+        self.assertEqual(resource_memory('string'), 0)
+        self.assertEqual(resource_memory(object()), 0)
+
+
+class CacheTest(unittest.TestCase):
+
+    def use(self, cache, *names):
+        for name in names:
+            kept = cache.get(name)
+            if kept is None:
+                kept = resource(1)
+            cache.update_used(name, kept)
+
+    def kept(self, cache, names):
+        return [name for name in names if cache.lookup(name) is not None]
+
+
+class TemporalCacheTest(CacheTest):
+
+    def test_evicts_least_recently_used(self):
+        cache = TemporalCache(3)
+        self.use(cache, 'a', 'b', 'c', 'a', 'd')
+        self.assertEqual(self.kept(cache, 'abcd'), ['a', 'c', 'd'])
+        self.use(cache, 'e')
+        self.assertEqual(self.kept(cache, 'abcde'), ['a', 'd', 'e'])
+        self.assertEqual(cache.evictions, 2)
+
+    def test_memory_budget(self):
+        cache = TemporalCache(None, memory_budget=10)
+        cache.update_used('a', resource(4))
+        cache.update_used('b', resource(4))
+        self.assertEqual(cache.memory, 8)
+        cache.update_used('c', resource(4))
+        self.assertEqual(self.kept(cache, 'abc'), ['b', 'c'])
+        self.assertEqual(cache.memory, 8)
+
+        # A resource that grew is measured again
+        cache.update_used('b', resource(6))
+        self.assertEqual(self.kept(cache, 'abc'), ['b', 'c'])
+        self.assertEqual(cache.memory, 10)
+
+        # The resource used last is kept even if it alone is too big
+        cache.update_used('d', resource(20))
+        self.assertEqual(self.kept(cache, 'abcd'), ['d'])
+        self.assertEqual(cache.memory, 20)
+        self.assertEqual(cache.evictions, 3)
+
+    def test_counters(self):
+        cache = TemporalCache(2)
+        self.use(cache, 'a', 'b', 'a', 'c', 'b')
+        self.assertEqual(cache.get_stats(),
+                         {'hits': 1, 'misses': 4, 'evictions': 2,
+                          'resources': 2, 'memory': 2})
+
+    def test_discard_and_clear(self):
+        cache = TemporalCache(3)
+        self.use(cache, 'a', 'b')
+        cache.discard('a')
+        cache.discard('z')
+        self.assertEqual(self.kept(cache, 'ab'), ['b'])
+        self.assertEqual(cache.memory, 1)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.memory, 0)
+
+
+class FrequencyCacheTest(CacheTest):
+
+    def test_evicts_least_frequently_used(self):
+        cache = FrequencyCache(3)
+        self.use(cache, 'a', 'a', 'a', 'b', 'b', 'c', 'd')
+        self.assertEqual(self.kept(cache, 'abcd'), ['a', 'b', 'd'])
+        self.use(cache, 'd', 'd', 'e')
+        self.assertEqual(self.kept(cache, 'abcde'), ['a', 'd', 'e'])
+        self.assertEqual(cache.evictions, 2)
+
+    def test_ties_evict_least_recently_used(self):
+        cache = FrequencyCache(3)
+        self.use(cache, 'a', 'b', 'c', 'b', 'a', 'c', 'd')
+        self.assertEqual(self.kept(cache, 'abcd'), ['a', 'c', 'd'])
+
+    def test_memory_budget(self):
+        cache = FrequencyCache(None, memory_budget=10)
+        cache.update_used('a', resource(4))
+        cache.update_used('a', resource(4))
+        cache.update_used('b', resource(4))
+        cache.update_used('c', resource(4))
+        self.assertEqual(self.kept(cache, 'abc'), ['a', 'c'])
+        self.assertEqual(cache.memory, 8)
+
+        # A resource that grew makes room for itself
+        cache.update_used('c', resource(9))
+        self.assertEqual(self.kept(cache, 'abc'), ['c'])
+        self.assertEqual(cache.memory, 9)
+        self.assertEqual(cache.evictions, 2)
+
+    def test_counters(self):
+        cache = FrequencyCache(2)
+        self.use(cache, 'a', 'a', 'b', 'c', 'a')
+        self.assertEqual(cache.get_stats(),
+                         {'hits': 2, 'misses': 3, 'evictions': 1,
+                          'resources': 2, 'memory': 2})
+
+    def test_without_aging_counts_stay(self):
+        cache = FrequencyCache(2, aging_period=None)
+        self.use(cache, *(['a'] * 50))
+        for i in xrange(100):
+            self.use(cache, 'b%d' % i, 'b%d' % i)
+        self.assertEqual(self.kept(cache, ['a']), ['a'])
+
+    def test_aging(self):
+        cache = FrequencyCache(2, aging_period=10)
+        self.use(cache, *(['a'] * 50))
+        for i in xrange(100):
+            self.use(cache, 'b%d' % i, 'b%d' % i)
+        self.assertEqual(self.kept(cache, ['a']), [])
+
+    def test_aging_keeps_order(self):
+        cache = FrequencyCache(3, aging_period=8)
+        self.use(cache, 'a', 'a', 'a', 'b', 'b', 'c', 'c')
+        # The eighth use halves all counts: a 3 -> 1, b 2 -> 1, c 3 -> 1.
+        # b, which had the lowest count, is discarded first.
+        self.use(cache, 'c')
+        self.assertEqual(cache.counts, {'a': 1, 'b': 1, 'c': 1})
+        self.use(cache, 'd')
+        self.assertEqual(self.kept(cache, 'abcd'), ['a', 'c', 'd'])
+
+
+class StringLoader(Loader):
+
+    def actual_load(self, name):
+        return resource(len(name))
+
+
+class LoaderTest(unittest.TestCase):
+
+    def test_stats(self):
+        loader = StringLoader([TemporalCache(2), FrequencyCache(2)])
+        for name in ['a', 'bb', 'a', 'ccc', 'dddd', 'a']:
+            loader.load(name)
+        stats = loader.get_stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['waits']),
+                         (2, 4, 0))
+        # Both caches keep 'a' and 'dddd', which are counted once
+        self.assertEqual(stats['memory'], 1 + 4)
+        self.assertEqual(stats['evictions'], 3 + 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,160 @@
+import random
+import unittest
+
+from librpg.util import OrderedSet
+
+
+class OrderedSetTest(unittest.TestCase):
+
+    def setUp(self):
+        self.rnd = random.Random(0)
+
+    def check(self, ordered_set, expected):
+        self.assertEqual(list(ordered_set), expected)
+        self.assertEqual(len(ordered_set), len(expected))
+        for item in expected:
+            self.assertTrue(item in ordered_set)
+
+    def test_against_list(self):
+        for seed in xrange(20):
+            self.rnd.seed(seed)
+            ordered_set, expected = OrderedSet(), []
+            for i in xrange(300):
+                item = self.rnd.randrange(30)
+                if self.rnd.random() < 0.5:
+                    ordered_set.add(item)
+                    if item not in expected:
+                        expected.append(item)
+                else:
+                    ordered_set.discard(item)
+                    if item in expected:
+                        expected.remove(item)
+                if i % 10 == 0:
+                    self.check(ordered_set, expected)
+            self.check(ordered_set, expected)
+
+    def test_remove_missing(self):
+        ordered_set = OrderedSet([1, 2])
+        self.assertRaises(KeyError, ordered_set.remove, 3)
+        ordered_set.remove(1)
+        self.assertRaises(KeyError, ordered_set.remove, 1)
+        self.check(ordered_set, [2])
+
+    def test_holes_are_compacted(self):
+        ordered_set = OrderedSet(range(10))
+        for item in xrange(5):
+            ordered_set.discard(item)
+        self.assertEqual(ordered_set.holes, 5)
+        # Outside iterations, holes are dropped once they outnumber items
+        ordered_set.discard(5)
+        self.assertEqual(ordered_set.holes, 0)
+        self.assertEqual(len(ordered_set.items), 4)
+        # Otherwise, at the next iteration
+        ordered_set.discard(6)
+        self.assertEqual(ordered_set.holes, 1)
+        self.check(ordered_set, [7, 8, 9])
+        self.assertEqual(ordered_set.holes, 0)
+        self.assertEqual(ordered_set.items, [7, 8, 9])
+
+    def test_mutation_during_iteration(self):
+        for seed in xrange(50):
+            self.rnd.seed(seed)
+            rnd = self.rnd
+            start = rnd.sample(xrange(40), 20)
+            ordered_set = OrderedSet(start)
+            removed, added, seen = set(), [], []
+            # Items seen since they were last added, which must not be
+            # seen again
+            current = set()
+            for item in ordered_set:
+                self.assertTrue(item in ordered_set)
+                self.assertFalse(item in current)
+                current.add(item)
+                seen.append(item)
+                for i in xrange(rnd.randint(0, 3)):
+                    other = rnd.randrange(60)
+                    if rnd.random() < 0.6:
+                        ordered_set.discard(other)
+                        current.discard(other)
+                        removed.add(other)
+                        if other in added:
+                            added.remove(other)
+                    elif other not in ordered_set:
+                        ordered_set.add(other)
+                        added.append(other)
+                # Holes are kept while the set is being iterated over
+                self.assertEqual(ordered_set.iterating, 1)
+
+            # Items there all along were seen in order, and so were those
+            # added and still there, which now come after them
+            kept = [item for item in start if item not in removed]
+            self.assertEqual([item for item in seen if item in kept], kept)
+            for item in added:
+                self.assertTrue(item in seen)
+            expected = kept + added
+            self.assertEqual(ordered_set.iterating, 0)
+            self.check(ordered_set, expected)
+            self.assertEqual(ordered_set.holes, 0)
+            self.assertEqual(ordered_set.items, expected)
+
+    def test_add_after_removals_during_iteration(self):
+        # Removing most items leaves more holes than items, which must
+        # not be compacted away from under the iteration
+        ordered_set = OrderedSet(range(10))
+        seen = []
+        for item in ordered_set:
+            seen.append(item)
+            if item == 0:
+                for other in xrange(1, 9):
+                    ordered_set.discard(other)
+                ordered_set.add(10)
+        self.assertEqual(seen, [0, 9, 10])
+        self.check(ordered_set, [0, 9, 10])
+
+    def test_remove_current_item(self):
+        ordered_set = OrderedSet(range(10))
+        seen = []
+        for item in ordered_set:
+            seen.append(item)
+            ordered_set.remove(item)
+        self.assertEqual(seen, range(10))
+        self.check(ordered_set, [])
+
+    def test_nested_iteration(self):
+        ordered_set = OrderedSet(range(6))
+        pairs = []
+        for first in ordered_set:
+            for second in ordered_set:
+                pairs.append((first, second))
+                if second == 5 and first != 5:
+                    ordered_set.discard(first)
+        self.assertEqual(pairs[:6], [(0, i) for i in xrange(6)])
+        self.assertEqual(pairs[6:11], [(1, i) for i in xrange(1, 6)])
+        self.check(ordered_set, [5])
+        self.assertEqual(ordered_set.items, [5])
+
+    def test_break_ends_iteration(self):
+        ordered_set = OrderedSet(range(5))
+        for item in ordered_set:
+            if item == 2:
+                break
+        self.assertEqual(ordered_set.iterating, 0)
+        ordered_set.discard(0)
+        self.check(ordered_set, [1, 2, 3, 4])
+        self.assertEqual(ordered_set.holes, 0)
+
+    def test_clear_during_iteration(self):
+        ordered_set = OrderedSet(range(5))
+        seen = []
+        for item in ordered_set:
+            seen.append(item)
+            if item == 1:
+                ordered_set.clear()
+        self.assertEqual(seen, [0, 1])
+        self.check(ordered_set, [])
+        ordered_set.add(7)
+        self.check(ordered_set, [7])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,273 @@
+import random
+import unittest
+from collections import deque
+
+from librpg.locals import UP, RIGHT, DOWN, LEFT
+from librpg.util import Position
+from librpg.passability import PassabilityGrid
+from librpg.pathfinding import PathSearch, ReachabilityIndex, FlowField
+
+
+SEEDS = range(100)
+
+
+class GridMap(object):
+
+    """
+    Stands for a MapModel with a random PassabilityGrid, in which each
+    side of each cell is closed with probability *p_side* and each cell
+    is closed altogether with probability *p_block*.
+    """
+
+    def __init__(self, rnd, width, height, p_side, p_block):
+        self.width, self.height = width, height
+        self.passability = PassabilityGrid(width, height)
+        for y in xrange(height):
+            for x in xrange(width):
+                if rnd.random() < p_block:
+                    closed = (UP, RIGHT, DOWN, LEFT)
+                else:
+                    closed = [side for side in (UP, RIGHT, DOWN, LEFT)
+                              if rnd.random() < p_side]
+                self.passability.set_closed_sides(x, y, closed)
+
+    def random_position(self, rnd):
+        return Position(rnd.randrange(self.width), rnd.randrange(self.height))
+
+
+def random_map(seed):
+    rnd = random.Random(seed)
+    mapmodel = GridMap(rnd, rnd.randint(2, 30), rnd.randint(2, 30),
+                       rnd.choice([0, 0.05, 0.15]),
+                       rnd.choice([0, 0.1, 0.3]))
+    return rnd, mapmodel
+
+
+def bfs_distances(grid, start, obstacles=True):
+    """
+    Return a dict mapping the index of each cell an obstacle at *start*
+    can walk to, to the number of steps it takes. If *obstacles* is
+    False, occupied cells are walked through.
+    """
+    start = grid.index(start[0], start[1])
+    distance = {start: 0}
+    queue = deque([start])
+    while queue:
+        current = queue.popleft()
+        for direction in (UP, RIGHT, DOWN, LEFT):
+            if not grid.can_cross(current, direction):
+                continue
+            neighbour = current + grid.offset[direction]
+            if neighbour not in distance and \
+               not (obstacles and grid.occupied[neighbour]):
+                distance[neighbour] = distance[current] + 1
+                queue.append(neighbour)
+    return distance
+
+
+def walk(grid, start, path):
+    """
+    Follow *path* from *start*, checking each step is allowed, and
+    return the index of the cell reached.
+    """
+    current = grid.index(start[0], start[1])
+    for direction in path:
+        assert grid.can_cross(current, direction)
+        current += grid.offset[direction]
+        assert not grid.occupied[current]
+    return current
+
+
+class PathSearchTest(unittest.TestCase):
+
+    def check_optimal(self, jump_points):
+        for seed in SEEDS:
+            rnd, mapmodel = random_map(seed)
+            grid = mapmodel.passability
+            for i in xrange(5):
+                start = mapmodel.random_position(rnd)
+                goal = mapmodel.random_position(rnd)
+                expected = bfs_distances(grid, start).get(
+                    grid.index(goal.x, goal.y))
+                path = PathSearch(mapmodel, start, goal,
+                                  jump_points=jump_points).calculate()
+                if expected is None:
+                    self.assertEqual(path, None, (seed, start, goal))
+                else:
+                    self.assertNotEqual(path, None, (seed, start, goal))
+                    self.assertEqual(len(path), expected,
+                                     (seed, start, goal))
+                    self.assertEqual(walk(grid, start, path),
+                                     grid.index(goal.x, goal.y))
+
+    def test_astar_optimal(self):
+        self.check_optimal(jump_points=False)
+
+    def test_jump_points_optimal(self):
+        self.check_optimal(jump_points=True)
+
+    def test_avoids_obstacles(self):
+        for seed in SEEDS:
+            rnd, mapmodel = random_map(seed)
+            grid = mapmodel.passability
+            for i in xrange(mapmodel.width * mapmodel.height / 5):
+                position = mapmodel.random_position(rnd)
+                grid.set_occupied(position.x, position.y, True)
+            start = mapmodel.random_position(rnd)
+            goal = mapmodel.random_position(rnd)
+            if start == goal:
+                continue
+            expected = bfs_distances(grid, start).get(
+                grid.index(goal.x, goal.y))
+            for jump_points in (False, True):
+                path = PathSearch(mapmodel, start, goal,
+                                  jump_points=jump_points).calculate()
+                if expected is None:
+                    self.assertEqual(path, None, (seed, start, goal))
+                else:
+                    self.assertNotEqual(path, None, (seed, start, goal))
+                    self.assertEqual(len(path), expected,
+                                     (seed, start, goal))
+                    walk(grid, start, path)
+
+
+class ReachabilityIndexTest(unittest.TestCase):
+
+    def check_pairs(self, rnd, mapmodel, index, exact):
+        grid = mapmodel.passability
+        for i in xrange(5):
+            start = mapmodel.random_position(rnd)
+            reachable = bfs_distances(grid, start)
+            for j in xrange(5):
+                goal = mapmodel.random_position(rnd)
+                expected = grid.index(goal.x, goal.y) in reachable
+                answer = index.reachable(start, goal)
+                if exact:
+                    self.assertEqual(answer, expected, (start, goal))
+                elif expected:
+                    self.assertTrue(answer, (start, goal))
+
+    def test_rebuilt_index_is_exact(self):
+        for seed in SEEDS:
+            rnd, mapmodel = random_map(seed)
+            grid = mapmodel.passability
+            for i in xrange(mapmodel.width * mapmodel.height / 5):
+                position = mapmodel.random_position(rnd)
+                grid.set_occupied(position.x, position.y, True)
+            index = ReachabilityIndex(grid)
+            self.check_pairs(rnd, mapmodel, index, exact=True)
+
+    def test_no_false_negatives_while_obstacles_move(self):
+        for seed in SEEDS:
+            rnd, mapmodel = random_map(seed)
+            grid = mapmodel.passability
+            index = ReachabilityIndex(grid)
+            mapmodel.reachability = index
+            obstacles = set()
+            for i in xrange(mapmodel.width * mapmodel.height / 4):
+                position = mapmodel.random_position(rnd)
+                grid.set_occupied(position.x, position.y, True)
+                obstacles.add((position.x, position.y))
+            index.rebuild()
+
+            for step in xrange(20):
+                # Move a few obstacles to random free cells
+                for i in xrange(3):
+                    if not obstacles:
+                        break
+                    x, y = rnd.choice(sorted(obstacles))
+                    new = mapmodel.random_position(rnd)
+                    if grid.occupied[grid.index(new.x, new.y)]:
+                        continue
+                    obstacles.remove((x, y))
+                    grid.set_occupied(x, y, False)
+                    index.cell_freed(x, y)
+                    obstacles.add((new.x, new.y))
+                    grid.set_occupied(new.x, new.y, True)
+                    index.cell_taken(new.x, new.y)
+                self.check_pairs(rnd, mapmodel, index, exact=False)
+
+                # PathSearch must not give up on a reachable goal
+                start = mapmodel.random_position(rnd)
+                goal = mapmodel.random_position(rnd)
+                expected = bfs_distances(grid, start).get(
+                    grid.index(goal.x, goal.y))
+                path = PathSearch(mapmodel, start, goal).calculate()
+                if expected is None:
+                    self.assertEqual(path, None, (seed, start, goal))
+                else:
+                    self.assertNotEqual(path, None, (seed, start, goal))
+                    self.assertEqual(len(path), expected,
+                                     (seed, start, goal))
+
+            index.rebuild()
+            self.check_pairs(rnd, mapmodel, index, exact=True)
+
+
+class FlowFieldTest(unittest.TestCase):
+
+    def test_distances(self):
+        for seed in SEEDS:
+            rnd, mapmodel = random_map(seed)
+            grid = mapmodel.passability
+            goal = mapmodel.random_position(rnd)
+            field = FlowField(mapmodel, goal)
+            # Sides close both ways, so the distances from every cell to
+            # the goal are those from the goal to every cell
+            expected = bfs_distances(grid, goal, obstacles=False)
+            for y in xrange(mapmodel.height):
+                for x in xrange(mapmodel.width):
+                    self.assertEqual(field.distance_from(Position(x, y)),
+                                     expected.get(grid.index(x, y), -1),
+                                     (seed, goal, x, y))
+
+    def test_next_direction(self):
+        for seed in SEEDS:
+            rnd, mapmodel = random_map(seed)
+            grid = mapmodel.passability
+            goal = mapmodel.random_position(rnd)
+            field = FlowField(mapmodel, goal)
+            goal_index = grid.index(goal.x, goal.y)
+            for i in xrange(10):
+                start = mapmodel.random_position(rnd)
+                distance = field.distance_from(start)
+                position, steps = start, 0
+                direction = field.next_direction(position)
+                while direction is not None:
+                    self.assertTrue(grid.can_cross(
+                        grid.index(position.x, position.y), direction))
+                    position = position.step(direction)
+                    steps += 1
+                    direction = field.next_direction(position)
+                if distance < 0:
+                    self.assertEqual(steps, 0)
+                else:
+                    self.assertEqual(steps, distance, (seed, start, goal))
+                    self.assertEqual(grid.index(position.x, position.y),
+                                     goal_index)
+
+    def test_next_direction_avoids_obstacles(self):
+        for seed in SEEDS:
+            rnd, mapmodel = random_map(seed)
+            grid = mapmodel.passability
+            goal = mapmodel.random_position(rnd)
+            field = FlowField(mapmodel, goal)
+            for i in xrange(mapmodel.width * mapmodel.height / 3):
+                position = mapmodel.random_position(rnd)
+                grid.set_occupied(position.x, position.y, True)
+            for y in xrange(mapmodel.height):
+                for x in xrange(mapmodel.width):
+                    position = Position(x, y)
+                    direction = field.next_direction(position)
+                    if direction is None:
+                        continue
+                    index = grid.index(x, y)
+                    neighbour = index + grid.offset[direction]
+                    self.assertTrue(grid.can_cross(index, direction))
+                    self.assertFalse(grid.occupied[neighbour])
+                    self.assertEqual(field.distance[neighbour],
+                                     field.distance[index] - 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,265 @@
+import random
+import unittest
+
+from librpg.util import Position
+from librpg.spatial import SpatialIndex, DepthOrder
+
+
+SEEDS = range(50)
+
+
+class Dummy(object):
+
+    """
+    Stands for a MapObject, with just a name, a position and the
+    DepthOrder layer it is drawn in.
+    """
+
+    def __init__(self, name, position, layer=DepthOrder.OBSTACLE):
+        self.name = name
+        self.position = position
+        self.layer = layer
+
+    def is_below(self):
+        return self.layer == DepthOrder.BELOW
+
+    def is_obstacle(self):
+        return self.layer == DepthOrder.OBSTACLE
+
+    def __repr__(self):
+        return '(Dummy %s at %s)' % (self.name, self.position)
+
+
+class SpatialIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.rnd = random.Random(0)
+
+    def random_position(self, width, height):
+        return Position(self.rnd.randrange(width),
+                        self.rnd.randrange(height))
+
+    def random_index(self, count):
+        rnd = self.rnd
+        width, height = rnd.randint(1, 40), rnd.randint(1, 40)
+        index = SpatialIndex(width, height, rnd.choice([1, 3, 4, 8]))
+        objects = []
+        for i in xrange(count):
+            obj = Dummy(i, self.random_position(width, height))
+            index.move(obj, None, obj.position)
+            objects.append(obj)
+        return index, objects
+
+    def shuffle(self, index, objects):
+        # Move, teleport and remove objects, then add them back
+        rnd = self.rnd
+        for obj in rnd.sample(objects, len(objects) / 2):
+            old_pos = obj.position
+            if rnd.random() < 0.5:
+                x = min(max(0, old_pos.x + rnd.randint(-1, 1)),
+                        index.width - 1)
+                y = min(max(0, old_pos.y + rnd.randint(-1, 1)),
+                        index.height - 1)
+                obj.position = Position(x, y)
+            else:
+                obj.position = self.random_position(index.width,
+                                                    index.height)
+            index.move(obj, old_pos, obj.position)
+        removed = rnd.sample(objects, len(objects) / 4)
+        for obj in removed:
+            index.move(obj, obj.position, None)
+            objects.remove(obj)
+        return removed
+
+    def random_query_position(self, index):
+        # Query around the map and on bucket edges, where the rings of
+        # nearest_object() are cut short
+        rnd = self.rnd
+        if rnd.random() < 0.5:
+            return self.random_position(index.width, index.height)
+        size = index.bucket_size
+        x = rnd.randrange(index.buckets_wide) * size + \
+            rnd.choice([0, size - 1])
+        y = rnd.randrange(index.buckets_high) * size + \
+            rnd.choice([0, size - 1])
+        return Position(min(x, index.width - 1), min(y, index.height - 1))
+
+    def check_queries(self, index, objects):
+        rnd = self.rnd
+        for i in xrange(20):
+            left = rnd.randint(-5, index.width)
+            top = rnd.randint(-5, index.height)
+            rect = (left, top, rnd.randint(1, 20), rnd.randint(1, 20))
+            expected = [obj for obj in objects
+                        if rect[0] <= obj.position.x < rect[0] + rect[2] and
+                        rect[1] <= obj.position.y < rect[1] + rect[3]]
+            self.assertEqual(sorted(index.objects_in_rect(rect)),
+                             sorted(expected), rect)
+
+            center = self.random_query_position(index)
+            radius = rnd.randint(0, 12)
+            expected = [obj for obj in objects
+                        if distance(obj, center) <= radius * radius]
+            self.assertEqual(sorted(index.objects_in_radius(center, radius)),
+                             sorted(expected), (center, radius))
+
+            self.check_nearest(index, objects, center, None, None)
+            self.check_nearest(index, objects, center, None,
+                               rnd.randint(0, 12))
+            wanted = set(rnd.sample(objects, len(objects) / 3))
+            self.check_nearest(index, objects, center, wanted.__contains__,
+                               rnd.choice([None, rnd.randint(0, 12)]))
+
+    def check_nearest(self, index, objects, center, predicate,
+                      max_distance):
+        candidates = [obj for obj in objects
+                      if predicate is None or predicate(obj)]
+        if max_distance is not None:
+            candidates = [obj for obj in candidates if distance(obj, center)
+                          <= max_distance * max_distance]
+        found = index.nearest_object(center, predicate, max_distance)
+        if not candidates:
+            self.assertEqual(found, None, (center, max_distance))
+            return
+        self.assertNotEqual(found, None, (center, max_distance))
+        self.assertTrue(found in candidates)
+        self.assertEqual(distance(found, center),
+                         min(distance(obj, center) for obj in candidates),
+                         (center, max_distance))
+
+    def test_queries(self):
+        for seed in SEEDS:
+            self.rnd.seed(seed)
+            index, objects = self.random_index(self.rnd.randint(0, 60))
+            self.check_queries(index, objects)
+
+    def test_queries_after_moves(self):
+        for seed in SEEDS:
+            self.rnd.seed(seed)
+            index, objects = self.random_index(self.rnd.randint(1, 60))
+            for step in xrange(5):
+                removed = self.shuffle(index, objects)
+                self.check_queries(index, objects)
+                for obj in removed:
+                    index.move(obj, None, obj.position)
+                    objects.append(obj)
+                self.check_queries(index, objects)
+
+    def test_nearest_across_bucket_edge(self):
+        # The object in the next bucket is closer than the one in the
+        # same bucket as the position asked for
+        index = SpatialIndex(16, 16, 4)
+        near = Dummy('near', Position(4, 1))
+        far = Dummy('far', Position(0, 3))
+        for obj in (near, far):
+            index.move(obj, None, obj.position)
+        self.assertEqual(index.nearest_object(Position(3, 0)), near)
+
+        # The closest object is two rings away, past a closer bucket
+        # with a farther object
+        index = SpatialIndex(16, 16, 4)
+        near = Dummy('near', Position(8, 0))
+        far = Dummy('far', Position(4, 7))
+        for obj in (near, far):
+            index.move(obj, None, obj.position)
+        self.assertEqual(index.nearest_object(Position(3, 0)), near)
+
+
+class DepthOrderTest(unittest.TestCase):
+
+    def setUp(self):
+        self.rnd = random.Random(0)
+        self.order = DepthOrder()
+        self.added = {}
+        self.counter = 0
+        self.width, self.height = 20, 15
+
+    def random_position(self):
+        return Position(self.rnd.randrange(self.width),
+                        self.rnd.randrange(self.height))
+
+    def add(self, obj):
+        self.order.move(obj, None, obj.position)
+        self.added[obj] = self.counter
+        self.counter += 1
+
+    def remove(self, obj):
+        self.order.move(obj, obj.position, None)
+        del self.added[obj]
+
+    def relocate(self, obj, position):
+        old_pos, obj.position = obj.position, position
+        self.order.move(obj, old_pos, position)
+
+    def check(self):
+        rnd = self.rnd
+        for i in xrange(10):
+            layer = rnd.choice([DepthOrder.BELOW, DepthOrder.OBSTACLE,
+                                DepthOrder.ABOVE])
+            rect = (rnd.randint(-3, self.width), rnd.randint(-3, self.height),
+                    rnd.randint(1, 25), rnd.randint(1, 20))
+            left, top, width, height = rect
+            expected = [obj for obj in self.added if obj.layer == layer and
+                        left <= obj.position.x < left + width and
+                        top <= obj.position.y < top + height]
+            expected.sort(key=lambda obj: (obj.position.y, obj.position.x,
+                                           self.added[obj]))
+            self.assertEqual(self.order.objects_in_rect(layer, rect),
+                             expected, (layer, rect))
+
+    def test_order_after_changes(self):
+        rnd = self.rnd
+        layers = [DepthOrder.BELOW, DepthOrder.OBSTACLE, DepthOrder.ABOVE]
+        objects = [Dummy(i, self.random_position(), rnd.choice(layers))
+                   for i in xrange(80)]
+        for obj in objects:
+            self.add(obj)
+        self.check()
+
+        for step in xrange(50):
+            obj = rnd.choice(objects)
+            action = rnd.random()
+            if obj not in self.added:
+                obj.position = self.random_position()
+                self.add(obj)
+            elif action < 0.5:
+                x = min(max(0, obj.position.x + rnd.randint(-1, 1)),
+                        self.width - 1)
+                y = min(max(0, obj.position.y + rnd.randint(-1, 1)),
+                        self.height - 1)
+                self.relocate(obj, Position(x, y))
+            elif action < 0.8:
+                self.relocate(obj, self.random_position())
+            else:
+                self.remove(obj)
+            self.check()
+
+    def test_same_cell_keeps_adding_order(self):
+        position = Position(3, 3)
+        first, second = Dummy(1, position), Dummy(2, position)
+        self.add(first)
+        self.add(second)
+        rect = (0, 0, self.width, self.height)
+        self.assertEqual(self.order.objects_in_rect(DepthOrder.OBSTACLE,
+                                                    rect), [first, second])
+
+        # Moving away and back keeps the order they were added in
+        self.relocate(first, Position(4, 3))
+        self.relocate(first, position)
+        self.assertEqual(self.order.objects_in_rect(DepthOrder.OBSTACLE,
+                                                    rect), [first, second])
+
+        # Removed objects are added again after the others
+        self.remove(first)
+        self.add(first)
+        self.assertEqual(self.order.objects_in_rect(DepthOrder.OBSTACLE,
+                                                    rect), [second, first])
+
+
+def distance(obj, center):
+    dx, dy = obj.position.x - center.x, obj.position.y - center.y
+    return dx * dx + dy * dy
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,190 @@
+import random
+import unittest
+from array import array
+
+from librpg.util import Matrix, Position
+from librpg.tile import Tile, TileMatrix
+
+
+class FakeTileset(object):
+
+    """
+    Stands for a Tileset with *size* tiles and no images.
+    """
+
+    def __init__(self, size):
+        self.tiles = [Tile(None, id) for id in xrange(size)]
+        self.image_file = 'fake.png'
+
+
+class TileMatrixTest(unittest.TestCase):
+
+    """
+    Applies the same changes to a TileMatrix and to a plain Matrix of
+    Tiles, and checks that they always hold the same tiles.
+    """
+
+    def setUp(self):
+        self.rnd = random.Random(0)
+        self.tileset = FakeTileset(20)
+        self.tiles = self.tileset.tiles
+
+    def make(self, width, height):
+        tile_matrix = TileMatrix(width, height, self.tileset)
+        matrix = Matrix(width, height)
+        matrix.populate(lambda: self.tiles[0])
+        return tile_matrix, matrix
+
+    def random_tile(self):
+        return self.rnd.choice(self.tiles)
+
+    def random_rect(self, matrix):
+        rnd = self.rnd
+        left = rnd.randrange(matrix.width)
+        top = rnd.randrange(matrix.height)
+        return (left, top, rnd.randint(1, matrix.width - left),
+                rnd.randint(1, matrix.height - top))
+
+    def ids(self, matrix, left, top, width, height):
+        # Matrix.resize() leaves None in new cells, which TileMatrix fills
+        # with tile 0
+        return [(matrix[x, y] or self.tiles[0]).id
+                for y in xrange(top, top + height)
+                for x in xrange(left, left + width)]
+
+    def check(self, tile_matrix, matrix):
+        self.assertEqual((tile_matrix.width, tile_matrix.height),
+                         (matrix.width, matrix.height))
+        self.assertEqual(list(tile_matrix.ids),
+                         self.ids(matrix, 0, 0, matrix.width, matrix.height))
+        for i in xrange(5):
+            x = self.rnd.randrange(matrix.width)
+            y = self.rnd.randrange(matrix.height)
+            self.assertEqual(tile_matrix[x, y].id,
+                             (matrix[x, y] or self.tiles[0]).id)
+            self.assertEqual(tile_matrix.get_id((x, y)),
+                             (matrix[x, y] or self.tiles[0]).id)
+
+    def test_setitem(self):
+        tile_matrix, matrix = self.make(7, 5)
+        for i in xrange(100):
+            x, y = self.rnd.randrange(7), self.rnd.randrange(5)
+            tile = self.random_tile()
+            # TileMatrices take Tiles or their ids
+            tile_matrix[x, y] = tile if i % 2 else tile.id
+            matrix[x, y] = tile
+            self.check(tile_matrix, matrix)
+
+    def test_row_and_set_row(self):
+        tile_matrix, matrix = self.make(9, 6)
+        for i in xrange(100):
+            y = self.rnd.randrange(6)
+            left = self.rnd.randrange(9)
+            right = self.rnd.randint(left, 9)
+            self.assertEqual(list(tile_matrix.row(y, left, right)),
+                             self.ids(matrix, left, y, right - left, 1))
+            self.assertEqual(list(tile_matrix.row(y)),
+                             self.ids(matrix, 0, y, 9, 1))
+
+            tiles = [self.random_tile()
+                     for x in xrange(self.rnd.randint(0, 9 - left))]
+            ids = [tile.id for tile in tiles]
+            tile_matrix.set_row(y, ids if i % 2 else array('H', ids), left)
+            for x, tile in enumerate(tiles):
+                matrix[left + x, y] = tile
+            self.check(tile_matrix, matrix)
+
+    def test_rect_and_fill(self):
+        tile_matrix, matrix = self.make(10, 8)
+        for i in xrange(50):
+            rect = self.random_rect(matrix)
+            self.assertEqual(list(tile_matrix.rect(*rect)),
+                             self.ids(matrix, *rect))
+
+            tile = self.random_tile()
+            tile_matrix.fill(tile, rect)
+            left, top, width, height = rect
+            for y in xrange(top, top + height):
+                for x in xrange(left, left + width):
+                    matrix[x, y] = tile
+            self.check(tile_matrix, matrix)
+
+        tile = self.random_tile()
+        tile_matrix.fill(tile.id)
+        matrix.populate(lambda: tile)
+        self.check(tile_matrix, matrix)
+
+    def test_where_and_count(self):
+        tile_matrix, matrix = self.make(13, 11)
+        for i in xrange(60):
+            x, y = self.rnd.randrange(13), self.rnd.randrange(11)
+            tile = self.random_tile()
+            tile_matrix[x, y] = tile
+            matrix[x, y] = tile
+        for tile in self.tiles:
+            expected = [Position(x, y) for y in xrange(11)
+                        for x in xrange(13) if matrix[x, y] is tile]
+            self.assertEqual(tile_matrix.where(tile), expected)
+            self.assertEqual(tile_matrix.count(tile.id), len(expected))
+
+    def test_where_ignores_unaligned_matches(self):
+        # The bytes of neighbouring ids also spell other ids across the
+        # two items, such as 256 and 257 here, which must not be found
+        tileset = FakeTileset(300)
+        tile_matrix = TileMatrix(3, 1, tileset)
+        tile_matrix.set_row(0, [1, 256, 1])
+        self.assertEqual(tile_matrix.where(256), [Position(1, 0)])
+        self.assertEqual(tile_matrix.where(257), [])
+        self.assertEqual(tile_matrix.where(1),
+                         [Position(0, 0), Position(2, 0)])
+
+    def test_resize(self):
+        tile_matrix, matrix = self.make(6, 6)
+        for i in xrange(30):
+            for j in xrange(10):
+                x = self.rnd.randrange(matrix.width)
+                y = self.rnd.randrange(matrix.height)
+                tile = self.random_tile()
+                tile_matrix[x, y] = tile
+                matrix[x, y] = tile
+            width = self.rnd.choice([None, self.rnd.randint(1, 12)])
+            height = self.rnd.choice([None, self.rnd.randint(1, 12)])
+            tile_matrix.resize(width, height)
+            matrix.resize(width, height)
+            self.check(tile_matrix, matrix)
+
+    def test_shared_ids_are_copied_on_change(self):
+        shared = array('H', range(12))
+        first = TileMatrix(4, 3, self.tileset)
+        second = TileMatrix(4, 3, self.tileset)
+        first.set_ids(shared, shared=True)
+        second.set_ids(shared, shared=True)
+        first[0, 0] = 7
+        second.set_row(2, [5, 5], 1)
+        self.assertEqual(list(shared), range(12))
+        self.assertEqual(first.get_id((0, 0)), 7)
+        self.assertEqual(list(second.row(2)), [8, 5, 5, 11])
+
+        # Once copied, the arrays are changed in place
+        ids = first.ids
+        first[1, 0] = 7
+        self.assertTrue(first.ids is ids)
+
+    def test_errors(self):
+        tile_matrix, matrix = self.make(4, 3)
+        for pos in [(4, 0), (0, 3), (-1, 0), (0, -1)]:
+            self.assertRaises(IndexError, tile_matrix.__getitem__, pos)
+            self.assertRaises(IndexError, tile_matrix.__setitem__, pos, 0)
+            self.assertRaises(IndexError, tile_matrix.get_id, pos)
+        self.assertRaises(IndexError, tile_matrix.__setitem__, (0, 0), 20)
+        self.assertRaises(IndexError, tile_matrix.set_row, 0, [1] * 5)
+        self.assertRaises(IndexError, tile_matrix.set_row, 0, [1, 1], 3)
+        self.assertRaises(IndexError, tile_matrix.set_row, 3, [1])
+        self.assertRaises(IndexError, tile_matrix.set_row, 0, [20])
+        self.assertRaises(IndexError, tile_matrix.set_ids, array('H', [0]))
+        self.assertRaises(IndexError, tile_matrix.fill, 20)
+        self.assertEqual(list(tile_matrix.ids), [0] * 12)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,3 @@
-from librpg.tile import Tileset
-
-ts = Tileset('test16_lower_tileset.png', 'test16_lower_tileset.bnd')
+from librpg.tile import Tileset
+
+ts = Tileset('test16_lower_tileset.png', 'test16_lower_tileset.bnd')
@@ -1,128 +1,360 @@
-import csv
-import pygame
-
-from librpg.image import TileImage, SlicedImage
-from librpg.config import graphics_config
-from librpg.locals import ANIMATION_PERIOD
-
-
-class Tile(object):
-
-    """
-    image: TileImage (read-only)
-    An TileImage containing the image for that tile.
-
-    obstacle: int (read-only)
-    0 if a party or an object can move over this tile, 3 if they can move
-    under it, 1 if it is considered an obstacle. If it is a counter - that
-    is, if push key events may affect objects on the other side of it -,
-    this attribute is set to 2.
-
-    open_directions: [bool] (read-only)
-    4-position array with boolean values indicating if the tile is
-    enterable by the given side.
-    """
-
-    BELOW, OBSTACLE, COUNTER, ABOVE = 0, 1, 2, 3
-
-    def __init__(self, image):
-        self.image = image
-        self.obstacle = -1
-        self.open_directions = [None] * 4
-
-    def cannot_be_entered(self, direction):
-        return self.open_directions[direction-1]
-
-    def is_counter(self):
-        return self.obstacle == Tile.COUNTER
-
-    def is_obstacle(self):
-        return self.obstacle == Tile.OBSTACLE or self.obstacle == Tile.COUNTER
-
-    def is_below(self):
-        return self.obstacle == Tile.BELOW
-
-    def is_above(self):
-        return self.obstacle == Tile.ABOVE
-
-    def get_surface(self, animation_phase=0):
-        return self.image.get_surface(animation_phase=animation_phase)
-
-
-class Tileset(object):
-
-    """
-    tiles: [Tile] (read-only)
-    Array of the Tiles that may be used to compose the layer.
-
-    size: int (read-only)
-    Number of tiles in the tileset.
-
-    image: Surface (read-only)
-    Surface with the whole tileset image.
-
-    image_file: string (read-only)
-    Name of the image file containing the tileset image.
-
-    boundaries_file: string (read-only)
-    Name of the .bnd file containing the attributes of each tile.
-    """
-
-    def __init__(self, image_file, boundaries_file):
-        self.image_file = image_file
-        self.load_image_file()
-
-        self.boundaries_file = boundaries_file
-        self.load_boundaries_file()
-
-    def load_image_file(self):
-        self.image = pygame.image.load(self.image_file)
-        width, height = self.image.get_width(), self.image.get_height()
-        tsize = graphics_config.tile_size
-        assert width % tsize == 0,\
-               'Tileset file width is not a multiple of %d: %s' \
-               % (graphics_config.tile_size, self.image_file)
-        assert height % tsize == 0,\
-               'Tileset file height is not a multiple of %d: %s' \
-               % (graphics_config.tile_size, self.image_file)
-
-        tile_width = width / tsize
-        tile_height = height / tsize
-        self.size = tile_width * tile_height
-
-        self.tiles = []
-        sliced_image = SlicedImage(self.image, tsize, tsize)
-        for i in xrange(self.size):
-            ssur = sliced_image.get_slice(i)
-            self.tiles.append(Tile(TileImage([ssur])))
-
-    def load_boundaries_file(self):
-        f = file(self.boundaries_file, "r")
-        r = csv.reader(f, delimiter=',')
-
-        y = 0
-        for line in r:
-            if line:
-                normalize_type = line[0].lower()
-                if normalize_type == 'normal' and y < self.size:
-                    self.process_normal_bnd_line(y, line)
-                    y += 1
-                elif normalize_type == 'animated':
-                    self.process_animated_bnd_line(line)
-        f.close()
-
-    def process_normal_bnd_line(self, y, line):
-        assert y == int(line[1]),\
-               'Entry %d in .bnd file should have id %d' % (int(line[1]), y)
-        tile = self.tiles[y]
-        tile.obstacle = int(line[2])
-        for x, dir in zip(range(3, 7), range(0, 4)):
-            tile.open_directions[dir] = int(line[x])
-
-    def process_animated_bnd_line(self, line):
-        ids = [int(id) for id in line[1:]]
-        assert ANIMATION_PERIOD % len(ids) == 0,\
-               'The number of animated tiles must divide %d' % ANIMATION_PERIOD
-        new_image = TileImage([self.tiles[i].get_surface() for i in ids])
-        for id in ids:
-            self.tiles[id].image = new_image
+import csv
+from array import array
+
+from librpg.image import TileImage, SlicedImage, load_image
+from librpg.util import Matrix, Position
+from librpg.loader import (TimestampedFileLoader, TemporalCache,
+                           resource_memory)
+from librpg.config import graphics_config
+from librpg.locals import ANIMATION_PERIOD
+
+
+class Tile(object):
+
+    """
+    image: TileImage (read-only)
+    An TileImage containing the image for that tile.
+
+    obstacle: int (read-only)
+    0 if a party or an object can move over this tile, 3 if they can move
+    under it, 1 if it is considered an obstacle. If it is a counter - that
+    is, if push key events may affect objects on the other side of it -,
+    this attribute is set to 2.
+
+    open_directions: [bool] (read-only)
+    4-position array with boolean values indicating if the tile is
+    enterable by the given side.
+
+    id: int (read-only)
+    Index of the tile in its Tileset.
+    """
+
+    BELOW, OBSTACLE, COUNTER, ABOVE = 0, 1, 2, 3
+
+    def __init__(self, image, id=None):
+        self.image = image
+        self.id = id
+        self.obstacle = -1
+        self.open_directions = [None] * 4
+
+    def cannot_be_entered(self, direction):
+        return self.open_directions[direction-1]
+
+    def is_counter(self):
+        return self.obstacle == Tile.COUNTER
+
+    def is_obstacle(self):
+        return self.obstacle == Tile.OBSTACLE or self.obstacle == Tile.COUNTER
+
+    def is_below(self):
+        return self.obstacle == Tile.BELOW
+
+    def is_above(self):
+        return self.obstacle == Tile.ABOVE
+
+    def is_animated(self):
+        return self.image.phases > 1
+
+    def get_surface(self, animation_phase=0):
+        return self.image.get_surface(animation_phase=animation_phase)
+
+
+class Tileset(object):
+
+    """
+    tiles: [Tile] (read-only)
+    Array of the Tiles that may be used to compose the layer.
+
+    size: int (read-only)
+    Number of tiles in the tileset.
+
+    image: Surface (read-only)
+    Surface with the whole tileset image.
+
+    image_file: string (read-only)
+    Name of the image file containing the tileset image.
+
+    boundaries_file: string (read-only)
+    Name of the .bnd file containing the attributes of each tile.
+    """
+
+    def __init__(self, image_file, boundaries_file):
+        self.image_file = image_file
+        self.load_image_file()
+
+        self.boundaries_file = boundaries_file
+        self.load_boundaries_file()
+
+    def load_image_file(self):
+        self.image = load_image(self.image_file)
+        width, height = self.image.get_width(), self.image.get_height()
+        tsize = graphics_config.tile_size
+        assert width % tsize == 0,\
+               'Tileset file width is not a multiple of %d: %s' \
+               % (graphics_config.tile_size, self.image_file)
+        assert height % tsize == 0,\
+               'Tileset file height is not a multiple of %d: %s' \
+               % (graphics_config.tile_size, self.image_file)
+
+        tile_width = width / tsize
+        tile_height = height / tsize
+        self.size = tile_width * tile_height
+
+        self.tiles = []
+        sliced_image = SlicedImage(self.image, tsize, tsize)
+        for i in xrange(self.size):
+            ssur = sliced_image.get_slice(i)
+            self.tiles.append(Tile(TileImage([ssur]), i))
+
+    def get_memory(self):
+        """
+        Return an estimate of how many bytes the tileset takes, for the
+        Caches keeping it.
+        """
+        return resource_memory(self.image)
+
+    def load_boundaries_file(self):
+        f = file(self.boundaries_file, "r")
+        r = csv.reader(f, delimiter=',')
+
+        y = 0
+        for line in r:
+            if line:
+                normalize_type = line[0].lower()
+                if normalize_type == 'normal' and y < self.size:
+                    self.process_normal_bnd_line(y, line)
+                    y += 1
+                elif normalize_type == 'animated':
+                    self.process_animated_bnd_line(line)
+        f.close()
+
+    def process_normal_bnd_line(self, y, line):
+        assert y == int(line[1]),\
+               'Entry %d in .bnd file should have id %d' % (int(line[1]), y)
+        tile = self.tiles[y]
+        tile.obstacle = int(line[2])
+        for x, dir in zip(range(3, 7), range(0, 4)):
+            tile.open_directions[dir] = int(line[x])
+
+    def process_animated_bnd_line(self, line):
+        ids = [int(id) for id in line[1:]]
+        assert ANIMATION_PERIOD % len(ids) == 0,\
+               'The number of animated tiles must divide %d' % ANIMATION_PERIOD
+        new_image = TileImage([self.tiles[i].get_surface() for i in ids])
+        for id in ids:
+            self.tiles[id].image = new_image
+
+
+class TilesetLoader(TimestampedFileLoader):
+
+    """
+    Loads Tilesets given (image filename, boundaries filename) tuples,
+    keeping the *capacity* most recently used ones, up to *memory_budget*
+    bytes, so that maps sharing a tileset do not load and slice its image
+    again.
+    """
+
+    def __init__(self, capacity=16, memory_budget=32 * 1024 * 1024):
+        TimestampedFileLoader.__init__(self, [TemporalCache(capacity,
+                                                            memory_budget)])
+
+    def load_files(self, image_file, boundaries_file):
+        return Tileset(image_file, boundaries_file)
+
+tileset_loader = TilesetLoader()
+
+
+def load_tileset(image_file, boundaries_file):
+    """
+    Return the Tileset with *image_file* and *boundaries_file*, shared
+    with the other maps using it unless the files changed.
+    """
+    return tileset_loader.load((image_file, boundaries_file))
+
+
+class TileMatrix(Matrix):
+
+    """
+    A TileMatrix is a Matrix of Tiles from *tileset* that stores their
+    ids in a flat array instead of the Tiles themselves. Indexing it works
+    like a Matrix, returning Tiles and accepting Tiles or ids, but
+    operations on whole rows, rectangles or the whole layer work on the
+    ids array and run in C.
+
+    All cells initially hold the tile whose id is *fill*.
+
+    :attr:`tileset`
+        Tileset the tiles come from.
+
+    :attr:`ids`
+        array('H') with the id of the tile in each cell, row by row, so
+        that the cell at (x, y) is at index y * width + x. It may be
+        shared with other TileMatrices, see set_ids(), so it should only
+        be read directly.
+    """
+
+    def __init__(self, width, height, tileset, fill=0):
+        self.tileset = tileset
+        self.tiles = tileset.tiles
+        self.width = width
+        self.height = height
+        self.ids = array('H', [fill]) * (width * height)
+        self.shared = False
+
+    def __repr__(self):
+        return '(TileMatrix %s x %s)' % (self.width, self.height)
+
+    def __getitem__(self, pos):
+        x, y = pos
+        if x < 0 or x >= self.width or y < 0 or y >= self.height:
+            raise IndexError('%s was indexed with x=%s y=%s'
+                             % (repr(self), x, y))
+        return self.tiles[self.ids[y * self.width + x]]
+
+    def __setitem__(self, pos, value):
+        """
+        Set the tile at *pos* == (x, y) to *value*, a Tile of the
+        tileset or its id.
+        """
+        x, y = pos
+        if x < 0 or x >= self.width or y < 0 or y >= self.height:
+            raise IndexError('%s was indexed with x=%s y=%s'
+                             % (repr(self), x, y))
+        id = self.__id(value)
+        self.__own()
+        self.ids[y * self.width + x] = id
+
+    def __id(self, value):
+        if isinstance(value, Tile):
+            value = value.id
+        if value < 0 or value >= len(self.tiles):
+            raise IndexError('%s is not a tile id of %s'
+                             % (value, self.tileset.image_file))
+        return value
+
+    def __own(self):
+        # Copy shared ids before they are first changed
+        if self.shared:
+            self.ids = array('H', self.ids)
+            self.shared = False
+
+    def get_id(self, pos):
+        """
+        Return the id of the tile at *pos* == (x, y).
+        """
+        x, y = pos
+        if not self.valid(pos):
+            raise IndexError('%s was indexed with x=%s y=%s'
+                             % (repr(self), x, y))
+        return self.ids[y * self.width + x]
+
+    def row(self, y, left=0, right=None):
+        """
+        Return an array with the ids of the tiles in row *y*, from column
+        *left* to before column *right*, or to the end if it is None.
+        """
+        if right is None:
+            right = self.width
+        start = y * self.width
+        return self.ids[start + left:start + right]
+
+    def set_row(self, y, ids, left=0):
+        """
+        Set the ids of the tiles in row *y*, starting at column *left*,
+        to the ones in *ids*, an array('H') or a sequence of ints.
+        """
+        if not isinstance(ids, array):
+            ids = array('H', ids)
+        if left < 0 or left + len(ids) > self.width or \
+           y < 0 or y >= self.height:
+            raise IndexError('%s row %s cannot hold %s ids from x=%s'
+                             % (repr(self), y, len(ids), left))
+        if ids and max(ids) >= len(self.tiles):
+            raise IndexError('%s is not a tile id of %s'
+                             % (max(ids), self.tileset.image_file))
+        start = y * self.width + left
+        self.__own()
+        self.ids[start:start + len(ids)] = ids
+
+    def set_ids(self, ids, shared=False):
+        """
+        Replace all the ids by those in *ids*, an array('H') laid out like
+        :attr:`ids`, which is used without being copied.
+
+        If *shared* is True, *ids* is also used elsewhere, as the layers
+        cached by mapfile.load_map_file(), and it is only copied when the
+        TileMatrix is first changed.
+        """
+        if len(ids) != self.width * self.height:
+            raise IndexError('%s cannot hold %s ids'
+                             % (repr(self), len(ids)))
+        if ids and max(ids) >= len(self.tiles):
+            raise IndexError('%s is not a tile id of %s'
+                             % (max(ids), self.tileset.image_file))
+        self.ids = ids
+        self.shared = shared
+
+    def rect(self, left, top, width, height):
+        """
+        Return an array with the ids of the tiles in the rectangle at
+        (*left*, *top*) with the given size, row by row.
+        """
+        result = array('H')
+        for y in xrange(top, top + height):
+            result.extend(self.row(y, left, left + width))
+        return result
+
+    def fill(self, value, rect=None):
+        """
+        Set all tiles, or those in *rect* == (left, top, width, height)
+        if it is given, to *value*, a Tile or a tile id.
+        """
+        id = self.__id(value)
+        if rect is None:
+            self.ids = array('H', [id]) * (self.width * self.height)
+            self.shared = False
+            return
+        left, top, width, height = rect
+        line = array('H', [id]) * width
+        for y in xrange(top, top + height):
+            self.set_row(y, line, left)
+
+    def count(self, value):
+        """
+        Return the number of cells holding *value*, a Tile or a tile id.
+        """
+        return self.ids.count(self.__id(value))
+
+    def where(self, value):
+        """
+        Return a list with the Positions of the cells holding *value*, a
+        Tile or a tile id.
+        """
+        # Search the raw bytes, keeping only matches aligned to an item
+        needle = array('H', [self.__id(value)]).tostring()
+        haystack = self.ids.tostring()
+        size = self.ids.itemsize
+        width = self.width
+        result = []
+        find = haystack.find
+        offset = find(needle)
+        while offset >= 0:
+            if offset % size:
+                offset = find(needle, offset + 1)
+                continue
+            index = offset / size
+            result.append(Position(index % width, index / width))
+            offset = find(needle, offset + size)
+        return result
+
+    def resize(self, width=None, height=None):
+        new_width = self.width if (width is None) else width
+        new_height = self.height if (height is None) else height
+        ids = array('H', [0]) * (new_width * new_height)
+        copy_width = min(self.width, new_width)
+        for y in xrange(min(self.height, new_height)):
+            ids[y * new_width:y * new_width + copy_width] = \
+                self.row(y, 0, copy_width)
+        self.ids = ids
+        self.shared = False
+        self.width, self.height = new_width, new_height
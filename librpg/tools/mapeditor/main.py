@@ -1,6 +1,6 @@
-
-import engine
-
-if __name__ == "__main__":
-    e = engine.Engine()
-    e.run()
+
+import engine
+
+if __name__ == "__main__":
+    e = engine.Engine()
+    e.run()
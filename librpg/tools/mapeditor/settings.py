@@ -1,14 +1,14 @@
-
-import pygame
-from pygame.locals import *
-
-resW = 640
-resH = 480
-#resDepth = 32
-#displayFlags = pygame.FULLSCREEN|pygame.DOUBLEBUF|pygame.HWSURFACE
-
-displayFlags = 0
-resDepth = 0
-
-TileSets = {}
-Maps = {}
+
+import pygame
+from pygame.locals import *
+
+resW = 640
+resH = 480
+#resDepth = 32
+#displayFlags = pygame.FULLSCREEN|pygame.DOUBLEBUF|pygame.HWSURFACE
+
+displayFlags = 0
+resDepth = 0
+
+TileSets = {}
+Maps = {}
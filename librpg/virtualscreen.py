@@ -1,74 +1,292 @@
-"""
-The :mod:`virtualscreen` module wraps the pygame display into a screen
-that can be blitted to the same way, but scales everything blitted
-onto it to the scale configured in graphic_config.
-"""
-
-import pygame
-
-
-class ScaledScreen(pygame.Surface):
-    """
-    The ScaledScreen is a replacement for the Pygame display surface.
-    It has the blit() and flip() methods, behaving like the display,
-    except it scales whatever is blitted to it to the number configured
-    thought *graphics_config*.
-
-    The singleton ScaledScreen may be obtained by calling the
-    *librpg.virtualscreen.get_screen()* function. The result will be a
-    handle to it, which can be blitted on.
-
-    This is especially important to implement the draw() methods of
-    Contexts that display objects on the screen.
-    """
-
-    def __init__(self, width_and_height, real_screen, scale=1, flags=0,
-                 depth=0):
-        pygame.Surface.__init__(self, width_and_height, flags, depth)
-        self.real_screen = real_screen
-        real_width = int(width_and_height[0] * scale)
-        real_height = int(width_and_height[1] * scale)
-        self.real_width_and_height = (real_width, real_height)
-
-    def flip(self):
-        """
-        Flips the ScaledScreen. This flips the Pygame display.
-        """
-        pygame.transform.scale(self, self.real_width_and_height,
-                               self.real_screen)
-        pygame.display.flip()
-
-
-class VirtualScreen(object):
-
-    def __init__(self):
-        self.real_screen = None
-        self.screen = None
-
-    def init_real_screen(self, real_screen_dimensions, display_mode):
-        self.real_screen = pygame.display.set_mode(real_screen_dimensions,
-                                                   display_mode)
-
-    def init_virtual_screen(self, screen_dimensions, scale):
-        self.screen = ScaledScreen(screen_dimensions, self.real_screen, scale,
-                                   depth=32)
-
-    def create_screen(self, real_screen_dimensions, display_mode,
-                      screen_dimensions, scale):
-        self.init_real_screen(real_screen_dimensions, display_mode)
-        self.init_virtual_screen(screen_dimensions, scale)
-
-screen_container = VirtualScreen()
-
-
-def init(real_screen_dimensions, display_mode, screen_dimensions, scale):
-    screen_container.create_screen(real_screen_dimensions, display_mode,
-                                   screen_dimensions, scale)
-
-
-def get_screen():
-    """
-    Returns the singleton ScaledScreen, a Surface that works as a screen,
-    except it is scaled as configured in *graphics_config*.
-    """
-    return screen_container.screen
+"""
+The :mod:`virtualscreen` module wraps the pygame display into a screen
+that can be blitted to the same way, but scales everything blitted
+onto it to the scale configured in graphic_config.
+"""
+
+import threading
+from collections import OrderedDict
+
+import pygame
+
+from librpg.loader import resource_memory
+
+
+class ScaledScreen(pygame.Surface):
+    """
+    The ScaledScreen is a replacement for the Pygame display surface.
+    It has the blit() and flip() methods, behaving like the display,
+    except it scales whatever is blitted to it to the number configured
+    thought *graphics_config*.
+
+    The singleton ScaledScreen may be obtained by calling the
+    *librpg.virtualscreen.get_screen()* function. The result will be a
+    handle to it, which can be blitted on.
+
+    This is especially important to implement the draw() methods of
+    Contexts that display objects on the screen.
+
+    The ScaledScreen has the same pixel format as the display, so that
+    flipping it is a plain copy when *scale* is 1 and needs no format
+    conversion otherwise. Other scales, integer ones included, go
+    through pygame.transform.scale() straight into the display; there
+    is no faster path for them. If *scale2x* is True and *scale* is 2,
+    the screen is enlarged with pygame's scale2x filter instead, which
+    changes the image. To avoid scaling the whole screen every frame,
+    use a PrescaledScreen.
+    """
+
+    def __init__(self, width_and_height, real_screen, scale=1, flags=0,
+                 depth=0, scale2x=False):
+        if depth == 0 and real_screen is not None:
+            pygame.Surface.__init__(self, width_and_height, flags,
+                                    real_screen)
+        else:
+            pygame.Surface.__init__(self, width_and_height, flags, depth)
+        self.real_screen = real_screen
+        self.scale = scale
+        real_width = int(width_and_height[0] * scale)
+        real_height = int(width_and_height[1] * scale)
+        self.real_width_and_height = (real_width, real_height)
+        self.scale2x = scale2x and scale == 2
+
+    def flip(self, rects=None):
+        """
+        Flips the ScaledScreen. This flips the Pygame display.
+
+        If *rects* is passed, only those regions of the ScaledScreen are
+        scaled and updated on the display.
+        """
+        if rects is None:
+            self.scale_into(self, self.real_screen)
+            pygame.display.flip()
+            return
+
+        bounds = self.get_rect()
+        real_rects = []
+        for rect in rects:
+            rect = bounds.clip(rect)
+            if not rect.width or not rect.height:
+                continue
+            real_rect = self.scale_rect(rect)
+            self.scale_into(self.subsurface(rect),
+                            self.real_screen.subsurface(real_rect))
+            real_rects.append(real_rect)
+        pygame.display.update(real_rects)
+
+    def scale_into(self, source, target):
+        """
+        Enlarge *source*, a region of the ScaledScreen, into *target*, the
+        corresponding region of the display.
+        """
+        if self.scale == 1:
+            target.blit(source, (0, 0))
+        elif self.scale2x:
+            pygame.transform.scale2x(source, target)
+        else:
+            # The same nearest neighbour scaling for every scale, only
+            # saved from allocating a new surface
+            pygame.transform.scale(source, target.get_size(), target)
+
+    def scale_rect(self, rect):
+        """
+        Return the pygame Rect of the display that *rect*, a region of
+        the ScaledScreen, is scaled to.
+        """
+        rect = pygame.Rect(rect)
+        scale = self.scale
+        left, top = int(rect.left * scale), int(rect.top * scale)
+        return pygame.Rect(left, top, int(rect.right * scale) - left,
+                           int(rect.bottom * scale) - top)
+
+
+class PrescaledScreen(ScaledScreen):
+    """
+    A PrescaledScreen is a ScaledScreen that is as large as the display
+    and draws everything at the display's resolution. Instead of scaling
+    the whole screen every frame, it scales each Surface blitted onto it
+    the first time it is blitted, and keeps the result for the next
+    times. Positions and rects passed to its methods are in unscaled
+    pixels, like for the ScaledScreen.
+
+    Surfaces that are changed after being blitted should be passed to
+    invalidate(), so that they are scaled again, and Surfaces that will
+    not be blitted anymore may be passed to it to free their scaled copy.
+    At most *cache_size* scaled Surfaces, taking at most *memory_budget*
+    bytes, are kept, discarding the least recently used ones.
+
+    invalidate() may be called by any thread.
+    """
+
+    def __init__(self, width_and_height, real_screen, scale=1, flags=0,
+                 depth=0, cache_size=1024, memory_budget=64 * 1024 * 1024):
+        real_width = int(width_and_height[0] * scale)
+        real_height = int(width_and_height[1] * scale)
+        ScaledScreen.__init__(self, (real_width, real_height), real_screen,
+                              1, flags, depth)
+        self.scale = scale
+        self.cache_size = cache_size
+        self.memory_budget = memory_budget
+        self.memory = 0
+        self.prescaled_surfaces = OrderedDict()
+        self.lock = threading.RLock()
+
+    def prescale(self, surface):
+        """
+        Return *surface* scaled to the display resolution, scaling it only
+        if it was not scaled before.
+        """
+        with self.lock:
+            cache = self.prescaled_surfaces
+            scaled = cache.pop(surface, None)
+            if scaled is None:
+                width, height = surface.get_size()
+                scaled = pygame.transform.scale(surface,
+                                                (int(width * self.scale),
+                                                 int(height * self.scale)))
+                self.memory += resource_memory(scaled)
+            cache[surface] = scaled
+            while len(cache) > 1 and \
+                  (len(cache) > self.cache_size or
+                   self.memory > self.memory_budget):
+                _, old = cache.popitem(last=False)
+                self.memory -= resource_memory(old)
+            return scaled
+
+    def invalidate(self, surface, rect=None):
+        """
+        Discard the scaled copy of *surface*, so that it is scaled again
+        the next time it is blitted.
+
+        If *rect* is passed, only that region of *surface* changed, and
+        it is scaled at once into the scaled copy, which is kept.
+        """
+        with self.lock:
+            if rect is not None:
+                scaled = self.prescaled_surfaces.get(surface)
+                if scaled is not None:
+                    rect = pygame.Rect(rect)
+                    real_rect = self.scale_rect(rect)
+                    pygame.transform.scale(surface.subsurface(rect),
+                                           real_rect.size,
+                                           scaled.subsurface(real_rect))
+                return
+            scaled = self.prescaled_surfaces.pop(surface, None)
+            if scaled is not None:
+                self.memory -= resource_memory(scaled)
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        dest = (int(dest[0] * self.scale), int(dest[1] * self.scale))
+        if area is not None:
+            area = self.scale_rect(area)
+        return pygame.Surface.blit(self, self.prescale(source), dest, area,
+                                   special_flags)
+
+    def blits(self, sequence, doreturn=1):
+        scale = self.scale
+        scaled = []
+        for item in sequence:
+            item = list(item)
+            item[0] = self.prescale(item[0])
+            item[1] = (int(item[1][0] * scale), int(item[1][1] * scale))
+            if len(item) > 2 and item[2] is not None:
+                item[2] = self.scale_rect(item[2])
+            scaled.append(tuple(item))
+        if hasattr(pygame.Surface, 'blits'):
+            return pygame.Surface.blits(self, scaled, doreturn)
+        result = [pygame.Surface.blit(self, *item) for item in scaled]
+        if doreturn:
+            return result
+
+    def fill(self, color, rect=None, special_flags=0):
+        if rect is not None:
+            rect = self.scale_rect(rect)
+        return pygame.Surface.fill(self, color, rect, special_flags)
+
+    def set_clip(self, rect=None):
+        if rect is not None:
+            rect = self.scale_rect(rect)
+        pygame.Surface.set_clip(self, rect)
+
+    def flip(self, rects=None):
+        """
+        Flips the PrescaledScreen, copying it to the display without
+        scaling, since it is already at the display's resolution.
+        """
+        if rects is None:
+            self.real_screen.blit(self, (0, 0))
+            pygame.display.flip()
+            return
+
+        real_rects = [self.scale_rect(rect) for rect in rects]
+        for real_rect in real_rects:
+            self.real_screen.blit(self, real_rect, real_rect)
+        pygame.display.update(real_rects)
+
+
+class VirtualScreen(object):
+
+    def __init__(self):
+        self.real_screen = None
+        self.screen = None
+
+    def init_real_screen(self, real_screen_dimensions, display_mode):
+        self.real_screen = pygame.display.set_mode(real_screen_dimensions,
+                                                   display_mode)
+
+    def init_virtual_screen(self, screen_dimensions, scale, prescale=False,
+                            scale2x=False):
+        if prescale:
+            self.screen = PrescaledScreen(screen_dimensions, self.real_screen,
+                                          scale)
+        else:
+            self.screen = ScaledScreen(screen_dimensions, self.real_screen,
+                                       scale, scale2x=scale2x)
+
+    def create_screen(self, real_screen_dimensions, display_mode,
+                      screen_dimensions, scale, prescale=False,
+                      scale2x=False):
+        self.init_real_screen(real_screen_dimensions, display_mode)
+        self.init_virtual_screen(screen_dimensions, scale, prescale, scale2x)
+
+screen_container = VirtualScreen()
+
+
+def init(real_screen_dimensions, display_mode, screen_dimensions, scale,
+         prescale=False, scale2x=False):
+    screen_container.create_screen(real_screen_dimensions, display_mode,
+                                   screen_dimensions, scale, prescale,
+                                   scale2x)
+
+
+def get_screen():
+    """
+    Returns the singleton ScaledScreen, a Surface that works as a screen,
+    except it is scaled as configured in *graphics_config*.
+    """
+    return screen_container.screen
+
+
+def prescale(surface):
+    """
+    Have *surface* scaled to the display resolution ahead of time if the
+    screen is a PrescaledScreen, so that it is not scaled while the game
+    is running.
+    """
+    screen = screen_container.screen
+    if isinstance(screen, PrescaledScreen):
+        screen.prescale(surface)
+
+
+def invalidate(surface, rect=None):
+    """
+    Have *surface* scaled again the next time it is blitted, if the screen
+    is a PrescaledScreen. Call it after changing a Surface that was already
+    blitted onto the screen.
+
+    If only the *rect* region of *surface* changed, pass it to have just
+    that region scaled again, right away.
+    """
+    screen = screen_container.screen
+    if isinstance(screen, PrescaledScreen):
+        screen.invalidate(surface, rect)